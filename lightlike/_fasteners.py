@@ -1,7 +1,9 @@
 import functools
 import logging
 import pathlib
+import threading
 import typing as t
+from time import perf_counter_ns
 
 from fasteners import InterProcessLock, InterProcessReaderWriterLock
 
@@ -9,6 +11,7 @@ from fasteners import InterProcessLock, InterProcessReaderWriterLock
 # to pass to InterProcessLocks. Types added to quiet mypy.
 
 __all__: t.Sequence[str] = (
+    "ReentrantInterProcessLock",
     "interprocess_locked",
     "interprocess_read_locked",
     "interprocess_write_locked",
@@ -66,3 +69,44 @@ def interprocess_write_locked(
         return wrapper
 
     return decorator
+
+
+class ReentrantInterProcessLock:
+    """
+    InterProcessLock that can be re-acquired by the thread already holding it.
+
+    File locks are held per process, so threads in the same process
+    are serialized with an RLock before the file lock is taken.
+    Total time spent waiting to acquire is kept in `wait_ns`.
+    """
+
+    def __init__(
+        self, path: pathlib.Path | str, logger: logging.Logger | None = None
+    ) -> None:
+        self.path = path
+        self.wait_ns: int = 0
+        self._lock = InterProcessLock(path, logger=logger)
+        self._rlock = threading.RLock()
+        self._depth: int = 0
+
+    def acquire(self) -> bool:
+        start: int = perf_counter_ns()
+        self._rlock.acquire()
+        if self._depth == 0:
+            self._lock.acquire()
+        self._depth += 1
+        self.wait_ns += perf_counter_ns() - start
+        return True
+
+    def release(self) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            self._lock.release()
+        self._rlock.release()
+
+    def __enter__(self) -> t.Self:
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc: t.Any) -> None:
+        self.release()
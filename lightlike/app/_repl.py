@@ -1,20 +1,23 @@
 import os
 import sys
 import typing as t
+from contextlib import nullcontext
 from subprocess import list2cmdline, run
 
 import click
-from apscheduler.schedulers.background import BackgroundScheduler
 from prompt_toolkit import PromptSession
 from prompt_toolkit.application import get_app
 from rich import print as rprint
 
+from lightlike.internal import profile
+
 if sys.platform.startswith("win"):
     import win32console
 else:
     import termios
 
 if t.TYPE_CHECKING:
+    from apscheduler.schedulers.background import BackgroundScheduler
     from prompt_toolkit.buffer import Buffer
     from prompt_toolkit.completion import Completer
 
@@ -38,8 +41,10 @@ def repl(
     shell_cmd_callable: t.Callable[[], str] | None = None,
     pass_unknown_commands_to_shell: bool = True,
     uncaught_exceptions_callable: ExceptionCallable = None,
-    scheduler: BackgroundScheduler | t.Callable[[], BackgroundScheduler] | None = None,
+    scheduler: "BackgroundScheduler | t.Callable[[], BackgroundScheduler] | None" = None,
     default_jobs_callable: t.Callable[[], None] | None = None,
+    session_callable: t.Callable[[PromptSession[str]], None] | None = None,
+    invoke_lock: t.ContextManager[t.Any] | None = None,
     # fmt:on
 ) -> None:
     """
@@ -54,6 +59,8 @@ def repl(
     :param default_jobs_callable: A callable that creates or replaces jobs in the scheduler.\
                                             Jobs will need to have a static id and replace_existing=True\
                                             otherwise a new job will be added each time.
+    :param session_callable: A callable that takes the prompt_toolkit.PromptSession once it's created.
+    :param invoke_lock: Held while a command runs, for commands that can also run from other threads.
     """
     cmd_is_group: bool = isinstance(ctx.command, click.Group)
     if ctx.parent and not cmd_is_group:
@@ -65,16 +72,20 @@ def repl(
         completer=completer_callable(ctx_command, ctx, uncaught_exceptions_callable)
     )
 
-    session: PromptSession[str] = PromptSession(**prompt_kwargs)
+    with profile.phase("build prompt session"):
+        session: PromptSession[str] = PromptSession(**prompt_kwargs)
+        if session_callable and callable(session_callable):
+            session_callable(session)
 
     if scheduler:
-        scheduler().start()
-        if default_jobs_callable and callable(default_jobs_callable):
-            try:
-                default_jobs_callable()
-            except AttributeError as error:
-                if "'NoneType' object has no attribute 'items'" not in f"{error}":
-                    raise error
+        with profile.phase("start scheduler"):
+            scheduler().start()
+            if default_jobs_callable and callable(default_jobs_callable):
+                try:
+                    default_jobs_callable()
+                except AttributeError as error:
+                    if "'NoneType' object has no attribute 'items'" not in f"{error}":
+                        raise error
 
     try:
         while 1:
@@ -89,7 +100,8 @@ def repl(
 
             try:
                 ctx.protected_args = args
-                ctx_command.invoke(ctx)
+                with invoke_lock or nullcontext():
+                    ctx_command.invoke(ctx)
             except click.UsageError as error1:
                 if _is_unknown_command(error1) and pass_unknown_commands_to_shell:
                     try:
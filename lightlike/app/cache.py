@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import os
 import re
 import typing as t
 from contextlib import contextmanager
+from copy import deepcopy
 from datetime import datetime, timedelta
 from decimal import Decimal
 from functools import cached_property, reduce
 from operator import xor
 from pathlib import Path
+from threading import Lock
 
 import click
 import rtoml
@@ -23,7 +26,6 @@ from lightlike import _fasteners
 from lightlike.__about__ import __appname_sc__
 from lightlike.app import _get, dates, render
 from lightlike.app.config import AppConfig
-from lightlike.client import CliQueryRoutines
 from lightlike.internal import appdir, factory, markup, utils
 
 if t.TYPE_CHECKING:
@@ -34,6 +36,8 @@ if t.TYPE_CHECKING:
     from rich.console import Console, ConsoleOptions, RenderResult
 
 __all__: t.Sequence[str] = (
+    "load_snapshot",
+    "snapshot_version",
     "TimeEntryCache",
     "TimeEntryIdList",
     "TimeEntryAppData",
@@ -43,6 +47,51 @@ __all__: t.Sequence[str] = (
 T = t.TypeVar("T")
 
 
+# Writes to the cache files replace the file with an atomic rename, so every write
+# produces a new inode. (inode, mtime_ns, size) identifies a committed version, and
+# readers can reuse the last parsed snapshot until the version on disk changes.
+# Readers never take a lock. Only read-modify-write transactions in `TimeEntryCache.rw`
+# take the exclusive interprocess lock.
+SnapshotVersion: t.TypeAlias = tuple[int, int, int]
+
+_SNAPSHOTS: dict[Path, tuple[SnapshotVersion, dict[str, t.Any]]] = {}
+_SNAPSHOTS_LOCK: Lock = Lock()
+_TRANSACTION_LOCKS: dict[Path, _fasteners.ReentrantInterProcessLock] = {}
+
+
+def snapshot_version(path: Path) -> SnapshotVersion:
+    stat: os.stat_result = path.stat()
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def load_snapshot(path: Path) -> tuple[SnapshotVersion, dict[str, t.Any]]:
+    version: SnapshotVersion = snapshot_version(path)
+    with _SNAPSHOTS_LOCK:
+        snapshot = _SNAPSHOTS.get(path)
+        if snapshot is None or snapshot[0] != version:
+            snapshot = (version, rtoml.load(path))
+            _SNAPSHOTS[path] = snapshot
+        return version, deepcopy(snapshot[1])
+
+
+def commit_snapshot(path: Path, text: str) -> tuple[SnapshotVersion, dict[str, t.Any]]:
+    utils.atomic_write_text(path, text)
+    entries: dict[str, t.Any] = rtoml.loads(text)
+    version: SnapshotVersion = snapshot_version(path)
+    with _SNAPSHOTS_LOCK:
+        _SNAPSHOTS[path] = (version, entries)
+    return version, deepcopy(entries)
+
+
+def transaction_lock(path: Path) -> _fasteners.ReentrantInterProcessLock:
+    with _SNAPSHOTS_LOCK:
+        if path not in _TRANSACTION_LOCKS:
+            _TRANSACTION_LOCKS[path] = _fasteners.ReentrantInterProcessLock(
+                path, logger=appdir.log()
+            )
+        return _TRANSACTION_LOCKS[path]
+
+
 class _Entries:
     def __init__(self) -> None:
         self._entries: dict[str, t.Any] = {}
@@ -181,6 +230,9 @@ class _Entries:
 
 
 class EntriesInMemory(_Entries, metaclass=factory._Singleton):
+    # Incremented on every update, so views of the cache can tell when to rebuild.
+    generation: int = 0
+
     def __init__(self) -> None:
         self._entries
 
@@ -190,15 +242,18 @@ class EntriesInMemory(_Entries, metaclass=factory._Singleton):
 
     def update(self, _entries: dict[str, t.Any]) -> None:
         self.__dict__["_entries"] = _entries
+        self.generation += 1
 
 
 class TimeEntryCache(_Entries):
-    __slots__: t.Sequence[str] = ("_entries", "_path")
+    __slots__: t.Sequence[str] = ("_entries", "_path", "_lock", "_version")
 
-    @_fasteners.interprocess_read_locked(appdir.CACHE_LOCK, logger=appdir.log())
-    def __init__(self, path: Path = appdir.CACHE) -> None:
+    def __init__(
+        self, path: Path = appdir.CACHE, lock: Path = appdir.CACHE_LOCK
+    ) -> None:
         self._path = path
-        self._entries = rtoml.load(self._path)
+        self._lock = transaction_lock(lock)
+        self._version, self._entries = load_snapshot(self._path)
         EntriesInMemory().update(self._entries)
 
     def __rich_console__(
@@ -280,15 +335,20 @@ class TimeEntryCache(_Entries):
     ) -> Measurement:
         return Measurement(140, options.max_width)
 
-    @_fasteners.interprocess_locked(appdir.CACHE_LOCK, logger=appdir.log())
     @contextmanager
     def rw(self) -> t.Generator[TimeEntryCache, t.Any, None]:
-        try:
-            yield self
-        finally:
-            self._path.write_text(self._serialize, encoding="utf-8")
-            self._entries = rtoml.load(self._path)
-            EntriesInMemory().update(self._entries)
+        with self._lock:
+            # Another process or thread committed since this instance was read,
+            # apply changes on top of the latest version instead of overwriting it.
+            if snapshot_version(self._path) != self._version:
+                self._version, self._entries = load_snapshot(self._path)
+            try:
+                yield self
+            finally:
+                self._version, self._entries = commit_snapshot(
+                    self._path, self._serialize
+                )
+                EntriesInMemory().update(self._entries)
 
     @property
     def _serialize(self) -> str:
@@ -315,6 +375,7 @@ class TimeEntryCache(_Entries):
     ) -> None:
         if idx := self.index(self.running_entries, "id", [entry_id]):
             with self.rw():
+                idx = self.index(self.running_entries, "id", [entry_id])
                 self.running_entries.insert(0, self.running_entries.pop(one(idx)))
             if not continue_:
                 self.pause_entry(one(idx), now)
@@ -416,12 +477,22 @@ class TimeEntryCache(_Entries):
         if not entries:
             entries = [self.running_entries, self.paused_entries]
 
-        for entry_list in entries:
-            idxs: t.Iterable[int] = self.index(entry_list, key, sequence)
-            if not idxs:
-                continue
-            with self.rw():
-                for idx in idxs:
+        # Lists are looked up again inside the transaction,
+        # in case a newer version of the cache is loaded when it starts.
+        groups: list[str] = [
+            group
+            for group in ("running", "paused")
+            if any(self._entries[group]["entries"] is e for e in entries)
+            and self.index(self._entries[group]["entries"], key, sequence)
+        ]
+        if not groups:
+            return
+
+        with self.rw():
+            for group in groups:
+                entry_list: list[dict[str, t.Any]] = self._entries[group]["entries"]
+                idxs: t.Iterable[int] = self.index(entry_list, key, sequence)
+                for idx in sorted(idxs, reverse=True):
                     entry_list.pop(idx)
 
     def _add_hours(
@@ -496,6 +567,8 @@ class TimeEntryCache(_Entries):
             self._reset()
 
     def sync(self, debug: bool = False) -> None:
+        from lightlike.client import CliQueryRoutines
+
         routine = CliQueryRoutines()
         running_entries_to_cache = routine._select(
             resource=routine.timesheet_id,
@@ -638,6 +711,8 @@ class TimeEntryIdList(metaclass=factory._Singleton):
 
     @cached_property
     def ids(self) -> list[str]:
+        from lightlike.client import CliQueryRoutines
+
         routine = CliQueryRoutines()
         query_job = routine._select(
             resource=routine.timesheet_id,
@@ -721,6 +796,8 @@ class TimeEntryAppData:
             "[DEBUG]", "starting app data sync"
         )
 
+        from lightlike.client import CliQueryRoutines
+
         routine = CliQueryRoutines()
         projects_query = routine._select(
             resource=CliQueryRoutines().projects_id,
@@ -778,7 +855,7 @@ class TimeEntryAppData:
             return appdata
 
         reduce(_map_notes, projects, appdata)
-        self.path.write_text(rtoml.dumps(appdata, pretty=True), encoding="utf-8")
+        utils.atomic_write_text(self.path, rtoml.dumps(appdata, pretty=True))
 
         debug and patch_stdout(raw=True)(console.log)(
             "[DEBUG]", "entry appdata sync complete"
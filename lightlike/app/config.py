@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import os
 import typing as t
 from contextlib import contextmanager
+from copy import deepcopy
 from functools import wraps
 from hashlib import sha3_256, sha256
 from pathlib import Path
@@ -25,8 +27,17 @@ _Hash = type(sha256(b"_Hash"))
 T = t.TypeVar("T")
 P = t.ParamSpec("P")
 
+# (st_mtime_ns, st_size) of the config file when it was parsed.
+ConfigVersion = tuple[int, int]
+
 
 class AppConfig(metaclass=factory._Singleton):
+    """
+    The parsed config file is kept in memory and parsed again only when the file's
+    mtime or size changes, or after `rw()` writes it. Derived values such as the
+    timezone are memoized for the same version of the file.
+    """
+
     _rw_lock: ReaderWriterLock = ReaderWriterLock()
 
     @staticmethod
@@ -42,6 +53,8 @@ class AppConfig(metaclass=factory._Singleton):
 
     def __init__(self, path: Path = __config__) -> None:
         self.path = path
+        self._parsed: tuple[ConfigVersion, dict[str, t.Any]] | None = None
+        self._derived: dict[str, t.Any] = {}
         self.config: dict[str, t.Any] = self.load
 
     def __setitem__(self, __key: str, __val: t.Any) -> None:
@@ -62,11 +75,37 @@ class AppConfig(metaclass=factory._Singleton):
                     utils.format_toml(self.config),
                     encoding="utf-8",
                 )
+                self._parsed = None
 
     @property
     def load(self) -> dict[str, t.Any]:
+        # A copy, callers such as rw() modify it.
+        return deepcopy(self._current())
+
+    def _current(self) -> dict[str, t.Any]:
+        try:
+            stat: os.stat_result = os.stat(self.path)
+            version: ConfigVersion = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            version = (-1, -1)
+
+        parsed = self._parsed
+        if parsed is not None and parsed[0] == version:
+            return parsed[1]
+
+        # Stat before reading, a write in between is picked up on the next call.
         with self._rw_lock.read_lock():
-            return rtoml.load(self.path)
+            config: dict[str, t.Any] = rtoml.load(self.path)
+        self._derived = {}
+        self._parsed = (version, config)
+        return config
+
+    def _memoize(self, key: str, fn: t.Callable[[], T]) -> T:
+        self._current()
+        derived: dict[str, t.Any] = self._derived
+        if key not in derived:
+            derived[key] = fn()
+        return t.cast(T, derived[key])
 
     @t.overload
     def get(self, *keys: str, default: t.Literal[None] = None) -> t.Any | None: ...
@@ -80,7 +119,9 @@ class AppConfig(metaclass=factory._Singleton):
     def get(
         self, *keys: str, default: T | dict[str, t.Any] | None = None
     ) -> t.Any | T | dict[str, t.Any] | None:
-        return utils.reduce_keys(*keys, sequence=self.load, default=default)
+        value = utils.reduce_keys(*keys, sequence=self._current(), default=default)
+        # Don't hand out the cached containers, callers may modify what they get.
+        return deepcopy(value) if isinstance(value, (dict, list)) else value
 
     @property
     def saved_password(self) -> str | None:
@@ -95,14 +136,22 @@ class AppConfig(metaclass=factory._Singleton):
         stay_logged_in: bool | None = self.get("user", "stay-logged-in")
         return stay_logged_in
 
+    @property
+    def session_key_ttl(self) -> int:
+        session_key_ttl: int = self.get("user", "session-key-ttl", default=0)
+        return session_key_ttl
+
     @property
     def tzname(self) -> str:
+        return self._memoize("tzname", self._tzname)
+
+    def _tzname(self) -> str:
         default_tzinfo: str = utils.get_local_timezone_string(default="UTC")
         return self.get("settings", "timezone", default=default_tzinfo)
 
     @property
     def tzinfo(self) -> "_TzInfo":
-        return timezone(self.tzname)
+        return self._memoize("tzinfo", lambda: timezone(self.tzname))
 
     def _update_user_credentials(
         self,
@@ -24,6 +24,7 @@ from rich.table import Table
 from rich.text import Text
 
 from lightlike._console import CONSOLE_CONFIG, GROUP_COMMANDS
+from lightlike.app.manifest import MANIFEST, ManifestEntry, entry_from_command
 from lightlike.internal.constant import _CONSOLE_SVG_FORMAT
 
 __all__: t.Sequence[str] = (
@@ -163,6 +164,7 @@ class LazyAliasedGroup(AliasedGroup):
         super().__init__(*args, **kwargs)
         #   {command-name} -> {module-name}:{command-object-name}
         self.lazy_subcommands = lazy_subcommands or {}
+        self._loaded_subcommands: dict[str, click.Command] = {}
 
     def list_commands(self, ctx: click.Context) -> list[str]:
         base: list[str] = super().list_commands(ctx)
@@ -172,23 +174,55 @@ class LazyAliasedGroup(AliasedGroup):
     def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
         if cmd_name in self.lazy_subcommands:
             return self._lazy_load(cmd_name)
+        if (rv := click.Group.get_command(self, ctx, cmd_name)) is not None:
+            return rv
         matches: list[str] = [
             m for m in self.list_commands(ctx) if m.startswith(cmd_name)
         ]
         if not matches:
             return None
         elif len(matches) == 1 and (match := first(matches)) in self.lazy_subcommands:
-            command = self._lazy_load(match)
-            if (
-                getattr(command, "allow_name_alias", None) is False
-                and cmd_name != match
-            ):
+            entry: ManifestEntry | None = self.describe(ctx, match)
+            if not entry or not entry["allow_name_alias"]:
+                return None
+            return self._lazy_load(match)
+        elif any(m in self.lazy_subcommands for m in matches):
+            # Filter by the manifest, so only the command that's resolved gets imported.
+            aliases: list[str] = []
+            for m in matches:
+                entry = self.describe(ctx, m)
+                if entry and not entry["hidden"] and entry["allow_name_alias"]:
+                    aliases.append(m)
+            if not aliases:
                 return None
-            return command
+            elif len(aliases) == 1:
+                alias: str = first(aliases)
+                if alias in self.lazy_subcommands:
+                    return self._lazy_load(alias)
+                return click.Group.get_command(self, ctx, alias)
+            else:
+                ctx.fail(f"Too many matches: {', '.join(sorted(aliases))}")
         else:
             return super().get_command(ctx, cmd_name)
 
+    def describe(self, ctx: click.Context, cmd_name: str) -> ManifestEntry | None:
+        """Manifest entry for a command. Lazy commands load only if theirs is stale."""
+        if cmd_name not in self.lazy_subcommands:
+            command: click.Command | None = click.Group.get_command(self, ctx, cmd_name)
+            return entry_from_command(command) if command else None
+        if (loaded := self._loaded_subcommands.get(cmd_name)) is not None:
+            return entry_from_command(loaded)
+
+        import_path: str = self.lazy_subcommands[cmd_name]
+        if (entry := MANIFEST.get(import_path)) is None:
+            if (lazy_command := self._lazy_load(cmd_name)) is None:
+                return None
+            entry = MANIFEST.update(import_path, lazy_command)
+        return entry
+
     def _lazy_load(self, cmd_name: str) -> click.Command | None:
+        if (loaded := self._loaded_subcommands.get(cmd_name)) is not None:
+            return loaded
         try:
             # lazily loading a command, first get the module name and attribute name
             import_path: str = self.lazy_subcommands[cmd_name]
@@ -204,6 +238,7 @@ class LazyAliasedGroup(AliasedGroup):
                     f"Lazy loading of {import_path} failed by returning "
                     "a non-command object"
                 )
+            self._loaded_subcommands[cmd_name] = cmd_object
             return cmd_object
         except Exception as e:
             self.lazy_subcommands.pop(cmd_name, None)
@@ -384,13 +419,17 @@ def _group_commands(
 
     commands = obj.list_commands(ctx)
     for command in commands:
-        cmd = obj.get_command(ctx, command)
-        if cmd:
-            if cmd.hidden:
+        entry: ManifestEntry | None
+        if isinstance(obj, LazyAliasedGroup):
+            entry = obj.describe(ctx, command)
+        else:
+            cmd = obj.get_command(ctx, command)
+            entry = entry_from_command(cmd) if cmd else None
+        if entry:
+            if entry["hidden"]:
                 continue
             else:
-                help_text = cmd.short_help or cmd.help or ""
-                table.add_row(command, "", ReplHighlighter()(help_text))
+                table.add_row(command, "", ReplHighlighter()(entry["short_help"]))
 
     if table.row_count != 0:
         yield rich.console.NewLine()
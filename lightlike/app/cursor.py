@@ -1,15 +1,14 @@
 import getpass
 import socket
+import threading
 import typing as t
 from datetime import datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
 
-import rtoml
 from prompt_toolkit.formatted_text import fragment_list_width
 from rich import get_console
 
-from lightlike.__about__ import __appdir__
 from lightlike.app.cache import EntriesInMemory
 from lightlike.app.config import AppConfig
 from lightlike.app.dates import now, seconds_to_time_parts
@@ -23,7 +22,14 @@ if t.TYPE_CHECKING:
     NotImplementedOrNone = object
 
 
-__all__: t.Sequence[str] = ("build", "bottom_toolbar", "rprompt")
+__all__: t.Sequence[str] = (
+    "build",
+    "bottom_toolbar",
+    "chdir",
+    "GitHeadWatcher",
+    "refresh_resolution",
+    "rprompt",
+)
 
 
 OneStyleAndTextTuple = t.Union[
@@ -44,66 +50,158 @@ RPROMPT_DATE_FORMAT: str = AppConfig().get(
     "settings", "rprompt-date-format", default="[%H:%M:%S]"
 )
 
-GIT_INFO_PATH: t.Final[Path] = __appdir__ / ".gitinfo"
-
-if not GIT_INFO_PATH.exists():
-    rtoml.dump({"branch": "", "path": ""}, GIT_INFO_PATH)
-
-GIT_INFO: dict[str, str] = rtoml.load(GIT_INFO_PATH)
-
-BRANCH: str | None = GIT_INFO.get("branch")
-PATH: str | None = GIT_INFO.get("path")
-
-
-def build(message: str | None = None) -> t.Callable[[], StyleAndTextTuples]:
-    if not message:
+CWD: Path = Path.cwd()
+BRANCH: str = ""
+
+# ((cwd, gcp project, branch), fragments) - the part of the prompt before the timer.
+_STATIC_FRAGMENTS: tuple[tuple[Path, str | None, str], StyleAndTextTuples] | None = None
+_WINDOW_TITLE: str | None = None
+# ((cache generation, console width, active completers), toolbar).
+_TOOLBAR: (
+    tuple[tuple[int, int, tuple[t.Any, ...]], t.Callable[..., StyleAndTextTuples]]
+    | None
+) = None
+
+
+class GitHeadWatcher:
+    """
+    Tracks the branch of the git repository containing the current directory.
+
+    Runs in a daemon thread that stats HEAD every `interval` seconds, and immediately
+    after the working directory changes. Rendering the prompt only reads BRANCH.
+    """
+
+    def __init__(self, interval: float = 2.0) -> None:
+        self.interval = interval
+        self.head: Path | None = None
+        self._mtime_ns: int | None = None
+        self._retarget: threading.Event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._retarget.set()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def retarget(self) -> None:
+        self._retarget.set()
+
+    def _run(self) -> None:
+        while 1:
+            try:
+                if self._retarget.is_set():
+                    self._retarget.clear()
+                    self.head = _find_git_head(CWD)
+                    self._mtime_ns = None
+                self._check()
+            except Exception:
+                pass
+            self._retarget.wait(self.interval)
+
+    def _check(self) -> None:
+        global BRANCH
+        if self.head is None:
+            BRANCH = ""
+            return
+        try:
+            mtime_ns: int = self.head.stat().st_mtime_ns
+        except OSError:
+            self.head, BRANCH = None, ""
+            return
+        if mtime_ns != self._mtime_ns:
+            self._mtime_ns = mtime_ns
+            head: str = _first_line(self.head.read_text())
+            BRANCH = head.partition("refs/heads/")[2]
+
+
+def _first_line(text: str) -> str:
+    return next(iter(text.splitlines()), "")
+
+
+def _find_git_head(cwd: Path) -> Path | None:
+    for directory in (cwd, *cwd.parents):
+        dot_git: Path = directory / ".git"
+        if dot_git.is_dir():
+            return dot_git / "HEAD"
+        if dot_git.is_file():
+            # Worktrees and submodules, .git contains "gitdir: <path>".
+            gitdir: str = _first_line(dot_git.read_text()).partition("gitdir:")[2]
+            return (directory / gitdir.strip()).resolve() / "HEAD"
+    return None
+
+
+GIT_HEAD_WATCHER: GitHeadWatcher = GitHeadWatcher()
+
+
+def chdir(path: Path | None = None) -> None:
+    """Update the prompt after the working directory changed."""
+    global CWD
+    CWD = path or Path.cwd()
+    GIT_HEAD_WATCHER.retarget()
+
+
+def _static_fragments() -> StyleAndTextTuples:
+    global _STATIC_FRAGMENTS
+    key = (CWD, GCP_PROJECT, BRANCH)
+    if _STATIC_FRAGMENTS is None or _STATIC_FRAGMENTS[0] != key:
         cursor: StyleAndTextTuples = []
-        cwd: Path = Path.cwd()
-
-        _extend_base(cursor, cwd)
+        _extend_base(cursor, CWD)
         GCP_PROJECT and _extend_active_project(cursor, GCP_PROJECT)
-        _extend_git_branch(cursor, cwd)
-
-        if cache := EntriesInMemory():
-            timer: str = _timer(cache)
-
-            if UPDATE_TERMINAL_TITLE:
-                get_console().set_window_title(f"{timer} | {cache.project}")
+        _extend_git_branch(cursor, BRANCH)
+        _STATIC_FRAGMENTS = (key, cursor)
+    return _STATIC_FRAGMENTS[1]
 
-            _extend_timer(cursor, timer)
 
-        _extend_cursor_pointer(cursor)
+def build(message: str | None = None) -> t.Callable[[], StyleAndTextTuples]:
+    GIT_HEAD_WATCHER.start()
 
+    if not message:
+        cursor: StyleAndTextTuples = _build_cursor()
         return lambda: cursor
 
     def build_with_message(message: str | None = message) -> StyleAndTextTuples:
-        cursor: StyleAndTextTuples = []
-        cwd: Path = Path.cwd()
+        return _build_cursor(message or "")
 
-        _extend_base(cursor, cwd)
-        GCP_PROJECT and _extend_active_project(cursor, GCP_PROJECT)
-        _extend_git_branch(cursor, cwd)
+    return build_with_message
 
-        if cache := EntriesInMemory():
-            timer: str = _timer(cache)
 
-            if UPDATE_TERMINAL_TITLE:
-                get_console().set_window_title(f"{timer} | {cache.project}")
+def _build_cursor(message: str = "") -> StyleAndTextTuples:
+    # Only the timer changes between refreshes, the rest is cached.
+    cursor: StyleAndTextTuples = _static_fragments().copy()
 
-            _extend_timer(cursor, timer)
+    if cache := EntriesInMemory():
+        timer: str = _timer(cache)
 
-        _extend_cursor_pointer(cursor, message or "")
+        if UPDATE_TERMINAL_TITLE:
+            _set_window_title(f"{timer} | {cache.project}")
 
-        return cursor
+        _extend_timer(cursor, timer)
+
+    _extend_cursor_pointer(cursor, message)
+    return cursor
 
-    return build_with_message
+
+def _set_window_title(title: str) -> None:
+    global _WINDOW_TITLE
+    if title != _WINDOW_TITLE:
+        _WINDOW_TITLE = title
+        get_console().set_window_title(title)
 
 
 def bottom_toolbar() -> t.Callable[..., StyleAndTextTuples]:
+    global _TOOLBAR
     cache = EntriesInMemory()
     columns: int = get_console().width
-    toolbar: StyleAndTextTuples = []
+    key = (cache.generation, columns, tuple(global_completers()))
+    if _TOOLBAR is None or _TOOLBAR[0] != key:
+        toolbar: StyleAndTextTuples = _build_toolbar(cache, columns)
+        _TOOLBAR = (key, lambda: toolbar)
+    return _TOOLBAR[1]
+
 
+def _build_toolbar(cache: EntriesInMemory, columns: int) -> StyleAndTextTuples:
+    toolbar: StyleAndTextTuples = []
     display_active: str = ""
     if cache:
         display_active = f"A[{cache.id[:8]}:{cache.project}"
@@ -150,7 +248,7 @@ def bottom_toolbar() -> t.Callable[..., StyleAndTextTuples]:
     )
     toolbar.insert(0, blank_line)
 
-    return lambda: toolbar
+    return toolbar
 
 
 def rprompt() -> t.Callable[..., StyleAndTextTuples]:
@@ -159,26 +257,33 @@ def rprompt() -> t.Callable[..., StyleAndTextTuples]:
     return lambda: [("", "\n"), ("class:rprompt.clock", timestamp)]
 
 
-def _extend_git_branch(cursor: StyleAndTextTuples, cwd: Path) -> None:
-    global BRANCH, PATH, GIT_INFO
-    if BRANCH and PATH:
-        if not cwd.is_relative_to(PATH):
-            PATH, BRANCH = "", ""
-            GIT_INFO["branch"] = ""
-            GIT_INFO["path"] = ""
-            rtoml.dump(GIT_INFO, GIT_INFO_PATH)
-    else:
-        if (head_dir := cwd / ".git" / "HEAD").exists():
-            PATH = head_dir.parent.parent.resolve().as_posix()
-            BRANCH = head_dir.read_text().splitlines()[0].partition("refs/heads/")[2]
-            GIT_INFO["branch"] = BRANCH
-            GIT_INFO["path"] = PATH
-            rtoml.dump(GIT_INFO, GIT_INFO_PATH)
-
-    BRANCH and cursor.extend(
+_SECOND_DIRECTIVES: t.Final[tuple[str, ...]] = (
+    "%S",
+    "%T",
+    "%X",
+    "%c",
+    "%r",
+    "%s",
+    "%f",
+)
+
+
+def refresh_resolution() -> float | None:
+    """Finest unit of time shown by the prompt, in seconds."""
+    if EntriesInMemory():
+        return 1
+    if any(d in RPROMPT_DATE_FORMAT for d in _SECOND_DIRECTIVES):
+        return 1
+    if RPROMPT_DATE_FORMAT:
+        return 60
+    return None
+
+
+def _extend_git_branch(cursor: StyleAndTextTuples, branch: str) -> None:
+    branch and cursor.extend(
         [
             ("class:prompt.branch.parenthesis", "("),
-            ("class:prompt.branch.name", BRANCH),
+            ("class:prompt.branch.name", branch),
             ("class:prompt.branch.parenthesis", ") "),
         ]
     )
@@ -0,0 +1,318 @@
+import atexit
+import io
+import json
+import os
+import shutil
+import socket
+import struct
+import sys
+import threading
+import typing as t
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from pathlib import Path
+
+from lightlike.__about__ import __appdir__
+
+if t.TYPE_CHECKING:
+    import click
+
+__all__: t.Sequence[str] = (
+    "DaemonServer",
+    "enable_headless",
+    "EXECUTION_LOCK",
+    "FLAG",
+    "forward",
+    "headless",
+    "listening",
+    "serving",
+    "SOCKET_PATH",
+    "supported",
+)
+
+
+# Run without a REPL, serving commands until interrupted.
+FLAG: t.Final[str] = "--daemon"
+SOCKET_PATH: t.Final[Path] = __appdir__ / "daemon.sock"
+# Commands from the REPL and from clients share the process and the console,
+# so they run one at a time.
+EXECUTION_LOCK: threading.RLock = threading.RLock()
+CONNECT_TIMEOUT: t.Final[float] = 0.05
+REQUEST_TIMEOUT: t.Final[float] = 5.0
+
+_HEADLESS: bool = False
+_local: threading.local = threading.local()
+
+
+def supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def headless() -> bool:
+    return _HEADLESS
+
+
+def enable_headless() -> None:
+    global _HEADLESS
+    _HEADLESS = True
+
+
+def serving() -> bool:
+    """Whether the current thread is running a forwarded command."""
+    return getattr(_local, "serving", False)
+
+
+def forward(argv: list[str], path: Path = SOCKET_PATH) -> int | None:
+    """
+    Run a command in the daemon, streaming its output to this terminal.
+
+    Returns the command's exit code, or None if no daemon is listening.
+    """
+    if not supported() or not path.exists():
+        return None
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.settimeout(CONNECT_TIMEOUT)
+        client.connect(f"{path}")
+    except OSError:
+        client.close()
+        return None
+
+    size: os.terminal_size = shutil.get_terminal_size()
+    request: dict[str, t.Any] = {
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "width": size.columns,
+        "height": size.lines,
+        "isatty": sys.stdout.isatty(),
+    }
+
+    with client:
+        client.settimeout(None)
+        try:
+            client.sendall(json.dumps(request).encode() + b"\n")
+            for line in client.makefile("rb"):
+                message: dict[str, t.Any] = json.loads(line)
+                if "out" in message:
+                    sys.stdout.write(message["out"])
+                    sys.stdout.flush()
+                elif "err" in message:
+                    sys.stderr.write(message["err"])
+                    sys.stderr.flush()
+                elif "exit" in message:
+                    return int(message["exit"])
+        except KeyboardInterrupt:
+            return 130
+        except (OSError, ValueError):
+            pass
+    # The daemon closed the connection before the command finished.
+    return 1
+
+
+class _SocketWriter(io.TextIOBase):
+    """Text stream sending each write to the client as a json line."""
+
+    def __init__(
+        self,
+        connection: socket.socket,
+        key: str,
+        isatty: bool,
+        lock: threading.Lock,
+    ) -> None:
+        self.connection = connection
+        self.key = key
+        self._isatty = isatty
+        self._lock = lock
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self._isatty
+
+    def write(self, s: str) -> int:
+        if not isinstance(s, str):
+            # click checks whether a stream is binary by writing b"" to it.
+            raise TypeError(f"write() argument must be str, not {type(s).__name__}")
+        if s:
+            _send(self.connection, self._lock, {self.key: s})
+        return len(s)
+
+
+def _send(
+    connection: socket.socket, lock: threading.Lock, message: dict[str, t.Any]
+) -> None:
+    with lock:
+        try:
+            connection.sendall(json.dumps(message).encode() + b"\n")
+        except OSError:
+            # Client went away, the command still runs to completion.
+            pass
+
+
+class DaemonServer:
+    """
+    Runs commands forwarded by `forward` in this process, from a daemon thread.
+
+    Commands reuse the authorized client, caches and scheduler of this process.
+    Output is streamed back to the client. Commands can't prompt for input,
+    stdin is empty while they run, and commands that only make sense
+    in the REPL, such as exit, fail.
+
+    The client's streams, working directory and terminal size are set
+    process-wide while a command runs. Output from background jobs goes to the
+    client, and completers or the toolbar of an open REPL see the client's
+    directory and width until the command finishes.
+
+    Only the user running this process can connect. The socket is created with
+    mode 0600, and peers with a different uid are rejected where the platform
+    reports it.
+    """
+
+    def __init__(
+        self, cli: "click.Group", prog_name: str, path: Path = SOCKET_PATH
+    ) -> None:
+        self.cli = cli
+        self.prog_name = prog_name
+        self.path = path
+        self._socket: socket.socket | None = None
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> bool:
+        """Listen in a daemon thread. False if unsupported or already listening."""
+        if not self._bind():
+            return False
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return True
+
+    def serve_forever(self) -> None:
+        if self._socket is None and not self._bind():
+            return
+        server = t.cast(socket.socket, self._socket)
+        while 1:
+            try:
+                connection, _ = server.accept()
+            except OSError:
+                # Closed.
+                return
+            with connection:
+                try:
+                    self._handle(connection)
+                except Exception as error:
+                    from lightlike.internal import appdir
+
+                    appdir.log().error(f"Daemon failed to handle request: {error}")
+
+    def close(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+            self.path.unlink(missing_ok=True)
+
+    def _bind(self) -> bool:
+        if not supported() or listening(self.path):
+            return False
+        self.path.unlink(missing_ok=True)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Create the socket as 0600, chmod after binding leaves it open until then.
+        umask: int = os.umask(0o177)
+        try:
+            server.bind(f"{self.path}")
+        finally:
+            os.umask(umask)
+        server.listen()
+        self._socket = server
+        atexit.register(self.close)
+        return True
+
+    def _handle(self, connection: socket.socket) -> None:
+        uid: int | None = _peer_uid(connection)
+        if uid is not None and uid != os.getuid():
+            raise PermissionError(f"Rejected connection from uid {uid}.")
+
+        connection.settimeout(REQUEST_TIMEOUT)
+        with connection.makefile("rb") as stream:
+            request: dict[str, t.Any] = json.loads(stream.readline())
+        connection.settimeout(None)
+
+        lock = threading.Lock()
+        stdout = _SocketWriter(connection, "out", request.get("isatty", False), lock)
+        stderr = _SocketWriter(connection, "err", request.get("isatty", False), lock)
+
+        with EXECUTION_LOCK, _client_context(request, stdout, stderr):
+            exit_code: int = self._invoke(request["argv"], stderr)
+
+        _send(connection, lock, {"exit": exit_code})
+
+    def _invoke(self, argv: list[str], stderr: io.TextIOBase) -> int:
+        from lightlike.app._repl import ExitRepl
+
+        _local.serving = True
+        try:
+            self.cli.main(args=argv, prog_name=self.prog_name, standalone_mode=True)
+        except SystemExit as exit:
+            if exit.code is None or isinstance(exit.code, int):
+                return exit.code or 0
+            stderr.write(f"{exit.code}\n")
+            return 1
+        except ExitRepl:
+            stderr.write("Command is only available in the REPL.\n")
+            return 2
+        except Exception as error:
+            stderr.write(f"{type(error).__name__}: {error}\n")
+            return 1
+        finally:
+            _local.serving = False
+        return 0
+
+
+def _peer_uid(connection: socket.socket) -> int | None:
+    # Linux only, elsewhere connecting already requires write access to the socket.
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    credentials: bytes = connection.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+    )
+    _, uid, _ = struct.unpack("3i", credentials)
+    return int(uid)
+
+
+def listening(path: Path = SOCKET_PATH) -> bool:
+    """Whether a daemon is listening on `path`."""
+    if not supported() or not path.exists():
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(CONNECT_TIMEOUT)
+        try:
+            client.connect(f"{path}")
+            return True
+        except OSError:
+            return False
+
+
+@contextmanager
+def _client_context(
+    request: dict[str, t.Any], stdout: io.TextIOBase, stderr: io.TextIOBase
+) -> t.Iterator[None]:
+    # Run as if in the client's terminal: its directory, size and output streams.
+    from rich import get_console
+
+    console = get_console()
+    size: tuple[int | None, int | None] = console._width, console._height
+    color_system = console._color_system
+    stdin: t.TextIO = sys.stdin
+    cwd: str = os.getcwd()
+    try:
+        os.chdir(request.get("cwd") or cwd)
+        console.size = (request.get("width", 80), request.get("height", 25))
+        if not request.get("isatty", False):
+            console._color_system = None
+        sys.stdin = io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            yield
+    finally:
+        sys.stdin = stdin
+        console._width, console._height = size
+        console._color_system = color_system
+        os.chdir(cwd)
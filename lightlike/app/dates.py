@@ -1,24 +1,29 @@
+import re
 import typing as t
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from decimal import Decimal
+from functools import cache, lru_cache
 from math import copysign
 
 import click
-import dateparser
-import pytz
-from rich.text import Text
 
-from lightlike.app.config import AppConfig
+from lightlike.internal.lazy import lazy_import
 
 if t.TYPE_CHECKING:
     from datetime import _TzInfo
 
+    import dateparser
+    import pytz
     from dateparser import _Settings
+else:
+    dateparser = lazy_import("dateparser")
+    pytz = lazy_import("pytz")
 
 
 __all__: t.Sequence[str] = (
     "now",
+    "parser_settings",
     "astimezone",
     "parse_date",
     "parse_date_range_flags",
@@ -53,45 +58,101 @@ def now(tzinfo: "_TzInfo | None" = None) -> datetime:
     return astimezone(datetime.now(), tzinfo)
 
 
-with AppConfig().rw() as config:
-    dateparser_settings: dict[str, t.Any] = config.get(
-        "settings", "dateparser", default={}
+class ParserSettings(t.NamedTuple):
+    dateparser: dict[str, t.Any]
+    date_formats: list[str]
+    # The fast path only handles forms these settings don't change the meaning of.
+    fast_path: bool
+
+
+@cache
+def parser_settings() -> ParserSettings:
+    """Read from the config on the first parse, then kept for the session."""
+    from lightlike.app.config import AppConfig
+
+    config: dict[str, t.Any] = AppConfig().get("settings", "dateparser", default={})
+    settings: dict[str, t.Any] = {
+        # fmt: off
+        "CACHE_SIZE_LIMIT": config.get("cache-size-limit"),
+        "LANGUAGE_DETECTION_CONFIDENCE_THRESHOLD": config.get(
+            "language-detection-confidence-threshold"
+        ),
+        "NORMALIZE": config.get("normalize"),
+        "STRICT_PARSING": config.get("strict-parsing"),
+        "PREFER_MONTH_OF_YEAR": config.get("prefer-month-of-year"),
+        "PREFER_DAY_OF_MONTH": config.get("prefer-day-of-month"),
+        "PREFER_DATES_FROM": config.get("prefer-dates-from"),
+        "DATE_ORDER": config.get("date-order"),
+        "PREFER_LOCALE_DATE_ORDER": config.get("prefer-locale-date-order"),
+        "DEFAULT_LANGUAGES": config.get("default-languages"),
+        "REQUIRE_PARTS": [],
+        "RETURN_TIME_AS_PERIOD": False,
+        "SKIP_TOKENS": ["t"],
+        "RETURN_AS_TIMEZONE_AWARE": True,
+        "PARSERS": [
+            "timestamp",
+            "negative-timestamp",
+            "relative-time",
+            "custom-formats",
+            "absolute-time",
+        ],
+        # fmt: on
+    }
+    return ParserSettings(
+        dateparser=settings,
+        date_formats=config.get(
+            "additional-date-formats",
+            ["%I%p", "%I:%M%p", "%I%M%p", "%H%M", "%H%M%S", "%H:%M", "%H:%M:%S"],
+        ),
+        fast_path=(
+            settings["PREFER_DATES_FROM"] == "current_period"
+            and settings["PREFER_MONTH_OF_YEAR"] == "current"
+            and settings["PREFER_DAY_OF_MONTH"] == "current"
+            and not settings["STRICT_PARSING"]
+            and "en" in (settings["DEFAULT_LANGUAGES"] or ["en"])
+        ),
     )
 
-DEFAULT_PARSER_SETTINGS: dict[str, t.Any] = {
-    # fmt: off
-    "CACHE_SIZE_LIMIT": dateparser_settings.get("cache-size-limit"),
-    "LANGUAGE_DETECTION_CONFIDENCE_THRESHOLD": dateparser_settings.get(
-        "language-detection-confidence-threshold"
-    ),
-    "NORMALIZE": dateparser_settings.get("normalize"),
-    "STRICT_PARSING": dateparser_settings.get("strict-parsing"),
-    "PREFER_MONTH_OF_YEAR": dateparser_settings.get("prefer-month-of-year"),
-    "PREFER_DAY_OF_MONTH": dateparser_settings.get("prefer-day-of-month"),
-    "PREFER_DATES_FROM": dateparser_settings.get("prefer-dates-from"),
-    "DATE_ORDER": dateparser_settings.get("date-order"),
-    "PREFER_LOCALE_DATE_ORDER": dateparser_settings.get("prefer-locale-date-order"),
-    "DEFAULT_LANGUAGES": dateparser_settings.get("default-languages"),
-    "REQUIRE_PARTS": [],
-    "RETURN_TIME_AS_PERIOD": False,
-    "SKIP_TOKENS": ["t"],
-    "RETURN_AS_TIMEZONE_AWARE": True,
-    "PARSERS": [
-        "timestamp",
-        "negative-timestamp",
-        "relative-time",
-        "custom-formats",
-        "absolute-time",
-    ],
-    # fmt: on
-}
 
-ADDITIONAL_DATE_FORMATS: list[str] = dateparser_settings.get(
-    "additional-date-formats",
-    ["%I%p", "%I:%M%p", "%I%M%p", "%H%M", "%H%M%S", "%H:%M", "%H:%M:%S"],
+_MONTHS: t.Final[dict[str, int]] = {
+    name: month
+    for month, names in enumerate(
+        (
+            ("jan", "january"),
+            ("feb", "february"),
+            ("mar", "march"),
+            ("apr", "april"),
+            ("may",),
+            ("jun", "june"),
+            ("jul", "july"),
+            ("aug", "august"),
+            ("sep", "sept", "september"),
+            ("oct", "october"),
+            ("nov", "november"),
+            ("dec", "december"),
+        ),
+        start=1,
+    )
+    for name in names
+}
+_UNITS: t.Final[dict[str, str]] = {
+    "s": "seconds",
+    "m": "minutes",
+    "h": "hours",
+    "d": "days",
+    "w": "weeks",
+}
+_RELATIVE: t.Final[re.Pattern[str]] = re.compile(r"([+-]?)(\d+)([smhdw])")
+_CLOCK: t.Final[re.Pattern[str]] = re.compile(r"(\d{1,2}):(\d{2})(?::(\d{2}))?")
+_MERIDIEM: t.Final[re.Pattern[str]] = re.compile(r"(\d{1,2})(:?)(\d{2})?(am|pm)")
+_DIGITS: t.Final[re.Pattern[str]] = re.compile(r"(\d{2})(\d{2})(\d{2})?")
+_MONTH_DAY: t.Final[re.Pattern[str]] = re.compile(r"([a-z]+) ?(\d{1,2})")
+_ISO: t.Final[re.Pattern[str]] = re.compile(
+    r"\d{4}-\d{2}-\d{2}(?:[ t]\d{2}:\d{2}(?::\d{2})?)?"
 )
-
-del dateparser_settings
+# Results relative to the base keep its microseconds, absolute results don't.
+# The cached fallback parses against a base with this microsecond to tell them apart.
+_PROBE_MICROSECOND: t.Final[int] = 1
 
 
 def parse_date(
@@ -99,35 +160,147 @@ def parse_date(
     relative_base: datetime | None = None,
     tzinfo: "_TzInfo | str | None" = None,
 ) -> datetime:
+    timezone: "_TzInfo"
     if isinstance(tzinfo, str):
-        tzinfo = pytz.timezone(tzinfo)
+        timezone = pytz.timezone(tzinfo)
+    elif tzinfo is None:
+        from lightlike.app.config import AppConfig
+
+        timezone = AppConfig().tzinfo
+    else:
+        timezone = tzinfo
+
+    relative_base = relative_base or now(timezone)
+    parsed_date: datetime | None = None
+    if parser_settings().fast_path:
+        parsed_date = _parse_fast(date, relative_base, timezone)
+    if parsed_date is None:
+        parsed_date = _parse_cached(date, relative_base, timezone)
+
+    if not parsed_date:
+        from rich.text import Text
+
+        raise click.UsageError(
+            message=Text.assemble("Failed to parse date: ", date).markup,
+            ctx=click.get_current_context(silent=True),
+        )
+    return astimezone(parsed_date, timezone)
 
-    if tzinfo is None:
-        tzinfo = AppConfig().tzinfo
 
-    _settings = DEFAULT_PARSER_SETTINGS.copy()
+def _localize(dt: datetime, tzinfo: "_TzInfo") -> datetime:
+    localize: t.Callable[[datetime], datetime] | None = getattr(
+        tzinfo, "localize", None
+    )
+    return localize(dt) if localize else dt.replace(tzinfo=tzinfo)
+
+
+def _time_today(
+    tzinfo: "_TzInfo", hour: int, minute: int = 0, second: int = 0
+) -> datetime | None:
+    # dateparser fills in the local date of this machine for times,
+    # not the date of the relative base or the configured timezone.
+    if hour > 23 or minute > 59 or second > 59:
+        return None
+    return _localize(datetime.combine(date.today(), time(hour, minute, second)), tzinfo)
+
+
+def _parse_fast(
+    text: str, relative_base: datetime, tzinfo: "_TzInfo"
+) -> datetime | None:
+    """Common forms, parsed the same as dateparser would. None for anything else."""
+    text = text.strip().lower()
+    date_formats: list[str] = parser_settings().date_formats
+
+    if text in ("n", "now"):
+        return relative_base
+
+    if match := _RELATIVE.fullmatch(text):
+        sign, amount, unit = match.groups()
+        delta = timedelta(**{_UNITS[unit]: int(amount)})
+        return relative_base + delta if sign == "+" else relative_base - delta
+
+    if match := _CLOCK.fullmatch(text):
+        hour, minute, second = match.groups()
+        if ("%H:%M:%S" if second else "%H:%M") not in date_formats:
+            return None
+        return _time_today(tzinfo, int(hour), int(minute), int(second or 0))
+
+    if match := _MERIDIEM.fullmatch(text):
+        hour, colon, minute, meridiem = match.groups()
+        if colon and not minute:
+            return None
+        form: str = "%I:%M%p" if colon else "%I%M%p" if minute else "%I%p"
+        if form not in date_formats or not 1 <= int(hour) <= 12:
+            return None
+        hour_24: int = int(hour) % 12 + (12 if meridiem == "pm" else 0)
+        return _time_today(tzinfo, hour_24, int(minute or 0))
+
+    if match := _DIGITS.fullmatch(text):
+        hour, minute, second = match.groups()
+        if ("%H%M%S" if second else "%H%M") not in date_formats:
+            return None
+        return _time_today(tzinfo, int(hour), int(minute), int(second or 0))
+
+    try:
+        if (match := _MONTH_DAY.fullmatch(text)) and match[1] in _MONTHS:
+            day = datetime(relative_base.year, _MONTHS[match[1]], int(match[2]))
+            return _localize(day, tzinfo)
+
+        if _ISO.fullmatch(text):
+            return _localize(datetime.fromisoformat(text), tzinfo)
+    except ValueError:
+        # e.g. feb29 outside a leap year, which dateparser moves to another year.
+        return None
+
+    return None
+
+
+def _parse_cached(
+    text: str, relative_base: datetime, tzinfo: "_TzInfo"
+) -> datetime | None:
+    minute: datetime = relative_base.replace(second=0, microsecond=0)
+    cached = _parse_minute(text, minute, tzinfo, date.today())
+    if cached is None:
+        return None
+    parsed_date, relative = cached
+    return relative_base + (parsed_date - minute) if relative else parsed_date
+
+
+@lru_cache(maxsize=512)
+def _parse_minute(
+    text: str, minute: datetime, tzinfo: "_TzInfo", today: date
+) -> tuple[datetime, bool] | None:
+    # today is only part of the key, times of day are parsed for the current date.
+    probe: datetime = minute.replace(microsecond=_PROBE_MICROSECOND)
+    parsed_date: datetime | None = _parse_with_dateparser(text, probe, tzinfo)
+    if parsed_date is None:
+        return None
+    if parsed_date.microsecond == _PROBE_MICROSECOND:
+        return minute + (parsed_date - probe), True
+    return parsed_date, False
+
+
+def _parse_with_dateparser(
+    text: str, relative_base: datetime, tzinfo: "_TzInfo"
+) -> datetime | None:
+    _settings = parser_settings().dateparser.copy()
     _settings.update(
-        RELATIVE_BASE=relative_base or now(tzinfo),
+        RELATIVE_BASE=relative_base,
         TO_TIMEZONE=f"{tzinfo}",
         TIMEZONE=f"{tzinfo}",
     )
 
-    if date.startswith("+"):
+    if text.startswith("+"):
         _settings.update(PREFER_DATES_FROM="future")
-    if date == "n":
-        date = "now"
+    if text == "n":
+        text = "now"
 
     parsed_date = dateparser.parse(
-        date,
+        text,
         settings=t.cast("_Settings", _settings),
-        date_formats=ADDITIONAL_DATE_FORMATS,
+        date_formats=parser_settings().date_formats,
     )
-    if not parsed_date:
-        raise click.UsageError(
-            message=Text.assemble("Failed to parse date: ", date).markup,
-            ctx=click.get_current_context(silent=True),
-        )
-    return astimezone(parsed_date, tzinfo)
+    return t.cast("datetime | None", parsed_date)
 
 
 def parse_date_range_flags(start: datetime, end: datetime) -> DateParams:
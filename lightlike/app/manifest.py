@@ -0,0 +1,112 @@
+import importlib.util
+import json
+import os
+import sys
+import threading
+import typing as t
+from pathlib import Path
+
+from lightlike.internal import appdir, utils
+
+if t.TYPE_CHECKING:
+    import click
+
+__all__: t.Sequence[str] = ("CommandManifest", "ManifestEntry", "MANIFEST")
+
+
+class ManifestEntry(t.TypedDict):
+    name: str
+    hidden: bool
+    allow_name_alias: bool
+    deprecated: bool
+    short_help: str
+    mtime_ns: int
+
+
+class CommandManifest:
+    """
+    What help and alias resolution need to know about lazy subcommands.
+
+    Entries are keyed by import path, and saved with the mtime of the module
+    the command is defined in. An entry is stale once that module changes,
+    and is rebuilt the next time the command is loaded.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: dict[str, ManifestEntry] | None = None
+        self._mtimes: dict[str, int | None] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, import_path: str) -> ManifestEntry | None:
+        entry: ManifestEntry | None = self._load().get(import_path)
+        if entry is None:
+            return None
+        mtime_ns: int | None = self._mtime_ns(import_path)
+        if mtime_ns is None or entry["mtime_ns"] != mtime_ns:
+            return None
+        return entry
+
+    def update(self, import_path: str, command: "click.Command") -> ManifestEntry:
+        entry: ManifestEntry = entry_from_command(command)
+        entry["mtime_ns"] = self._mtime_ns(import_path) or 0
+        with self._lock:
+            entries: dict[str, ManifestEntry] = self._load()
+            if entries.get(import_path) != entry:
+                entries[import_path] = entry
+                self._dump(entries)
+        return entry
+
+    def _load(self) -> dict[str, ManifestEntry]:
+        if self._entries is None:
+            try:
+                self._entries = (
+                    json.loads(self.path.read_text("utf-8"))
+                    if self.path.exists()
+                    else {}
+                )
+            except Exception as error:
+                appdir.log().error(f"Failed to load command manifest: {error}")
+                self._entries = {}
+        return t.cast(dict[str, ManifestEntry], self._entries)
+
+    def _dump(self, entries: dict[str, ManifestEntry]) -> None:
+        try:
+            utils.atomic_write_text(self.path, json.dumps(entries, indent=2))
+        except Exception as error:
+            appdir.log().error(f"Failed to save command manifest: {error}")
+
+    def _mtime_ns(self, import_path: str) -> int | None:
+        # Modules aren't reloaded, so their mtime is only checked once per process.
+        modname: str = import_path.partition(":")[0]
+        if modname not in self._mtimes:
+            self._mtimes[modname] = _module_mtime_ns(modname)
+        return self._mtimes[modname]
+
+
+def entry_from_command(command: "click.Command") -> ManifestEntry:
+    return ManifestEntry(
+        name=command.name or "",
+        hidden=command.hidden,
+        allow_name_alias=getattr(command, "allow_name_alias", None) is not False,
+        deprecated=command.deprecated,
+        short_help=f"{command.short_help or command.help or ''}",
+        mtime_ns=0,
+    )
+
+
+def _module_mtime_ns(modname: str) -> int | None:
+    # Finds the module's file without executing it. Parent packages are imported,
+    # which for subcommands are the modules the parent group is defined in.
+    try:
+        module = sys.modules.get(modname)
+        origin: str | None = getattr(module, "__file__", None)
+        if origin is None:
+            spec = importlib.util.find_spec(modname)
+            origin = spec.origin if spec else None
+        return os.stat(origin).st_mtime_ns if origin else None
+    except (ImportError, ValueError, OSError):
+        return None
+
+
+MANIFEST: CommandManifest = CommandManifest(appdir.COMMAND_MANIFEST)
@@ -13,6 +13,7 @@ from lightlike.app import cursor, dates, shell_complete, validate
 from lightlike.app.autosuggest import threaded_autosuggest
 from lightlike.app.config import AppConfig
 from lightlike.app.keybinds import PROMPT_BINDINGS
+from lightlike.app.refresh import RefreshScheduler
 from lightlike.internal import appdir, constant, utils
 
 __all__: t.Sequence[str] = ("PromptFactory",)
@@ -36,8 +37,9 @@ class PromptFactory(PromptSession[t.Any]):
         self.validate_while_typing = True
         self.complete_while_typing = True
         self.enable_open_in_editor = True
-        self.refresh_interval = 1
+        self.refresh_interval = 0
         self.key_bindings = PROMPT_BINDINGS
+        RefreshScheduler(cursor.refresh_resolution).attach(self.app)
 
     @classmethod
     @utils.exit_cmd_on_interrupt()
@@ -0,0 +1,71 @@
+import asyncio
+import typing as t
+from time import monotonic, time
+
+from lightlike.app.config import AppConfig
+
+if t.TYPE_CHECKING:
+    from prompt_toolkit.application import Application
+    from prompt_toolkit.key_binding.key_processor import KeyProcessor
+
+__all__: t.Sequence[str] = ("RefreshScheduler",)
+
+
+class RefreshScheduler:
+    """
+    Invalidates a prompt on whole-second boundaries, replacing refresh_interval.
+
+    `resolution` returns the finest time unit currently displayed, in seconds,
+    or None if nothing on screen depends on the time. Refreshes happen every
+    `interval` seconds (never more often than the resolution needs), and every
+    `idle_interval` seconds once there has been no input for `idle_after` seconds.
+    """
+
+    def __init__(
+        self,
+        resolution: t.Callable[[], float | None],
+        interval: float | None = None,
+        idle_after: float | None = None,
+        idle_interval: float | None = None,
+    ) -> None:
+        self.resolution = resolution
+        self.interval: float = interval or AppConfig().get(
+            "settings", "refresh", "interval", default=1
+        )
+        self.idle_after: float = idle_after or AppConfig().get(
+            "settings", "refresh", "idle-after", default=300
+        )
+        self.idle_interval: float = idle_interval or AppConfig().get(
+            "settings", "refresh", "idle-interval", default=60
+        )
+        self.last_input: float = monotonic()
+
+    def attach(self, app: "Application[t.Any]") -> None:
+        """Run alongside every prompt of `app`. The app's own refresh_interval should be 0."""
+        app.on_reset += self._start
+        app.key_processor.after_key_press += self._on_key_press
+
+    def _start(self, app: "Application[t.Any]") -> None:
+        self.last_input = monotonic()
+        app.create_background_task(self._run(app))
+
+    def _on_key_press(self, _: "KeyProcessor") -> None:
+        self.last_input = monotonic()
+
+    def next_delay(self) -> float:
+        idle: bool = monotonic() - self.last_input >= self.idle_after
+        resolution: float | None = self.resolution()
+        if resolution is None:
+            # Nothing to redraw, check again later in case a timer was started.
+            interval: float = self.idle_interval
+        elif idle:
+            interval = max(self.idle_interval, resolution)
+        else:
+            interval = max(self.interval, resolution)
+        # Wake just after the boundary, so the new second is what gets rendered.
+        return interval - (time() % interval) + 0.01
+
+    async def _run(self, app: "Application[t.Any]") -> None:
+        while 1:
+            await asyncio.sleep(self.next_delay())
+            app.invalidate()
@@ -7,6 +7,8 @@ from functools import partial, reduce
 from more_itertools import one
 from rich import box, get_console
 from rich import print as rprint
+from rich.json import JSON
+from rich.segment import SegmentLines
 from rich.table import Table
 from rich.text import Text
 
@@ -16,6 +18,11 @@ from lightlike.internal import appdir, markup
 if t.TYPE_CHECKING:
     from _collections_abc import dict_items, dict_values
 
+    from google.cloud.bigquery import SchemaField
+    from google.cloud.bigquery.table import RowIterator
+    from rich.console import Console
+    from rich.containers import Lines
+
 
 __all__: t.Sequence[str] = (
     "cli_info",
@@ -25,9 +32,15 @@ __all__: t.Sequence[str] = (
     "map_column_style",
     "map_sequence_to_rich_table",
     "query_start_render",
+    "STREAM_PAGE_SIZE",
+    "stream_rows_to_json",
+    "stream_rows_to_rich_table",
 )
 
 
+STREAM_PAGE_SIZE: t.Final[int] = 1000
+
+
 def cli_info() -> None:
     console = get_console()
     console.log(f'[repr.str]"{__appname_sc__}" [repr.number]{__version__}')
@@ -168,6 +181,180 @@ def map_sequence_to_rich_table(
     return table
 
 
+def stream_rows_to_rich_table(
+    rows: "RowIterator",
+    exclude_fields: list[str] | None = None,
+    on_row: t.Callable[[int, dict[str, t.Any]], t.Any] | None = None,
+    table_kwargs: t.Mapping[str, t.Any] | None = None,
+    console: "Console | None" = None,
+) -> int:
+    """
+    Print rows page by page as they're fetched, and return the number of rows.
+
+    Column widths are set from the schema before the first page arrives, so every
+    page lines up with the header without holding more than one page of rows.
+    Nothing is printed if there are no rows.
+    """
+    console = console or get_console()
+    default: dict[str, t.Any] = {
+        "box": box.MARKDOWN,
+        "border_style": "bold",
+        "show_header": True,
+        "show_edge": True,
+    }
+    default.update(table_kwargs or {})
+
+    fields: list["SchemaField"] = [
+        f for f in rows.schema if f.name not in (exclude_fields or [])
+    ]
+    columns: dict[str, dict[str, t.Any]] = _schema_column_kwargs(fields, console.width)
+
+    show_header: bool = default.pop("show_header")
+    count: int = 0
+    bottom_edge: list[t.Any] | None = None
+    for page in rows.pages:
+        table: Table = Table(show_header=show_header and not count, **default)
+        for name, kwargs in columns.items():
+            table.add_column(name, **kwargs)
+        for row in page:
+            mapping: dict[str, t.Any] = dict(row.items())
+            if on_row:
+                on_row(count, mapping)
+            values = t.cast("dict_values[str, t.Any]", [mapping[k] for k in columns])
+            table.add_row(*map_cell_style(values))
+            count += 1
+        if not table.row_count:
+            continue
+
+        lines = console.render_lines(table, console.options, pad=False)
+        # Each page is its own table, drop the edges between them.
+        top: int = 1 if default["show_edge"] and count != table.row_count else 0
+        bottom_edge = lines[-1] if default["show_edge"] else None
+        console.print(
+            SegmentLines(lines[top : -1 if bottom_edge else None], new_lines=True),
+            end="",
+        )
+
+    if bottom_edge is not None:
+        console.print(SegmentLines([bottom_edge], new_lines=True), end="")
+    return count
+
+
+def stream_rows_to_json(
+    rows: "RowIterator",
+    on_row: t.Callable[[int, dict[str, t.Any]], t.Any] | None = None,
+    console: "Console | None" = None,
+) -> int:
+    """Print rows as a json array as they're fetched, and return the number of rows."""
+    console = console or get_console()
+    count: int = 0
+    previous: dict[str, t.Any] | None = None
+
+    def print_row(row: dict[str, t.Any], last: bool) -> None:
+        # Indented as an element of the array, like print_json(data=rows).
+        lines: "Lines" = JSON.from_data(row, default=str).text.split("\n")
+        text: Text = Text("\n").join(Text("  ") + line for line in lines)
+        if not last:
+            text.append(",")
+        console.print(text)
+
+    for row in rows:
+        mapping: dict[str, t.Any] = dict(row.items())
+        if on_row:
+            on_row(count, mapping)
+        if previous is None:
+            console.print("[", highlight=True)
+        else:
+            print_row(previous, last=False)
+        previous = mapping
+        count += 1
+
+    if previous is not None:
+        print_row(previous, last=True)
+        console.print("]", highlight=True)
+    else:
+        console.print("[]", highlight=True)
+    return count
+
+
+def _schema_column_kwargs(
+    fields: t.Sequence["SchemaField"],
+    console_width: int,
+) -> dict[str, dict[str, t.Any]]:
+    ctypes: dict[str, list[str]] = {
+        "string_ctype": [],
+        "bool_ctype": [],
+        "num_ctype": [],
+        "datetime_ctype": [],
+        "time_ctype": [],
+        "date_ctype": [],
+    }
+    widths: dict[str, int | None] = {}
+
+    for field in fields:
+        width: int | None
+        match field.field_type:
+            case "BOOL" | "BOOLEAN":
+                ctypes["bool_ctype"].append(field.name)
+                width = 1 if console_width <= 150 else 5
+            case "INTEGER" | "INT64":
+                ctypes["num_ctype"].append(field.name)
+                width = 8
+            case "FLOAT" | "FLOAT64" | "NUMERIC" | "BIGNUMERIC":
+                ctypes["num_ctype"].append(field.name)
+                width = 10
+            case "TIMESTAMP":
+                ctypes["datetime_ctype"].append(field.name)
+                width = 25
+            case "DATETIME":
+                ctypes["datetime_ctype"].append(field.name)
+                width = 19
+            case "DATE":
+                ctypes["date_ctype"].append(field.name)
+                width = 10
+            case "TIME":
+                ctypes["time_ctype"].append(field.name)
+                width = 8
+            case _:
+                ctypes["string_ctype"].append(field.name)
+                width = None
+        widths[field.name] = width
+
+    # Strings share what's left after the fixed width columns, borders and padding.
+    fixed: int = sum(
+        max(w, len(k)) if k not in ctypes["bool_ctype"] else w
+        for k, w in widths.items()
+        if w is not None
+    )
+    flexible: list[str] = [k for k, w in widths.items() if w is None]
+    remaining: int = console_width - fixed - (len(widths) * 3 + 1)
+    for name in flexible:
+        widths[name] = max(remaining // len(flexible), len(name))
+
+    columns: dict[str, dict[str, t.Any]] = {}
+    for name, width in widths.items():
+        kwargs = map_column_style(
+            (name, None),
+            string_ctype=ctypes["string_ctype"],
+            bool_ctype=ctypes["bool_ctype"],
+            num_ctype=ctypes["num_ctype"],
+            datetime_ctype=ctypes["datetime_ctype"],
+            time_ctype=ctypes["time_ctype"],
+            date_ctype=ctypes["date_ctype"],
+            console_width=console_width,
+        )
+        for key in ("min_width", "max_width", "ratio"):
+            kwargs.pop(key, None)
+        if name not in ctypes["bool_ctype"]:
+            width = max(t.cast(int, width), len(name))
+        if name not in ctypes["bool_ctype"] + ctypes["string_ctype"]:
+            # Widths are guesses from the type, wrap longer values instead of
+            # cropping them.
+            kwargs["overflow"] = "fold"
+        columns[name] = kwargs | {"width": width}
+    return columns
+
+
 def map_cell_style(values: "dict_values[str, t.Any]") -> "map[str]":
     display_values: list[t.Any] = []
     for value in values:
@@ -1,16 +1,12 @@
 import typing as t
 
-from prompt_toolkit.completion import (
-    Completer,
-    DynamicCompleter,
-    ThreadedCompleter,
-    merge_completers,
-)
+from prompt_toolkit.completion import Completer, DynamicCompleter, ThreadedCompleter
 
 from lightlike.app.config import AppConfig
+from lightlike.app.shell_complete.pipeline import CompletionPipeline
 from lightlike.internal.enums import ActiveCompleter
 
-__all__: t.Sequence[str] = ("global_completer",)
+__all__: t.Sequence[str] = ("global_completer", "PIPELINE")
 
 
 ACTIVE_COMPLETERS: list[ActiveCompleter] = []
@@ -21,6 +17,10 @@ HISTORY_COMPLETER: Completer | None = None
 PATH_COMPLETER: Completer | None = None
 EXEC_COMPLETER: Completer | None = None
 
+PIPELINE: CompletionPipeline = CompletionPipeline(
+    budget=AppConfig().get("completers", "latency-budget-ms", default=1000) / 1000
+)
+
 _COMPLETERS: t.MutableMapping[ActiveCompleter, Completer | None] = {
     ActiveCompleter.CMD: None,
     ActiveCompleter.HISTORY: None,
@@ -63,7 +63,7 @@ def _get_completer(
                     if _COMPLETERS[ActiveCompleter.CMD] is None:
                         global CMD_COMPLETER
                         if CMD_COMPLETER is None:
-                            CMD_COMPLETER = ThreadedCompleter(default_completer)
+                            CMD_COMPLETER = default_completer
                         _COMPLETERS[ActiveCompleter.CMD] = CMD_COMPLETER
 
                 case ActiveCompleter.HISTORY:
@@ -72,9 +72,7 @@ def _get_completer(
                         if HISTORY_COMPLETER is None:
                             from .history import HistoryCompleter
 
-                            HISTORY_COMPLETER = t.cast(
-                                Completer, ThreadedCompleter(HistoryCompleter())
-                            )
+                            HISTORY_COMPLETER = HistoryCompleter()
                         _COMPLETERS[ActiveCompleter.HISTORY] = HISTORY_COMPLETER
 
                 case ActiveCompleter.PATH:
@@ -83,9 +81,7 @@ def _get_completer(
                         if PATH_COMPLETER is None:
                             from .path import PathCompleter
 
-                            PATH_COMPLETER = t.cast(
-                                Completer, ThreadedCompleter(PathCompleter())
-                            )
+                            PATH_COMPLETER = PathCompleter()
                         _COMPLETERS[ActiveCompleter.PATH] = PATH_COMPLETER
 
                 case ActiveCompleter.EXEC:
@@ -94,15 +90,16 @@ def _get_completer(
                         if EXEC_COMPLETER is None:
                             from .executable import ExecutableCompleter
 
-                            EXEC_COMPLETER = t.cast(
-                                Completer, ThreadedCompleter(ExecutableCompleter())
-                            )
+                            EXEC_COMPLETER = ExecutableCompleter()
                         _COMPLETERS[ActiveCompleter.EXEC] = EXEC_COMPLETER
 
         elif c in _COMPLETERS:
             _COMPLETERS[c] = None
 
-    return merge_completers([c for c in _COMPLETERS.values() if c])
+    # Completers run concurrently in the pipeline, so they are not wrapped
+    # in a ThreadedCompleter of their own.
+    PIPELINE.completers = {k.name: c for k, c in _COMPLETERS.items() if c}
+    return PIPELINE
 
 
 def reconfigure_completer(completer: ActiveCompleter) -> None:
@@ -1,23 +1,170 @@
+import json
 import os
 import re
-import shutil
-import stat
+import threading
 import typing as t
-from functools import cached_property, partial
+from bisect import bisect_left
+from functools import partial
 from pathlib import Path
+from time import monotonic
 
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.formatted_text import FormattedText
 
 from lightlike.app.config import AppConfig
-from lightlike.internal.utils import match_str
+from lightlike.internal import appdir, utils
 
 if t.TYPE_CHECKING:
     from prompt_toolkit.completion import CompleteEvent
     from prompt_toolkit.document import Document
 
 
-__all__: t.Sequence[str] = ("ExecutableCompleter",)
+__all__: t.Sequence[str] = ("ExecutableCompleter", "ExecutableIndex")
+
+
+class ExecutableIndex:
+    """
+    Index of executables on $PATH, persisted to disk and keyed by directory mtime.
+
+    Directories are listed with os.scandir in a background thread, and only
+    directories whose mtime changed since the last scan are listed again.
+    Lookups are a bisect on a sorted array and never touch the filesystem.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ignore_patterns: list[str] | None = None,
+        refresh_interval: float = 10.0,
+    ) -> None:
+        self.path = path
+        self.ignore_patterns = ignore_patterns or []
+        self.refresh_interval = refresh_interval
+        self._expressions: list[re.Pattern[str]] = list(
+            map(partial(re.compile, flags=re.I), self.ignore_patterns)  # type: ignore[arg-type, unused-ignore]
+        )
+        # {directory: {"mtime_ns": int, "entries": [[name, resolved], ...]}}
+        self._directories: dict[str, dict[str, t.Any]] = {}
+        self._keys: list[tuple[str, str, str]] = []
+        self._last_refresh: float | None = None
+        self._refreshing: threading.Lock = threading.Lock()
+        self._load()
+
+    def search(self, prefix: str) -> list[tuple[str, str]]:
+        self.refresh_in_background()
+        keys = self._keys
+        lower: str = prefix.lower()
+        matches: list[tuple[str, str]] = []
+        for idx in range(bisect_left(keys, (lower, "", "")), len(keys)):
+            key, name, resolved = keys[idx]
+            if not key.startswith(lower):
+                break
+            matches.append((name, resolved))
+        return matches
+
+    def refresh_in_background(self) -> None:
+        if (
+            self._last_refresh is not None
+            and monotonic() - self._last_refresh < self.refresh_interval
+        ):
+            return
+        self._last_refresh = monotonic()
+        threading.Thread(target=self.refresh, daemon=True).start()
+
+    def refresh(self) -> None:
+        if not self._refreshing.acquire(blocking=False):
+            return
+        try:
+            directories: dict[str, dict[str, t.Any]] = {}
+            changed: bool = False
+
+            for directory in os.environ.get("PATH", "").split(os.pathsep):
+                if not directory or directory in directories:
+                    continue
+                try:
+                    mtime_ns: int = os.stat(directory).st_mtime_ns
+                except OSError:
+                    continue
+
+                cached = self._directories.get(directory)
+                if cached and cached["mtime_ns"] == mtime_ns:
+                    directories[directory] = cached
+                    continue
+
+                directories[directory] = {
+                    "mtime_ns": mtime_ns,
+                    "entries": self._scan(directory),
+                }
+                changed = True
+
+            if changed or directories.keys() != self._directories.keys():
+                self._directories = directories
+                self._keys = self._build_keys(directories)
+                self._dump()
+        except Exception as error:
+            appdir.log().error(f"Failed to refresh executable index: {error}")
+        finally:
+            self._refreshing.release()
+
+    def _scan(self, directory: str) -> list[list[str]]:
+        entries: list[list[str]] = []
+        with os.scandir(directory) as iterator:
+            for entry in iterator:
+                try:
+                    if any(
+                        exp.match(Path(entry.path).as_posix())
+                        for exp in self._expressions
+                    ):
+                        continue
+                    if not entry.is_file():
+                        continue
+                    if not self._is_executable(entry):
+                        continue
+                    resolved: str = (
+                        os.path.realpath(entry.path)
+                        if entry.is_symlink()
+                        else entry.path
+                    )
+                    entries.append([Path(resolved).name, resolved])
+                except OSError:
+                    continue
+        return entries
+
+    @staticmethod
+    def _is_executable(entry: os.DirEntry[str]) -> bool:
+        if os.name == "nt":
+            extensions = os.environ.get("PATHEXT", ".EXE;.BAT;.CMD").lower().split(";")
+            return os.path.splitext(entry.name)[1].lower() in extensions
+        return os.access(entry.path, os.X_OK)
+
+    @staticmethod
+    def _build_keys(
+        directories: dict[str, dict[str, t.Any]],
+    ) -> list[tuple[str, str, str]]:
+        keys: set[tuple[str, str, str]] = set()
+        for cached in directories.values():
+            for name, resolved in cached["entries"]:
+                keys.add((name.lower(), name, resolved))
+        return sorted(keys)
+
+    def _load(self) -> None:
+        try:
+            if not self.path.exists():
+                return
+            index: dict[str, t.Any] = json.loads(self.path.read_text("utf-8"))
+            if index.get("ignore-patterns") != self.ignore_patterns:
+                return
+            self._directories = index["directories"]
+            self._keys = self._build_keys(self._directories)
+        except Exception as error:
+            appdir.log().error(f"Failed to load executable index: {error}")
+
+    def _dump(self) -> None:
+        index: dict[str, t.Any] = {
+            "ignore-patterns": self.ignore_patterns,
+            "directories": self._directories,
+        }
+        utils.atomic_write_text(self.path, json.dumps(index))
 
 
 class ExecutableCompleter(Completer):
@@ -28,72 +175,31 @@ class ExecutableCompleter(Completer):
         "ignore-patterns",
         default=[],
     )
+    index: ExecutableIndex | None = None
 
-    @cached_property
-    def path(self) -> list[Path]:
-        return list(map(lambda p: Path(p), os.environ["PATH"].split(os.pathsep)))
-
-    @cached_property
-    def executables(self) -> list[Path]:
-        executables: list[Path] = []
-
-        expressions: list[re.Pattern[str]]
-        if self.ignore_patterns:
-            expressions = list(
-                map(partial(re.compile, flags=re.I), self.ignore_patterns)  # type: ignore[arg-type, unused-ignore]
+    def __init__(self) -> None:
+        if ExecutableCompleter.index is None:
+            ExecutableCompleter.index = ExecutableIndex(
+                appdir.EXECUTABLE_INDEX, self.ignore_patterns
             )
-        else:
-            expressions = []
-
-        matches: t.Callable[[Path], bool] = lambda p: not any(
-            exp.match(p.as_posix()) for exp in expressions
-        )
-
-        for path in self.path:
-            if not path.is_dir():
-                continue
-            try:
-                if expressions:
-                    subpaths = list(filter(matches, path.iterdir()))
-                else:
-                    subpaths = list(path.iterdir())
-
-                for executable in subpaths:
-                    resolved = executable.resolve()
-                    if os.access(resolved, os.X_OK):
-                        if executable not in executables:
-                            executables.append(executable)
-                        continue
-                    if shutil.which(resolved):
-                        if executable not in executables:
-                            executables.append(executable)
-                        continue
-                    if executable.stat().st_mode & stat.S_IXUSR:
-                        if executable not in executables:
-                            executables.append(executable)
-                        continue
-            except Exception:
-                continue
-        return executables
+            ExecutableCompleter.index.refresh_in_background()
 
     def get_completions(
         self, document: "Document", complete_event: "CompleteEvent"
     ) -> t.Iterator[Completion]:
         try:
+            assert self.index
             word_before_cursor = document.get_word_before_cursor(WORD=True)
-            match_word_before_cursor = lambda l: match_str(word_before_cursor, l.name)
-            matches = list(filter(match_word_before_cursor, self.executables))
-
-            for path in sorted(matches, key=lambda p: p.name):
-                resolved = path.resolve()
 
+            for name, resolved in self.index.search(word_before_cursor):
                 if os.name == "nt":
-                    text = resolved.name.removesuffix(".exe")
-                    drive = f"/{resolved.drive.lower().replace(':', '')}"
-                    display_meta = resolved.as_posix().replace(resolved.drive, drive)
+                    path = Path(resolved)
+                    text = name.removesuffix(".exe")
+                    drive = f"/{path.drive.lower().replace(':', '')}"
+                    display_meta = path.as_posix().replace(path.drive, drive)
                 else:
-                    text = resolved.name
-                    display_meta = f"{resolved}"
+                    text = name
+                    display_meta = resolved
 
                 yield Completion(
                     text=text,
@@ -0,0 +1,119 @@
+import typing as t
+from collections import Counter
+from pathlib import Path
+from threading import Lock
+
+from lightlike.app.cache import SnapshotVersion, load_snapshot, snapshot_version
+from lightlike.internal import appdir
+
+__all__: t.Sequence[str] = ("appdata_index", "FuzzyIndex")
+
+
+T = t.TypeVar("T")
+I = t.TypeVar("I")
+
+
+def _trigrams(string: str) -> set[str]:
+    return {string[i : i + 3] for i in range(len(string) - 2)}
+
+
+def _span(query: str, key: str) -> tuple[int, int] | None:
+    # Length and start of the tightest window of `key` containing `query` as a subsequence,
+    # the same ranking fuzzyfinder uses.
+    best: tuple[int, int] | None = None
+    start: int = key.find(query[0])
+    while start != -1:
+        end: int = start
+        for char in query[1:]:
+            end = key.find(char, end + 1)
+            if end == -1:
+                return best
+        span = (end - start + 1, start)
+        if best is None or span < best:
+            best = span
+        start = key.find(query[0], start + 1)
+    return best
+
+
+class FuzzyIndex(t.Generic[T]):
+    """
+    Fuzzy subsequence search over a fixed list of items.
+
+    A character index narrows candidates to keys containing every character in the query,
+    a trigram index scores contiguous runs of the query higher than scattered matches.
+    When the query extends the previous one, only the previous matches are searched.
+    """
+
+    def __init__(
+        self, items: t.Sequence[T], keys: t.Sequence[str] | None = None
+    ) -> None:
+        self.items = list(items)
+        self.keys = [k.lower() for k in (keys or t.cast(t.Sequence[str], items))]
+        self._characters: dict[str, set[int]] = {}
+        self._trigrams: dict[str, set[int]] = {}
+        self._last: tuple[str, list[int]] = ("", list(range(len(self.items))))
+        self._lock: Lock = Lock()
+
+        for idx, key in enumerate(self.keys):
+            for char in set(key):
+                self._characters.setdefault(char, set()).add(idx)
+            for trigram in _trigrams(key):
+                self._trigrams.setdefault(trigram, set()).add(idx)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def search(self, query: str) -> list[T]:
+        query = query.lower()
+        if not query:
+            return self.items.copy()
+
+        with self._lock:
+            last_query, last_matches = self._last
+
+        if last_query and query.startswith(last_query):
+            candidates: t.Iterable[int] = last_matches
+        else:
+            postings = sorted(
+                (self._characters.get(char, set()) for char in set(query)), key=len
+            )
+            candidates = set.intersection(*postings)
+
+        trigram_hits: Counter[int] = Counter()
+        for trigram in _trigrams(query):
+            trigram_hits.update(self._trigrams.get(trigram, ()))
+
+        scored: list[tuple[int, int, int, int]] = []
+        for idx in candidates:
+            span = _span(query, self.keys[idx])
+            if span is not None:
+                scored.append((-trigram_hits[idx], *span, idx))
+
+        scored.sort()
+        matches: list[int] = [s[-1] for s in scored]
+        with self._lock:
+            self._last = (query, matches)
+        return [self.items[idx] for idx in matches]
+
+
+_INDEXES: dict[tuple[Path, t.Hashable], tuple[SnapshotVersion, t.Any]] = {}
+_INDEXES_LOCK: Lock = Lock()
+
+
+def appdata_index(
+    key: t.Hashable,
+    build: t.Callable[[dict[str, t.Any]], I],
+    path: Path = appdir.ENTRY_APPDATA,
+) -> I:
+    """Index built from the appdata file by `build`, rebuilt only when the file changes."""
+    version: SnapshotVersion = snapshot_version(path)
+    with _INDEXES_LOCK:
+        cached = _INDEXES.get((path, key))
+    if cached and cached[0] == version:
+        return t.cast(I, cached[1])
+
+    version, data = load_snapshot(path)
+    index: I = build(data)
+    with _INDEXES_LOCK:
+        _INDEXES[(path, key)] = (version, index)
+    return index
@@ -1,43 +1,173 @@
+import heapq
 import typing as t
+from bisect import bisect_left, insort
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
 
-from more_itertools import unique_everseen
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.formatted_text import FormattedText
-from prompt_toolkit.history import ThreadedHistory
 from rich import get_console
 
+from lightlike.app.config import AppConfig
 from lightlike.internal import appdir
-from lightlike.internal.utils import match_str
 
 if t.TYPE_CHECKING:
     from prompt_toolkit.completion import CompleteEvent
     from prompt_toolkit.document import Document
 
 
-__all__: t.Sequence[str] = ("HistoryCompleter",)
+__all__: t.Sequence[str] = ("HistoryCompleter", "HistoryIndex")
+
+
+# (max age in days, weight) - frecency buckets, recent commands weigh more per use.
+FRECENCY_BUCKETS: t.Final[tuple[tuple[int, int], ...]] = (
+    (4, 100),
+    (14, 70),
+    (31, 50),
+    (90, 30),
+)
+FRECENCY_DEFAULT_WEIGHT: t.Final[int] = 10
+
+
+class HistoryIndex:
+    """
+    In-memory prefix index over a prompt_toolkit FileHistory file.
+
+    Built once from the full file, then only the bytes appended since the last
+    lookup are parsed. Keys are kept in a sorted array of (lowercase, original)
+    pairs so a prefix lookup is a bisect followed by a scan over the matches.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._keys: list[tuple[str, str]] = []
+        self._count: dict[str, int] = {}
+        self._last_used: dict[str, datetime] = {}
+        self._sequence: dict[str, int] = {}
+        self._added: int = 0
+        self._offset: int = 0
+        self._lock: Lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def refresh(self) -> None:
+        with self._lock:
+            try:
+                size: int = self.path.stat().st_size
+            except FileNotFoundError:
+                return
+
+            if size < self._offset:
+                # File was truncated or replaced, rebuild from the start.
+                self._keys.clear()
+                self._count.clear()
+                self._last_used.clear()
+                self._sequence.clear()
+                self._added = 0
+                self._offset = 0
+
+            if size == self._offset:
+                return
+
+            with self.path.open("rb") as file:
+                file.seek(self._offset)
+                chunk: bytes = file.read(size - self._offset)
+
+            # Only consume complete lines, the rest is read on the next refresh.
+            end: int = chunk.rfind(b"\n") + 1
+            if not end:
+                return
+            self._offset += end
+            self._parse(chunk[:end].decode("utf-8", errors="replace"))
+
+    def add(self, string: str, timestamp: datetime | None = None) -> None:
+        command: str = string.strip()
+        if not command:
+            return
+        if command not in self._count:
+            insort(self._keys, (command.lower(), command))
+            self._count[command] = 0
+        self._count[command] += 1
+        self._last_used[command] = timestamp or datetime.now()
+        self._added += 1
+        self._sequence[command] = self._added
+
+    def search(self, prefix: str, limit: int | None = None) -> list[str]:
+        self.refresh()
+        lower: str = prefix.lower()
+        now: datetime = datetime.now()
+
+        with self._lock:
+            matches: list[str] = []
+            for idx in range(bisect_left(self._keys, (lower, "")), len(self._keys)):
+                key, command = self._keys[idx]
+                if not key.startswith(lower):
+                    break
+                matches.append(command)
+
+            rank: t.Callable[[str], tuple[int, int]] = lambda c: (
+                self._score(c, now),
+                self._sequence[c],
+            )
+            if limit:
+                return heapq.nlargest(limit, matches, key=rank)
+            return sorted(matches, key=rank, reverse=True)
+
+    def _score(self, command: str, now: datetime) -> int:
+        age: int = (now - self._last_used[command]).days
+        for max_age, weight in FRECENCY_BUCKETS:
+            if age < max_age:
+                return self._count[command] * weight
+        return self._count[command] * FRECENCY_DEFAULT_WEIGHT
+
+    def _parse(self, text: str) -> None:
+        # Same format as prompt_toolkit.history.FileHistory,
+        # a "# timestamp" line followed by "+" prefixed lines for each entry.
+        lines: list[str] = []
+        timestamp: datetime | None = None
+
+        for line in text.splitlines(keepends=True):
+            if line.startswith("+"):
+                lines.append(line[1:])
+                continue
+            if lines:
+                self.add("".join(lines)[:-1], timestamp)
+                lines = []
+            if line.startswith("# "):
+                try:
+                    timestamp = datetime.fromisoformat(line[2:].strip())
+                except ValueError:
+                    timestamp = None
+
+        if lines:
+            self.add("".join(lines)[:-1], timestamp)
 
 
 class HistoryCompleter(Completer):
     style: str = "#a49db0"
-    file_history: ThreadedHistory = appdir.REPL_FILE_HISTORY()
+    index: HistoryIndex = HistoryIndex(appdir.REPL_HISTORY)
 
-    def __init__(self, max_length_string: int | None = None) -> None:
+    def __init__(
+        self,
+        max_length_string: int | None = None,
+        max_results: int | None = None,
+    ) -> None:
         super().__init__()
         self.max_length_string = max_length_string
+        self.max_results = max_results or AppConfig().get(
+            "completers", "history", "max-results", default=100
+        )
 
     def get_completions(
         self, document: "Document", complete_event: "CompleteEvent"
     ) -> t.Iterator[Completion]:
         try:
             text_before_cursor: str = document.text_before_cursor
-            history_strings = self.file_history.load_history_strings()
-            history = unique_everseen(list(map(lambda s: s.strip(), history_strings)))
             console_width = get_console().width
 
-            match_word_before_cursor = lambda l: match_str(
-                text_before_cursor, l, method="startswith"
-            )
-            matches = list(filter(match_word_before_cursor, history))
+            matches = self.index.search(text_before_cursor, limit=self.max_results)
             display_meta = f"history{' ' * int(((console_width / 3) * 2) - 20)}"
 
             if not self.max_length_string:
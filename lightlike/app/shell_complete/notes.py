@@ -4,12 +4,12 @@ from pathlib import Path
 import click
 import rtoml
 from click.shell_completion import CompletionItem
-from fuzzyfinder import fuzzyfinder
 from more_itertools import first
 from prompt_toolkit.application import get_app
 from prompt_toolkit.completion import Completer, Completion
 
 from lightlike.app.cache import TimeEntryCache
+from lightlike.app.shell_complete.fuzzy import FuzzyIndex, appdata_index
 from lightlike.internal import appdir
 from lightlike.internal.utils import alter_str
 
@@ -38,6 +38,16 @@ class Notes(Completer):
     def data(self) -> dict[str, t.Any]:
         return rtoml.load(self.path)
 
+    def search(self, incomplete: str, project: str | None = None) -> list[str]:
+        return self.index(project or self.project).search(incomplete)
+
+    def index(self, project: str | None) -> FuzzyIndex[str]:
+        def build(data: dict[str, t.Any]) -> FuzzyIndex[str]:
+            project_notes = data.get("active", {}).get(project) or {}
+            return FuzzyIndex(project_notes.get("notes", []))
+
+        return appdata_index(("notes", project), build, self.path)
+
     def get_all(self) -> dict[str, list[str]]:
         active_projects = self.data["active"]
         notes = {
@@ -56,9 +66,7 @@ class Notes(Completer):
 
         start_position: int = -len(document.text_before_cursor)
 
-        matches: list[str] = fuzzyfinder(
-            document.text, self.get(self.project), sort_results=False
-        )
+        matches: list[str] = self.search(document.text)
         for match in matches:
             completion = Completion(text=match, start_position=start_position)
             completions.append(completion)
@@ -86,9 +94,7 @@ def from_param(
         target_project = ctx.protected_args[opt_idx + 1]
 
     if target_project:
-        matches: list[str] = fuzzyfinder(
-            incomplete, completer.get(target_project), sort_results=False
-        )
+        matches: list[str] = completer.search(incomplete, target_project)
         for note in matches:
             completion = CompletionItem(
                 value=alter_str(note, add_quotes=True),
@@ -114,11 +120,7 @@ def from_cache(
         return completions
 
     completer = Notes()
-    notes: list[str] = completer.get(cache.project)
-    if not notes:
-        return completions
-
-    matches: list[str] = fuzzyfinder(incomplete, notes, sort_results=False)
+    matches: list[str] = completer.search(incomplete, cache.project)
     for note in matches:
         completion = CompletionItem(
             value=alter_str(note, add_quotes=True),
@@ -142,9 +144,7 @@ def from_chained_cmd(
     if not (project_location and project):
         return completions
 
-    matches: list[str] = fuzzyfinder(
-        incomplete, Notes().get(project), sort_results=False
-    )
+    matches: list[str] = Notes().search(incomplete, project)
     for note in matches:
         completion = CompletionItem(
             value=alter_str(note, add_quotes=True),
@@ -1,7 +1,10 @@
 import os
 import re
+import threading
 import typing as t
+from collections import OrderedDict
 from contextlib import suppress
+from functools import partial
 from pathlib import Path
 
 import click
@@ -35,10 +38,93 @@ OneStyleAndTextTuple = t.Union[
 
 StyleAndTextTuples = list[OneStyleAndTextTuple]
 
+# (name, is_dir, is_link)
+DirEntry = tuple[str, bool, bool]
+
+MAX_ENTRIES: int = AppConfig().get("completers", "path", "max-entries", default=2000)
+MAX_CACHED_LISTINGS: t.Final[int] = 256
+MAX_META_ENTRIES: t.Final[int] = 50
+
+# {directory: (mtime_ns, entries)}
+# {path: (mtime ns, entry limit of the scan, or None if it listed every entry, entries)}
+_LISTINGS: OrderedDict[str, tuple[int, int | None, list[DirEntry]]] = OrderedDict()
+_LISTINGS_LOCK: threading.Lock = threading.Lock()
+_ACTIVE_SCAN: threading.Event | None = None
+
 TYPED_DIR = re.compile(r"^(.*)(?:\\|\/)", flags=re.IGNORECASE)
 TYPED_STEM = re.compile(r"^.*(?:\\|\/)+(.*)$", flags=re.IGNORECASE)
 
 
+def _cancel_active_scan() -> threading.Event:
+    # Signals the scan started by the previous keystroke to stop,
+    # and returns the event for the scan about to start.
+    global _ACTIVE_SCAN
+    cancelled = threading.Event()
+    with _LISTINGS_LOCK:
+        if _ACTIVE_SCAN is not None:
+            _ACTIVE_SCAN.set()
+        _ACTIVE_SCAN = cancelled
+    return cancelled
+
+
+def _listing(
+    directory: Path,
+    limit: int = MAX_ENTRIES,
+    cancelled: threading.Event | None = None,
+) -> t.Iterator[DirEntry]:
+    key: str = os.path.abspath(directory.expanduser())
+    mtime_ns: int = os.stat(key).st_mtime_ns
+
+    with _LISTINGS_LOCK:
+        cached = _LISTINGS.get(key)
+        # A listing cut short by a smaller limit can't answer a larger one.
+        usable: bool = bool(
+            cached
+            and cached[0] == mtime_ns
+            and (cached[1] is None or cached[1] >= limit)
+        )
+        if usable:
+            _LISTINGS.move_to_end(key)
+    if cached and usable:
+        yield from cached[2][:limit]
+        return
+
+    # Entries stream out as they are scanned, the listing is only
+    # cached if the scan ran to completion or hit the entry limit.
+    entries: list[DirEntry] = []
+    scan_limit: int | None = None
+    with os.scandir(key) as iterator:
+        for entry in iterator:
+            if cancelled is not None and cancelled.is_set():
+                return
+            if len(entries) >= limit:
+                scan_limit = limit
+                break
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            item: DirEntry = (entry.name, is_dir, entry.is_symlink())
+            entries.append(item)
+            yield item
+
+    with _LISTINGS_LOCK:
+        _LISTINGS[key] = (mtime_ns, scan_limit, entries)
+        _LISTINGS.move_to_end(key)
+        while len(_LISTINGS) > MAX_CACHED_LISTINGS:
+            _LISTINGS.popitem(last=False)
+
+
+def _iterdir(
+    directory: Path,
+    dir_only: bool = False,
+    cancelled: threading.Event | None = None,
+) -> t.Iterator[Path]:
+    for name, is_dir, _ in _listing(directory, cancelled=cancelled):
+        if not dir_only or is_dir:
+            yield directory / name
+
+
 def _match_stem(incomplete: str) -> t.Callable[[Path], bool]:
     return lambda p: p.stem.lower().startswith(incomplete.lower())
 
@@ -85,13 +171,14 @@ def _paths_from_incomplete(
         yield from _stem_in_current_dir(incomplete, iterator)
 
 
-def _yield_paths(incomplete: str, dir_only: bool = False) -> t.Iterator[Path]:
-    if not dir_only:
-        yield from _paths_from_incomplete(incomplete, lambda p: p.iterdir())
-    else:
-        yield from _paths_from_incomplete(
-            incomplete, lambda p: filter(lambda p: p.is_dir(), p.iterdir())
-        )
+def _yield_paths(
+    incomplete: str,
+    dir_only: bool = False,
+    cancelled: threading.Event | None = None,
+) -> t.Iterator[Path]:
+    yield from _paths_from_incomplete(
+        incomplete, partial(_iterdir, dir_only=dir_only, cancelled=cancelled)
+    )
 
 
 def _is_link(path: Path) -> bool:
@@ -113,8 +200,8 @@ def _path_str_contents(path: Path) -> FormattedText:
             contents.extend([("#81beb1", f"{path.name} -> {full_path}")])
 
         if path.is_dir():
-            for sub in path.iterdir():
-                contents.extend([("#7f9fcf", sub.name), ("bold #000000", " | ")])
+            for name, _, _ in _listing(path, limit=MAX_META_ENTRIES):
+                contents.extend([("#7f9fcf", name), ("bold #000000", " | ")])
 
     return FormattedText(contents)
 
@@ -173,7 +260,12 @@ class PathCompleter(Completer):
             if not document.text:
                 yield from []
 
-            for path in _yield_paths(alter_str(word_before_cursor, strip_quotes=True)):
+            cancelled = _cancel_active_scan()
+            for path in _yield_paths(
+                alter_str(word_before_cursor, strip_quotes=True), cancelled=cancelled
+            ):
+                if cancelled.is_set():
+                    return
                 value = path.expanduser().as_posix()
                 if " " in value:
                     value = value.replace(" ", r"\ ")
@@ -182,7 +274,8 @@ class PathCompleter(Completer):
                     text=value,
                     start_position=start_position,
                     display=self._display(value, console_width),
-                    display_meta=_path_str_contents(path),
+                    # Only rendered for the rows visible in the completion menu.
+                    display_meta=partial(_path_str_contents, path),
                     style="cyan",
                 )
         except Exception:
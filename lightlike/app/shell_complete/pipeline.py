@@ -0,0 +1,123 @@
+import contextvars
+import queue
+import threading
+import typing as t
+from collections import Counter, defaultdict, deque
+from time import monotonic, perf_counter_ns
+
+from prompt_toolkit.completion import Completer, Completion
+
+from lightlike.internal import appdir
+
+if t.TYPE_CHECKING:
+    from prompt_toolkit.completion import CompleteEvent
+    from prompt_toolkit.document import Document
+
+__all__: t.Sequence[str] = ("CompletionPipeline",)
+
+
+LATENCY_SAMPLES: t.Final[int] = 1000
+
+
+class CompletionPipeline(Completer):
+    """
+    Runs several completers concurrently and streams their results as they arrive.
+
+    Each call supersedes the previous one, completers still running for an earlier
+    document stop at their next result. Completers that haven't finished within
+    `budget` seconds are cancelled and their remaining results dropped.
+    Latency of each completed run is recorded per completer.
+    """
+
+    def __init__(
+        self,
+        completers: t.Mapping[str, Completer] | None = None,
+        budget: float = 1.0,
+    ) -> None:
+        self.completers: dict[str, Completer] = dict(completers or {})
+        self.budget = budget
+        self.latencies: defaultdict[str, deque[int]] = defaultdict(
+            lambda: deque(maxlen=LATENCY_SAMPLES)
+        )
+        self.timeouts: Counter[str] = Counter()
+        self._active: threading.Event | None = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def get_completions(
+        self, document: "Document", complete_event: "CompleteEvent"
+    ) -> t.Iterator[Completion]:
+        cancelled: threading.Event = self._supersede()
+        results: queue.SimpleQueue[tuple[str, Completion | None]] = queue.SimpleQueue()
+        completers: dict[str, Completer] = self.completers.copy()
+
+        for name, completer in completers.items():
+            # Completers call get_app(), which relies on the context of the prompt thread.
+            context: contextvars.Context = contextvars.copy_context()
+            threading.Thread(
+                target=context.run,
+                args=(self._run, name, completer, document, complete_event),
+                kwargs=dict(cancelled=cancelled, results=results),
+                daemon=True,
+            ).start()
+
+        pending: set[str] = set(completers)
+        deadline: float = monotonic() + self.budget
+        try:
+            while pending and not cancelled.is_set():
+                remaining: float = deadline - monotonic()
+                if remaining <= 0:
+                    self.timeouts.update(pending)
+                    break
+                try:
+                    name, completion = results.get(timeout=remaining)
+                except queue.Empty:
+                    continue
+                if completion is None:
+                    pending.discard(name)
+                else:
+                    yield completion
+        finally:
+            cancelled.set()
+
+    def _supersede(self) -> threading.Event:
+        cancelled = threading.Event()
+        with self._lock:
+            if self._active is not None:
+                self._active.set()
+            self._active = cancelled
+        return cancelled
+
+    def _run(
+        self,
+        name: str,
+        completer: Completer,
+        document: "Document",
+        complete_event: "CompleteEvent",
+        cancelled: threading.Event,
+        results: "queue.SimpleQueue[tuple[str, Completion | None]]",
+    ) -> None:
+        start: int = perf_counter_ns()
+        try:
+            for completion in completer.get_completions(document, complete_event):
+                if cancelled.is_set():
+                    return
+                results.put((name, completion))
+            self.latencies[name].append(perf_counter_ns() - start)
+        except Exception as error:
+            appdir.log().error(f"Completer {name} failed: {error}")
+        finally:
+            results.put((name, None))
+
+    def percentiles(self) -> dict[str, tuple[int, int, int]]:
+        """(count, p50, p99) of completed runs in nanoseconds, per completer."""
+        stats: dict[str, tuple[int, int, int]] = {}
+        for name, samples in list(self.latencies.items()):
+            ordered: list[int] = sorted(samples)
+            if not ordered:
+                continue
+            stats[name] = (
+                len(ordered),
+                ordered[int(len(ordered) * 0.5)],
+                ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+            )
+        return stats
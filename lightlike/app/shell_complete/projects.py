@@ -4,11 +4,11 @@ from pathlib import Path
 import click
 import rtoml
 from click.shell_completion import CompletionItem
-from fuzzyfinder import fuzzyfinder
 from prompt_toolkit.completion import Completer, Completion
 
+from lightlike.app.shell_complete.fuzzy import FuzzyIndex, appdata_index
 from lightlike.internal import appdir
-from lightlike.internal.utils import match_str, print_message_and_clear_buffer
+from lightlike.internal.utils import alter_str, print_message_and_clear_buffer
 
 if t.TYPE_CHECKING:
     from prompt_toolkit.completion import CompleteEvent
@@ -51,32 +51,40 @@ class Projects(Completer):
 
     @property
     def completion_items(self) -> list[CompletionItem]:
-        completion_items: list[CompletionItem] = []
-        for project in self.projects.values():
-            completion_items.append(
-                CompletionItem(
-                    value=project.get("name"),
-                    help=project.get("meta"),
-                    created=project.get("created"),
+        return self.index.items.copy()
+
+    @property
+    def index(self) -> FuzzyIndex[CompletionItem]:
+        # Matches on name or meta.
+        def build(data: dict[str, t.Any]) -> FuzzyIndex[CompletionItem]:
+            completion_items: list[CompletionItem] = []
+            for project in data.get(self.list_, {}).values():
+                completion_items.append(
+                    CompletionItem(
+                        value=project.get("name"),
+                        help=project.get("meta"),
+                        created=project.get("created"),
+                    )
                 )
-            )
-        return completion_items
+            keys: list[str] = [
+                f"{item.value} {item.help or ''}" for item in completion_items
+            ]
+            return FuzzyIndex(completion_items, keys)
+
+        return appdata_index(("projects", self.list_), build, self.path)
+
+    def search(self, incomplete: str) -> list[CompletionItem]:
+        return self.index.search(alter_str(incomplete, strip_quotes=True))
 
     def get_completions(
         self, document: "Document", complete_event: "CompleteEvent"
     ) -> t.Iterator[Completion]:
-
-        matches: list[str] = fuzzyfinder(
-            document.text,
-            self.names,
-            sort_results=False,
-        )
-        for match in matches:
+        for item in self.search(document.text):
             yield Completion(
-                text=match,
+                text=item.value,
                 start_position=-len(document.text_before_cursor),
-                display=match,
-                display_meta=self.projects[match].get("meta"),
+                display=item.value,
+                display_meta=item.help,
             )
 
 
@@ -90,12 +98,6 @@ class Archived(Projects):
         super().__init__(list_="archived")
 
 
-def _matches_name_or_help(incomplete: str, item: CompletionItem) -> bool:
-    match_value = match_str(incomplete, item.value, strip_quotes=True)
-    match_help = match_str(incomplete, item.help, strip_quotes=True)
-    return match_value or match_help
-
-
 def _item_not_in_parent_args(
     item: CompletionItem,
     ctx: click.Context,
@@ -117,6 +119,13 @@ def _sorted_by_created(completions: list[CompletionItem]) -> list[CompletionItem
     )
 
 
+def _search(incomplete: str, completers: t.Sequence[Projects]) -> list[CompletionItem]:
+    matches: list[CompletionItem] = []
+    for completer in completers:
+        matches.extend(completer.search(incomplete))
+    return matches
+
+
 def from_argument(
     ctx: click.Context, param: click.Parameter, incomplete: str
 ) -> list[CompletionItem]:
@@ -127,34 +136,27 @@ def from_argument(
 
     if param.type.name == "ActiveProject":
         completer: Projects = Projects(list_="ACTIVE")
-        completion_items = completer.completion_items
+        completers = [completer]
     elif param.type.name == "ArchivedProject":
         completer = Projects(list_="ARCHIVED")
-        completion_items = completer.completion_items
+        completers = [completer]
     else:
-        completion_items = (
-            Projects(list_="ACTIVE").completion_items
-            + Projects(list_="ARCHIVED").completion_items
-        )
+        completers = [Projects(list_="ACTIVE"), Projects(list_="ARCHIVED")]
 
-    if not completion_items:
+    if not any(len(c.index) for c in completers):
         print_message_and_clear_buffer(
             f"{completer.list_} projects list is empty.",
         )
         return completions
 
     if param.nargs == -1:
-        for item in completion_items:
-            if not _matches_name_or_help(incomplete, item):
-                continue
+        for item in _search(incomplete, completers):
             if _item_not_in_parent_args(item, ctx, param, True):
                 completions.append(item)
         return _sorted_by_created(completions)
 
     elif not ctx.params.get("project") and not ctx.params.get("projects"):
-        for item in completion_items:
-            if not _matches_name_or_help(incomplete, item):
-                continue
+        for item in _search(incomplete, completers):
             if _item_not_in_parent_args(item, ctx, param, True):
                 completions.append(item)
 
@@ -172,25 +174,20 @@ def from_option(
 
     if param.type.name == "ActiveProject":
         completer: Projects = Projects(list_="ACTIVE")
-        completion_items = Projects(list_="ACTIVE").completion_items
+        completers = [completer]
     elif param.type.name == "ArchivedProject":
         completer = Projects(list_="ARCHIVED")
-        completion_items = Projects(list_="ARCHIVED").completion_items
+        completers = [completer]
     else:
-        completion_items = (
-            Projects(list_="ACTIVE").completion_items
-            + Projects(list_="ARCHIVED").completion_items
-        )
+        completers = [Projects(list_="ACTIVE"), Projects(list_="ARCHIVED")]
 
-    if not completion_items:
+    if not any(len(c.index) for c in completers):
         print_message_and_clear_buffer(
             f"{completer.list_} projects list is empty.",
         )
         return []
 
-    for item in completion_items:
-        if not _matches_name_or_help(incomplete, item):
-            continue
+    for item in _search(incomplete, completers):
         if _item_not_in_parent_args(item, ctx, param, True):
             completions.append(item)
 
@@ -204,9 +201,7 @@ def from_chained_cmd(
 ) -> list[CompletionItem]:
     completions: list[CompletionItem] = []
 
-    for item in Active().completion_items:
-        if not _matches_name_or_help(incomplete, item):
-            continue
+    for item in Active().search(incomplete):
         if _item_not_in_parent_args(item, ctx, param, True):
             completions.append(item)
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import typing as t
+from collections import OrderedDict
 from operator import truth
 
 import click
@@ -31,8 +32,14 @@ class ReplCompleter(Completer):
         "parsed_args",
         "parsed_ctx",
         "ctx_command",
+        "uncaught_exceptions_callable",
+        "_contexts",
+        "_subcommands",
+        "_shell_completions",
     )
 
+    max_cached_contexts: int = 64
+
     def __init__(
         self,
         cli: click.Group,
@@ -45,6 +52,56 @@ class ReplCompleter(Completer):
         self.parsed_ctx: click.Context = ctx
         self.ctx_command: click.Command = ctx.command
         self.uncaught_exceptions_callable = uncaught_exceptions_callable
+        # Resolved contexts keyed by the completed tokens before the cursor,
+        # so typing within one token or backspacing into a previous one does not re-parse.
+        self._contexts: OrderedDict[tuple[str, ...], click.Context] = OrderedDict()
+        # Visible subcommands of each group, lazy commands are only loaded once.
+        self._subcommands: dict[click.Group, list[tuple[str, click.Command]]] = {}
+        # Param.shell_complete results for the current token prefix,
+        # keyed by (command, param, incomplete). Cleared when the completed tokens change.
+        self._shell_completions: dict[
+            tuple[click.Command, click.Parameter, str], list[CompletionItem]
+        ] = {}
+
+    def _resolve(self, args: list[str]) -> click.Context:
+        key: tuple[str, ...] = tuple(args)
+        if (ctx := self._contexts.get(key)) is not None:
+            self._contexts.move_to_end(key)
+            return ctx
+
+        ctx = _resolve_context(args, self.ctx)
+        self._contexts[key] = ctx
+        while len(self._contexts) > self.max_cached_contexts:
+            self._contexts.popitem(last=False)
+        return ctx
+
+    def _list_subcommands(
+        self, group: click.Group, ctx: click.Context
+    ) -> list[tuple[str, click.Command]]:
+        if (subcommands := self._subcommands.get(group)) is not None:
+            return subcommands
+
+        subcommands = []
+        for cmd_name in group.list_commands(ctx):
+            command: click.Command | None = group.get_command(ctx, cmd_name)
+            if not command or getattr(command, "hidden", False):
+                continue
+            subcommands.append((cmd_name, command))
+
+        self._subcommands[group] = subcommands
+        return subcommands
+
+    def _shell_complete(
+        self,
+        autocomplete_ctx: click.Context,
+        param: click.Parameter,
+        incomplete: str,
+    ) -> list[CompletionItem]:
+        key = (autocomplete_ctx.command, param, incomplete)
+        if (autocompletions := self._shell_completions.get(key)) is None:
+            autocompletions = param.shell_complete(autocomplete_ctx, incomplete)
+            self._shell_completions[key] = autocompletions
+        return autocompletions
 
     def _complete_functions(
         self,
@@ -53,8 +110,8 @@ class ReplCompleter(Completer):
         incomplete: str,
     ) -> list[Completion]:
         param_choices: list[Completion] = []
-        autocompletions: list[CompletionItem] = param.shell_complete(
-            autocomplete_ctx, incomplete
+        autocompletions: list[CompletionItem] = self._shell_complete(
+            autocomplete_ctx, param, incomplete
         )
 
         document: "Document" = get_app().current_buffer.document
@@ -188,9 +245,10 @@ class ReplCompleter(Completer):
 
             if self.parsed_args != args:
                 self.parsed_args = args
+                self._shell_completions.clear()
 
                 try:
-                    self.parsed_ctx = _resolve_context(args, self.ctx)
+                    self.parsed_ctx = self._resolve(args)
                 except Exception:
                     yield from []
                 finally:
@@ -206,13 +264,9 @@ class ReplCompleter(Completer):
             )
 
             if isinstance(self.ctx_command, click.Group):
-                for cmd_name in self.ctx_command.list_commands(self.parsed_ctx):
-                    command: click.Command | None = None
-                    command = self.ctx_command.get_command(self.parsed_ctx, cmd_name)
-
-                    if not command or getattr(command, "hidden", False):
-                        continue
-
+                for cmd_name, command in self._list_subcommands(
+                    self.ctx_command, self.parsed_ctx
+                ):
                     if self.ctx_command.chain is True:
                         if (
                             cmd_name.startswith(args[-1])
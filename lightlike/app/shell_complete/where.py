@@ -1,5 +1,7 @@
 import re
 import typing as t
+from bisect import bisect_left
+from functools import cached_property
 from inspect import cleandoc
 
 from prompt_toolkit.completion import (
@@ -11,23 +13,24 @@ from prompt_toolkit.completion import (
 from prompt_toolkit.document import Document
 
 from lightlike.app import shell_complete
-from lightlike.client import CliQueryRoutines
+from lightlike.app.shell_complete.fuzzy import appdata_index
 from lightlike.internal import utils
 
 if t.TYPE_CHECKING:
     from prompt_toolkit.completion import CompleteEvent
     from rich.console import Console
 
+    from lightlike.client import CliQueryRoutines
+
 __all__: t.Sequence[str] = ("completer", "_bottom_toolbar", "_parse_click_options")
 
 
 def completer(schema: str, table: str) -> ThreadedCompleter:
-    from lightlike.cmd.query.completers import LoopNestedCompleter
-    from lightlike.cmd.query.words import KEYWORD_META, SQL_KEYWORDS
+    from lightlike.cmd.query.completers import SQL_KEYWORD_COMPLETER
 
     completers = [
         WhereClauseCompleter(schema=schema, table=table),
-        LoopNestedCompleter.from_nested_dict(SQL_KEYWORDS, KEYWORD_META),
+        SQL_KEYWORD_COMPLETER,
     ]
 
     return ThreadedCompleter(merge_completers(completers, deduplicate=True))
@@ -56,9 +59,27 @@ class WhereClauseCompleter(WordCompleter):
 
     def __init__(self, schema: str, table: str) -> None:
         super().__init__([], WORD=True)
-        self.resource_id = f"{CliQueryRoutines()._client().project}.{schema}.{table}"
-        self.projects = shell_complete.projects.Active().names
-        self.notes = shell_complete.notes.Notes().get_all()
+        self.schema = schema
+        self.table = table
+
+    @cached_property
+    def resource_id(self) -> str:
+        from lightlike.client import CliQueryRoutines
+
+        return f"{CliQueryRoutines()._client().project}.{self.schema}.{self.table}"
+
+    @property
+    def projects(self) -> list[str]:
+        return [item.value for item in shell_complete.projects.Active().index.items]
+
+    def notes(self, project: str) -> list[str]:
+        # Sorted notes of a single project, only built once the project appears
+        # in the document, and rebuilt when the appdata file changes.
+        def build(data: dict[str, t.Any]) -> list[str]:
+            project_notes = data.get("active", {}).get(project) or {}
+            return sorted(project_notes.get("notes", []))
+
+        return appdata_index(("where-notes", project), build)
 
     def get_completions(
         self, document: Document, complete_event: "CompleteEvent"
@@ -106,16 +127,19 @@ class WhereClauseCompleter(WordCompleter):
     def _note_items(
         self, project: str, word_before_cursor: str
     ) -> t.Iterable[Completion]:
-        for note in self.notes[project]:
-            if note.startswith(word_before_cursor):
-                yield Completion(
-                    text=f"{note}",
-                    display=f"{note[:45]}..." if len(note) > 45 else f"{note}",
-                    start_position=-len(word_before_cursor),
-                    display_meta=f"NOTE:{project}",
-                    style="#239551",
-                    selected_style="reverse",
-                )
+        notes: list[str] = self.notes(project)
+        for idx in range(bisect_left(notes, word_before_cursor), len(notes)):
+            note: str = notes[idx]
+            if not note.startswith(word_before_cursor):
+                break
+            yield Completion(
+                text=f"{note}",
+                display=f"{note[:45]}..." if len(note) > 45 else f"{note}",
+                start_position=-len(word_before_cursor),
+                display_meta=f"NOTE:{project}",
+                style="#239551",
+                selected_style="reverse",
+            )
 
 
 def _bottom_toolbar(console: "Console") -> t.Callable[..., list[tuple[str, str]]]:
@@ -164,7 +188,7 @@ def _parse_click_options(
     flag: bool,
     args: t.Sequence[str] | None,
     console: "Console",
-    routine: CliQueryRoutines,
+    routine: "CliQueryRoutines",
 ) -> str:
     clause: str | None = None
 
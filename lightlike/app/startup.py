@@ -0,0 +1,80 @@
+import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+from lightlike.internal import profile
+
+__all__: t.Sequence[str] = ("StartupGraph",)
+
+
+class _Step(t.NamedTuple):
+    name: str
+    fn: t.Callable[[], t.Any]
+    requires: tuple[str, ...]
+    main_thread: bool
+
+
+class StartupGraph:
+    """
+    Startup steps and the steps each one requires.
+
+    Steps run in worker threads as soon as their requirements finish, unless they
+    have to run on the main thread, e.g. because they may prompt the user.
+    Steps must be added after the steps they require, so the order they're added in
+    is always a valid order to run them in. Each step is recorded in the startup profile.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self.max_workers = max_workers
+        self.steps: dict[str, _Step] = {}
+        self.results: dict[str, t.Any] = {}
+
+    def add(
+        self,
+        name: str,
+        fn: t.Callable[[], t.Any],
+        requires: t.Sequence[str] = (),
+        main_thread: bool = False,
+    ) -> None:
+        if name in self.steps:
+            raise ValueError(f"Startup step {name} already exists.")
+        if missing := [r for r in requires if r not in self.steps]:
+            raise ValueError(f"Startup step {name} requires unknown steps {missing}.")
+        self.steps[name] = _Step(name, fn, tuple(requires), main_thread)
+
+    def run(self) -> None:
+        futures: dict[str, Future[t.Any]] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="startup"
+        ) as executor:
+            for step in self.steps.values():
+                if step.main_thread:
+                    futures[step.name] = Future()
+                else:
+                    requires = [futures[r] for r in step.requires]
+                    futures[step.name] = executor.submit(self._run, step, requires)
+
+            for step in self.steps.values():
+                if step.main_thread:
+                    future = futures[step.name]
+                    try:
+                        requires = [futures[r] for r in step.requires]
+                        future.set_result(self._run(step, requires))
+                    except BaseException as error:
+                        future.set_exception(error)
+
+            wait(futures.values())
+
+        for name, future in futures.items():
+            if exc := future.exception():
+                raise exc
+            self.results[name] = future.result()
+
+    @staticmethod
+    def _run(step: _Step, requires: list[Future[t.Any]]) -> t.Any:
+        # Workers only wait on steps added before their own, which are either
+        # running or finished by the time a worker picks this step up.
+        for future in requires:
+            future.result()
+        with profile.phase(step.name):
+            return step.fn()
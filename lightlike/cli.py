@@ -23,20 +23,45 @@
 # ruff: noqa: E402
 
 import sys
+
+from lightlike.internal import profile
+
+if profile.FLAG in sys.argv:
+    sys.argv.remove(profile.FLAG)
+    profile.enable()
+
+from lightlike.app import daemon
+
+if daemon.FLAG in sys.argv:
+    sys.argv.remove(daemon.FLAG)
+    daemon.enable_headless()
+elif len(sys.argv) > 1 and not profile.enabled():
+    # If a REPL or headless daemon is running, the command runs there instead.
+    if (exit_code := daemon.forward(sys.argv[1:])) is not None:
+        sys.exit(exit_code)
+
+import asyncio
 import typing as t
 import warnings
 from functools import partial
+from importlib import import_module
 
 import click
 import rtoml
 from fasteners import InterProcessLock, try_lock
-from prompt_toolkit.cursor_shapes import CursorShape
-from prompt_toolkit.styles import Style
 from pytz_deprecation_shim._exceptions import PytzUsageWarning
 from rich import get_console
-from rich.traceback import install
 
-install(suppress=[click])
+
+def _install_traceback(*args: t.Any) -> None:
+    # rich.traceback is slow to import, install it the first time it's needed.
+    from rich.traceback import install
+
+    install(suppress=[click])
+    sys.excepthook(*args)
+
+
+sys.excepthook = _install_traceback
 warnings.filterwarnings("ignore", category=PytzUsageWarning)
 
 from lightlike import _console
@@ -55,6 +80,10 @@ from lightlike.app import render
 from lightlike.app.core import LazyAliasedGroup
 from lightlike.internal import appdir, constant, utils
 
+if t.TYPE_CHECKING:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.history import History
+
 __all__: t.Sequence[str] = ("main",)
 
 
@@ -62,6 +91,7 @@ LOCK: InterProcessLock = InterProcessLock(__lock__, logger=appdir.log())
 
 
 def main() -> None:
+    profile.mark("import lightlike.cli")
     _check_lock(LOCK)
     _console.if_not_quiet_start(render.cli_info)()
     log_error: partial[None] = partial(
@@ -69,7 +99,8 @@ def main() -> None:
     )
 
     try:
-        appdir.validate(__version__, __config__)
+        with profile.phase("validate appdir"):
+            appdir.validate(__version__, __config__)
     except Exception as error:
         log_error(error)
         sys.exit(2)
@@ -79,12 +110,25 @@ def main() -> None:
     except Exception as error:
         log_error(error)
     finally:
-        if len(sys.argv) > 1:
+        # The REPL checks through a scheduled job. One-shot commands only check
+        # if enabled, since the check blocks on an HTTP request before exiting.
+        if _is_one_shot() and _release_check_enabled():
             from lightlike.cmd.scheduler.jobs import check_latest_release
 
             check_latest_release(__version__, __repo__)
 
 
+def _is_one_shot() -> bool:
+    # A command was passed on the command line, the REPL won't start.
+    return len(sys.argv) > 1
+
+
+def _release_check_enabled() -> bool:
+    from lightlike.app.config import AppConfig
+
+    return AppConfig().get("settings", "one-shot-release-check", default=False)
+
+
 def build_cli(
     name: str,
     repl_kwargs: dict[str, t.Any],
@@ -107,9 +151,16 @@ def build_cli(
         ctx.obj = obj or {}
 
         if ctx.invoked_subcommand is None:
+            if daemon.serving():
+                ctx.fail("Missing command, the REPL can't start from the daemon.")
             _console.if_not_quiet_start(get_console().log)("Starting REPL")
             from lightlike.app._repl import repl
 
+            if "prompt_kwargs" not in repl_kwargs:
+                # Arguments that aren't a command still start the REPL,
+                # but startup skipped its setup since they looked like one.
+                repl_kwargs.update(_build_repl_kwargs())
+
             repl(ctx=ctx, **repl_kwargs)
             if call_on_close and callable(call_on_close):
                 call_on_close(ctx)
@@ -118,20 +169,123 @@ def build_cli(
 
 
 def run_cli(name: str = "lightlike") -> None:
-    from lightlike.app.config import AppConfig  # isort: split
-    from lightlike.app import call_on_close, cursor, dates, shell_complete
-    from lightlike.app.cache import TimeEntryCache
+    with profile.phase("import app modules"):
+        from lightlike.app.config import AppConfig  # isort: split
+        from lightlike.app import call_on_close, dates
+        from lightlike.app.startup import StartupGraph
+        from lightlike.client import get_client
+        from lightlike.scheduler import get_scheduler
+
+    _console.reconfigure(get_datetime=partial(dates.now, tzinfo=AppConfig().tzinfo))
+
+    one_shot: bool = _is_one_shot()
+    headless: bool = daemon.headless()
+
+    startup = StartupGraph()
+    startup.add("validate cache", _validate_cache)
+    startup.add(
+        "add to path", partial(_add_to_path, AppConfig().get("cli", "add-to-path"))
+    )
+    repl_kwargs: dict[str, t.Any] = {}
+    if not one_shot and not headless:
+        # Prompt styles, key bindings and history are only for the REPL.
+        with profile.phase("build repl kwargs"):
+            repl_kwargs = _build_repl_kwargs()
+        history: "History" = repl_kwargs["prompt_kwargs"]["history"]
+        startup.add("load history", partial(_load_history, history))
+    if not one_shot:
+        # One-shot commands build the scheduler when they use it.
+        startup.add("build scheduler", get_scheduler)
+    # Overlaps the bigquery import with the password prompt, if there is one.
+    startup.add("import bigquery", partial(import_module, "google.cloud.bigquery"))
+    # May prompt for a password, so it stays on the main thread.
+    startup.add("authorize client", get_client, main_thread=True)
+    startup.add(
+        "build cli",
+        lambda: build_cli(
+            name=name,
+            help=__cli_help__,
+            repl_kwargs=repl_kwargs,
+            lazy_subcommands=_build_lazy_subcommands(
+                config=AppConfig().get("cli", "commands", default={})
+            ),
+            context_settings=dict(
+                allow_extra_args=True,
+                ignore_unknown_options=True,
+                help_option_names=["-h", "--help"],
+            ),
+            call_on_close=call_on_close,
+            obj={"get_scheduler": get_scheduler},
+        ),
+    )
+    startup.run()
+    cli: LazyAliasedGroup = startup.results["build cli"]
+
+    if (
+        not one_shot
+        and not headless
+        and AppConfig().get("settings", "update-terminal-title", default=True)
+    ):
+        get_console().set_window_title(__appname_sc__)
+
+    # If no invoked subcommand, cli is launched through REPL,
+    # Don't show cli name in help/usage contexts.
+    prog_name: str = name if one_shot else ""
+
+    if headless:
+        with LOCK:
+            _serve_headless(cli, name)
+        return
+
+    if not one_shot and AppConfig().get("settings", "daemon", "enabled", default=False):
+        if daemon.DaemonServer(cli, prog_name=name).start():
+            repl_kwargs["invoke_lock"] = daemon.EXECUTION_LOCK
+
+    with LOCK:
+        cli(prog_name=prog_name)
+
+
+def _serve_headless(cli: LazyAliasedGroup, name: str) -> None:
+    from lightlike.app import call_on_close
+    from lightlike.scheduler import create_or_replace_default_jobs, get_scheduler
+
+    server = daemon.DaemonServer(cli, prog_name=name)
+    if not daemon.supported():
+        get_console().print("Unix domain sockets are not supported on this platform.")
+        sys.exit(1)
+    if daemon.listening():
+        get_console().print(f"A daemon is already listening on {daemon.SOCKET_PATH}.")
+        sys.exit(1)
+
+    get_scheduler().start()
+    create_or_replace_default_jobs(
+        path_to_jobs=appdir.SCHEDULER_CONFIG, keys=["jobs", "default"]
+    )
+    get_console().log(f"Listening on {daemon.SOCKET_PATH}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        call_on_close()
+
+
+def _build_repl_kwargs() -> dict[str, t.Any]:
+    from prompt_toolkit.cursor_shapes import CursorShape
+    from prompt_toolkit.styles import Style
+
+    from lightlike.app import cursor, shell_complete
+    from lightlike.app.config import AppConfig
     from lightlike.app.core import _format_click_exception
     from lightlike.app.keybinds import PROMPT_BINDINGS
-    from lightlike.client import get_client
     from lightlike.scheduler import create_or_replace_default_jobs, get_scheduler
 
-    _console.reconfigure(get_datetime=partial(dates.now, tzinfo=AppConfig().tzinfo))
-
+    history: "History" = appdir.REPL_FILE_HISTORY()
     repl_kwargs: dict[str, t.Any] = dict(
         prompt_kwargs=dict(
             message=cursor.build,
-            history=appdir.REPL_FILE_HISTORY(),
+            history=history,
             bottom_toolbar=cursor.bottom_toolbar,
             rprompt=cursor.rprompt,
             style=Style.from_dict(
@@ -142,7 +296,7 @@ def run_cli(name: str = "lightlike") -> None:
             ),
             cursor=CursorShape.BLOCK,
             key_bindings=PROMPT_BINDINGS,
-            refresh_interval=1,
+            refresh_interval=0,
             complete_in_thread=True,
             complete_while_typing=True,
             validate_while_typing=True,
@@ -171,40 +325,35 @@ def run_cli(name: str = "lightlike") -> None:
             path_to_jobs=appdir.SCHEDULER_CONFIG,
             keys=["jobs", "default"],
         ),
+        session_callable=_on_session_created,
     )
+    return repl_kwargs
+
+
+def _validate_cache() -> None:
+    from lightlike.app.cache import TimeEntryCache
 
     _console.if_not_quiet_start(get_console().log)("Validating cache")
     TimeEntryCache().validate()
 
-    _add_to_path(paths=AppConfig().get("cli", "add-to-path"))
 
-    get_client()
+def _load_history(history: "History") -> None:
+    # Start reading the history file now, instead of when the first prompt starts.
+    async def drain() -> None:
+        async for _ in history.load():
+            pass
 
-    cli: LazyAliasedGroup = build_cli(
-        name=name,
-        help=__cli_help__,
-        repl_kwargs=repl_kwargs,
-        lazy_subcommands=_build_lazy_subcommands(
-            config=AppConfig().get("cli", "commands", default={})
-        ),
-        context_settings=dict(
-            allow_extra_args=True,
-            ignore_unknown_options=True,
-            help_option_names=["-h", "--help"],
-        ),
-        call_on_close=call_on_close,
-        obj={"get_scheduler": get_scheduler},
-    )
+    asyncio.run(drain())
 
-    if AppConfig().get("settings", "update-terminal-title", default=True):
-        get_console().set_window_title(__appname_sc__)
 
-    # If no invoked subcommand, cli is launched through REPL,
-    # Don't show cli name in help/usage contexts.
-    prog_name: str = "" if len(sys.argv) == 1 else name
+def _on_session_created(session: "PromptSession[str]") -> None:
+    from lightlike.app import cursor
+    from lightlike.app.refresh import RefreshScheduler
 
-    with LOCK:
-        cli(prog_name=prog_name)
+    RefreshScheduler(cursor.refresh_resolution).attach(session.app)
+    session.app.pre_run_callables.append(
+        partial(profile.report, label="time to first prompt")
+    )
 
 
 def _check_lock(lock: InterProcessLock) -> None | t.NoReturn:
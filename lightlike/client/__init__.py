@@ -1,4 +1,4 @@
-from typing import Sequence
+from typing import TYPE_CHECKING, Any, Sequence
 
 from lightlike.client._credentials import (
     _get_credentials_from_config,
@@ -10,7 +10,9 @@ from lightlike.client.bigquery import (
     provision_bigquery_resources,
     reconfigure,
 )
-from lightlike.client.routines import CliQueryRoutines
+
+if TYPE_CHECKING:
+    from lightlike.client.routines import CliQueryRoutines
 
 __all__: Sequence[str] = (
     "_Auth",
@@ -22,3 +24,12 @@ __all__: Sequence[str] = (
     "reconfigure",
     "service_account_key_flow",
 )
+
+
+def __getattr__(name: str) -> Any:
+    # The routines import google-cloud-bigquery, load them on first use.
+    if name == "CliQueryRoutines":
+        from lightlike.client.routines import CliQueryRoutines
+
+        return CliQueryRoutines
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,16 +5,16 @@ from functools import partial
 
 import google.auth
 import google.auth.credentials
-from google.cloud import bigquery
-from google.oauth2 import service_account
 from rich import get_console, print
 from rich.console import Console, NewLine
 
 from lightlike.app import _questionary
 from lightlike.app.config import AppConfig
-from lightlike.client.auth import AuthPromptSession, _Auth
+from lightlike.client._tokens import TOKEN_CACHE
+from lightlike.client.auth import SESSION_KEY_CACHE, AuthPromptSession, _Auth
 from lightlike.internal import markup
 from lightlike.internal.enums import CredentialsSource
+from lightlike.internal.lazy import lazy_import
 
 if t.TYPE_CHECKING:
     from google.cloud.bigquery.client import Project
@@ -26,6 +26,10 @@ __all__: t.Sequence[str] = (
 )
 
 
+bigquery = lazy_import("google.cloud.bigquery")
+service_account = lazy_import("google.oauth2.service_account")
+
+
 def _get_credentials_from_config(
     appconfig: AppConfig,
     prompt_for_project: bool = True,
@@ -40,6 +44,9 @@ def _get_credentials_from_config(
     match credentials_source:
         case CredentialsSource.from_service_account_key:
             encrypted_key, salt = service_account_key_flow(appconfig)
+            if not appconfig.session_key_ttl:
+                # Don't leave a key behind once the session cache is turned off.
+                SESSION_KEY_CACHE.clear()
 
             service_account_info: dict[str, t.Any] = json.loads(
                 AuthPromptSession().decrypt_key(
@@ -52,6 +59,7 @@ def _get_credentials_from_config(
                         password="null",
                         stay_logged_in=False,
                     ),
+                    session_key_ttl=appconfig.session_key_ttl,
                 )
             )
 
@@ -99,7 +107,7 @@ def _get_credentials_from_config(
 
             return _get_credentials_from_config(appconfig, prompt_for_project)
 
-    return credentials
+    return TOKEN_CACHE.attach(credentials, bigquery.Client.SCOPE)
 
 
 def service_account_key_flow(appconfig: AppConfig) -> tuple[bytes, bytes]:
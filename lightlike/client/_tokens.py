@@ -0,0 +1,169 @@
+import json
+import threading
+import typing as t
+from base64 import urlsafe_b64encode
+from datetime import datetime
+from hashlib import sha256
+from pathlib import Path
+
+import google.auth.credentials
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from lightlike.internal import appdir, utils
+from lightlike.internal.lazy import lazy_import
+
+if t.TYPE_CHECKING:
+    from google.auth.transport import Request
+
+__all__: t.Sequence[str] = ("TokenCache", "TOKEN_CACHE")
+
+
+service_account = lazy_import("google.oauth2.service_account")
+user_credentials = lazy_import("google.oauth2.credentials")
+
+
+class _Entry(t.NamedTuple):
+    id: str
+    fernet: Fernet
+
+
+class TokenCache:
+    """
+    Access tokens saved across runs, so a new process can call the api without
+    refreshing its credentials first.
+
+    Tokens are encrypted with a key derived from the secret the credentials refresh
+    with, the service-account's private key or the user's refresh token. Reading a
+    saved token takes the same secret as requesting a new one. Credentials without
+    such a secret, e.g. from the metadata server, aren't cached.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock: threading.Lock = threading.Lock()
+
+    def attach(
+        self,
+        credentials: google.auth.credentials.Credentials,
+        scopes: t.Sequence[str],
+    ) -> google.auth.credentials.Credentials:
+        """
+        Scope the credentials, restore their saved token if it's still valid,
+        and save each token they refresh.
+
+        Tokens are refreshed in the background once they're close to expiring,
+        requests keep using the current token until the new one arrives.
+        """
+        credentials = google.auth.credentials.with_scopes_if_required(
+            credentials, scopes
+        )
+        try:
+            entry: _Entry | None = _entry_for(credentials)
+        except Exception as error:
+            appdir.log().error(f"Failed to derive token cache key: {error}")
+            return credentials
+        if entry is None:
+            return credentials
+
+        self._restore(credentials, entry)
+
+        refresh: t.Callable[["Request"], None] = credentials.refresh
+
+        def refresh_and_save(request: "Request") -> None:
+            refresh(request)
+            self._save(credentials, entry)
+
+        # Also called from google-auth's background refresh thread.
+        credentials.refresh = refresh_and_save  # type: ignore[method-assign]
+        credentials.with_non_blocking_refresh()
+        return credentials
+
+    def clear(self) -> None:
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+
+    def _restore(
+        self, credentials: google.auth.credentials.Credentials, entry: _Entry
+    ) -> None:
+        saved: dict[str, t.Any] | None = self._load().get(entry.id)
+        if not saved or _expired(saved["expires"]):
+            return
+        try:
+            token: dict[str, str] = json.loads(
+                entry.fernet.decrypt(saved["token"].encode())
+            )
+        except (InvalidToken, ValueError, KeyError):
+            return
+        credentials.token = token["token"]
+        credentials.expiry = datetime.fromisoformat(token["expiry"])
+
+    def _save(
+        self, credentials: google.auth.credentials.Credentials, entry: _Entry
+    ) -> None:
+        if not credentials.token or not credentials.expiry:
+            return
+        expires: str = credentials.expiry.isoformat()
+        token: bytes = json.dumps(
+            {"token": credentials.token, "expiry": expires}
+        ).encode()
+        with self._lock:
+            entries: dict[str, dict[str, t.Any]] = {
+                k: v for k, v in self._load().items() if not _expired(v["expires"])
+            }
+            entries[entry.id] = {
+                "expires": expires,
+                "token": entry.fernet.encrypt(token).decode(),
+            }
+            try:
+                # The temporary file is created with mode 0600 before it's renamed.
+                utils.atomic_write_text(self.path, json.dumps(entries))
+            except Exception as error:
+                appdir.log().error(f"Failed to save access token: {error}")
+
+    def _load(self) -> dict[str, dict[str, t.Any]]:
+        try:
+            if not self.path.exists():
+                return {}
+            entries: dict[str, dict[str, t.Any]] = json.loads(
+                self.path.read_text("utf-8")
+            )
+            return entries
+        except Exception as error:
+            appdir.log().error(f"Failed to load access tokens: {error}")
+            return {}
+
+
+def _entry_for(credentials: google.auth.credentials.Credentials) -> _Entry | None:
+    secret: bytes
+    if isinstance(credentials, service_account.Credentials):
+        # PKCS#1 v1.5 signatures are deterministic, so this is stable for a key.
+        secret = credentials.signer.sign(b"lightlike-cli access token cache")
+    elif (
+        isinstance(credentials, user_credentials.Credentials)
+        and credentials.refresh_token
+    ):
+        secret = f"{credentials.client_id}:{credentials.refresh_token}".encode()
+    else:
+        return None
+
+    derived: bytes = HKDF(
+        algorithm=hashes.SHA256(),
+        length=64,
+        salt=None,
+        info=b"lightlike-cli access token cache",
+    ).derive(secret)
+    scopes: str = " ".join(sorted(getattr(credentials, "scopes", None) or ()))
+    return _Entry(
+        id=sha256(derived[32:] + scopes.encode()).hexdigest(),
+        fernet=Fernet(urlsafe_b64encode(derived[:32])),
+    )
+
+
+def _expired(expires: str) -> bool:
+    # google-auth keeps expiry as a naive utc datetime.
+    return datetime.fromisoformat(expires) <= datetime.utcnow()
+
+
+TOKEN_CACHE: TokenCache = TokenCache(appdir.ACCESS_TOKENS)
@@ -1,9 +1,14 @@
+import json
+import os
+import stat
 import sys
 import typing as t
 from base64 import b64encode
 from hashlib import sha3_256, sha256
 from os import urandom
+from pathlib import Path
 from secrets import compare_digest
+from time import time
 
 import rtoml
 from cryptography.fernet import Fernet, InvalidToken
@@ -20,9 +25,15 @@ from rich import get_console
 from rich import print as rprint
 from rich.console import NewLine
 
-from lightlike.internal import constant
+from lightlike.__about__ import __appdir__, __appname_sc__
+from lightlike.internal import appdir, constant, utils
 
-__all__: t.Sequence[str] = ("_Auth", "AuthPromptSession")
+__all__: t.Sequence[str] = (
+    "_Auth",
+    "AuthPromptSession",
+    "SESSION_KEY_CACHE",
+    "SessionKeyCache",
+)
 
 
 class _Auth:
@@ -43,6 +54,72 @@ class _Auth:
         return b64encode(key_derivation)
 
 
+class SessionKeyCache:
+    """
+    Key derived from the password, kept for a number of seconds so launches
+    within a session skip the key derivation.
+
+    Saved to a file only the user can read, in $XDG_RUNTIME_DIR if it's set,
+    which is cleared on logout. Entries are tied to the salt and encrypted key
+    they were derived for, and expire after the ttl they were saved with.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path or _session_key_path()
+
+    def get(self, salt: bytes, encrypted_key: bytes) -> bytes | None:
+        try:
+            if not self.path.exists():
+                return None
+            status: os.stat_result = self.path.stat()
+            if status.st_mode & (stat.S_IRWXG | stat.S_IRWXO):
+                # Readable by others, don't trust or keep it.
+                self.clear()
+                return None
+            entry: dict[str, t.Any] = json.loads(self.path.read_text("utf-8"))
+            if entry["expires"] <= time():
+                self.clear()
+                return None
+            if entry["fingerprint"] != _fingerprint(salt, encrypted_key):
+                return None
+            return t.cast(str, entry["key"]).encode()
+        except Exception as error:
+            appdir.log().error(f"Failed to read session key: {error}")
+            return None
+
+    def set(self, key: bytes, salt: bytes, encrypted_key: bytes, ttl: int) -> None:
+        entry: dict[str, t.Any] = {
+            "expires": time() + ttl,
+            "fingerprint": _fingerprint(salt, encrypted_key),
+            "key": key.decode(),
+        }
+        try:
+            # The temporary file is created with mode 0600 before it's renamed.
+            utils.atomic_write_text(self.path, json.dumps(entry))
+        except Exception as error:
+            appdir.log().error(f"Failed to save session key: {error}")
+
+    def clear(self) -> None:
+        try:
+            self.path.unlink(missing_ok=True)
+        except Exception as error:
+            appdir.log().error(f"Failed to remove session key: {error}")
+
+
+def _session_key_path() -> Path:
+    runtime_dir: str | None = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and Path(runtime_dir).is_dir():
+        return Path(runtime_dir) / f"{__appname_sc__}.session_key"
+    return __appdir__ / ".session_key"
+
+
+def _fingerprint(salt: bytes, encrypted_key: bytes) -> str:
+    return sha256(bytes(salt) + bytes(encrypted_key)).hexdigest()
+
+
+SESSION_KEY_CACHE: SessionKeyCache = SessionKeyCache()
+
+
 AUTH_BINDINGS: KeyBindings = KeyBindings()
 AUTH_KEY_HIDDEN: list[bool] = [True]
 
@@ -62,6 +139,7 @@ class AuthPromptSession:
         input_password: "sha3_256 | None" = None,
         retry: bool = True,
         saved_credentials_failed: t.Callable[[], None] | None = None,
+        session_key_ttl: int | t.Callable[[], int | None] | None = None,
     ) -> str:
         auth = _Auth()
         _saved_password: str | None = (
@@ -70,6 +148,17 @@ class AuthPromptSession:
         _stay_logged_in: bool | None = (
             stay_logged_in() if callable(stay_logged_in) else stay_logged_in
         )
+        _session_key_ttl: int | None = (
+            session_key_ttl() if callable(session_key_ttl) else session_key_ttl
+        )
+
+        if _session_key_ttl and not input_password:
+            session_key: bytes | None = SESSION_KEY_CACHE.get(salt, encrypted_key)
+            if session_key is not None:
+                try:
+                    return auth.decrypt(session_key, bytes(encrypted_key)).decode()
+                except InvalidToken:
+                    SESSION_KEY_CACHE.clear()
 
         password: str | None = None
         if _saved_password is not None and _stay_logged_in is True:
@@ -80,9 +169,8 @@ class AuthPromptSession:
             password = self.prompt_password().hexdigest()
 
         try:
-            decrypted_key = auth.decrypt(
-                auth._generate_key(password, bytes(salt)), bytes(encrypted_key)
-            )
+            key: bytes = auth._generate_key(password, bytes(salt))
+            decrypted_key = auth.decrypt(key, bytes(encrypted_key))
         except Exception as error:
             if _saved_password:
                 if saved_credentials_failed is not None and callable(
@@ -108,11 +196,14 @@ class AuthPromptSession:
                     input_password,
                     retry,
                     saved_credentials_failed,
+                    session_key_ttl,
                 )
             else:
                 rprint("[b][red]Authentication failed.")
                 sys.exit(2)
 
+        if _session_key_ttl:
+            SESSION_KEY_CACHE.set(key, salt, encrypted_key, _session_key_ttl)
         return decrypted_key.decode()
 
     def prompt_password(
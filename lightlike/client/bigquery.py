@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import sys
 import typing as t
 from inspect import cleandoc
@@ -7,7 +9,6 @@ import google.auth
 import google.auth.credentials
 import rtoml
 from google.auth.exceptions import DefaultCredentialsError
-from google.cloud import bigquery
 from more_itertools import flatten, interleave_longest
 from rich import get_console
 from rich import print as rprint
@@ -22,6 +23,7 @@ from lightlike.app import _get, _questionary
 from lightlike.app.config import AppConfig
 from lightlike.client._credentials import _get_credentials_from_config
 from lightlike.internal import appdir, markup, utils
+from lightlike.internal.lazy import lazy_import
 
 __all__: t.Sequence[str] = (
     "authorize_bigquery_client",
@@ -33,6 +35,11 @@ __all__: t.Sequence[str] = (
 
 P = t.ParamSpec("P")
 
+if t.TYPE_CHECKING:
+    from google.cloud import bigquery
+else:
+    bigquery = lazy_import("google.cloud.bigquery")
+
 
 BIGQUERY_CLIENT: bigquery.Client | None = None
 
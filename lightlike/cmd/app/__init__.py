@@ -21,6 +21,7 @@ lazy_subcommands: dict[str, str] = {
 
 if getenv("LIGHTLIKE_CLI_DEV"):
     lazy_subcommands["reset"] = "lightlike.cmd.app.commands:_reset"
+    lazy_subcommands["bench"] = "lightlike.cmd.app.bench:bench"
 
 
 @click.group(
@@ -0,0 +1,436 @@
+import multiprocessing
+import random
+import shutil
+import tempfile
+import threading
+import typing as t
+from pathlib import Path
+from time import perf_counter, perf_counter_ns, sleep
+
+import click
+from fasteners import InterProcessReaderWriterLock
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from lightlike.app.core import FormattedCommand, LazyAliasedGroup
+from lightlike.cmd import _pass
+from lightlike.internal import appdir, markup
+
+__all__: t.Sequence[str] = ("bench", "cache_lock", "completers", "dates", "lexer")
+
+
+@click.group(
+    name="bench",
+    cls=LazyAliasedGroup,
+    lazy_subcommands={
+        "cache-lock": "lightlike.cmd.app.bench:cache_lock",
+        "completers": "lightlike.cmd.app.bench:completers",
+        "dates": "lightlike.cmd.app.bench:dates",
+        "lexer": "lightlike.cmd.app.bench:lexer",
+    },
+    hidden=True,
+    short_help="Developer benchmarks.",
+)
+def bench() -> None:
+    """Developer benchmarks. Only available when LIGHTLIKE_CLI_DEV is set."""
+
+
+def _percentile(values: t.Sequence[int], q: float) -> int:
+    if not values:
+        return 0
+    ordered: list[int] = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def _ms(ns: int) -> str:
+    return f"{ns / 1e6:.3f}"
+
+
+def _add_timing_row(table: Table, name: str, timings: t.Sequence[int]) -> None:
+    table.add_row(
+        name,
+        f"{len(timings)}",
+        _ms(_percentile(timings, 0.5)),
+        _ms(_percentile(timings, 0.99)),
+        _ms(max(timings, default=0)),
+        _ms(sum(timings)),
+    )
+
+
+def _cache_writer(
+    path: Path,
+    lock: Path,
+    seconds: float,
+    hold: float,
+    legacy: bool,
+    results: "multiprocessing.Queue[list[int]]",
+) -> None:
+    # Simulates the scheduler sync job, a read-modify-write transaction on the cache,
+    # holding the lock for `hold` seconds. Reports the lock wait time per transaction.
+    from lightlike.app.cache import TimeEntryCache
+
+    rw_lock = InterProcessReaderWriterLock(lock.with_suffix(".rw"))
+    cache = TimeEntryCache(path, lock)
+    waits: list[int] = []
+    deadline: float = perf_counter() + seconds
+
+    while perf_counter() < deadline:
+        if legacy:
+            start: int = perf_counter_ns()
+            with rw_lock.write_lock():
+                waits.append(perf_counter_ns() - start)
+                with cache.rw():
+                    cache.note = f"{perf_counter_ns()}"
+                    sleep(hold)
+        else:
+            before: int = cache._lock.wait_ns
+            with cache.rw():
+                waits.append(cache._lock.wait_ns - before)
+                cache.note = f"{perf_counter_ns()}"
+                sleep(hold)
+        sleep(hold)
+
+    results.put(waits)
+
+
+@click.command(
+    cls=FormattedCommand,
+    name="cache-lock",
+    hidden=True,
+    allow_name_alias=False,
+    short_help="Lock wait time for concurrent cache reads and writes.",
+)
+@click.option("-r", "--readers", type=click.INT, default=4, show_default=True)
+@click.option("-w", "--writers", type=click.INT, default=1, show_default=True)
+@click.option("-s", "--seconds", type=click.FLOAT, default=3.0, show_default=True)
+@click.option("-t", "--hold", type=click.FLOAT, default=0.005, show_default=True)
+@click.option("-l", "--legacy", is_flag=True, help="Readers take a shared lock.")
+@_pass.console
+def cache_lock(
+    console: Console,
+    readers: int,
+    writers: int,
+    seconds: float,
+    hold: float,
+    legacy: bool,
+) -> None:
+    """
+    Measure lock wait time under concurrent completion and sync.
+
+    Reader threads construct a TimeEntryCache in a loop, as the completers do on each keystroke.
+    Writer processes run read-modify-write transactions on the same file, as the sync job does.
+    Runs against a copy of the cache in a temporary directory.
+
+    --legacy / -l:
+        readers take an interprocess read lock and writers an exclusive write lock,
+        the locking model used before snapshot reads.
+    """
+    from lightlike.app.cache import TimeEntryCache
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path: Path = Path(tmp) / appdir.CACHE.name
+        lock: Path = Path(tmp) / appdir.CACHE_LOCK.name
+        shutil.copyfile(appdir.CACHE, path)
+        lock.touch()
+        TimeEntryCache(path, lock).validate()
+
+        results: "multiprocessing.Queue[list[int]]" = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(
+                target=_cache_writer,
+                args=(path, lock, seconds, hold, legacy, results),
+                daemon=True,
+            )
+            for _ in range(writers)
+        ]
+
+        read_timings: list[int] = []
+        read_timings_lock = threading.Lock()
+
+        def reader() -> None:
+            rw_lock = InterProcessReaderWriterLock(lock.with_suffix(".rw"))
+            timings: list[int] = []
+            deadline: float = perf_counter() + seconds
+            while perf_counter() < deadline:
+                start: int = perf_counter_ns()
+                if legacy:
+                    with rw_lock.read_lock():
+                        TimeEntryCache(path, lock)
+                else:
+                    TimeEntryCache(path, lock)
+                timings.append(perf_counter_ns() - start)
+            with read_timings_lock:
+                read_timings.extend(timings)
+
+        threads = [threading.Thread(target=reader) for _ in range(readers)]
+
+        with console.status(markup.status_message("Running benchmark")):
+            for process in processes:
+                process.start()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            write_timings: list[int] = []
+            for _ in processes:
+                write_timings.extend(results.get())
+            for process in processes:
+                process.join()
+
+    table = Table(
+        box=box.MARKDOWN,
+        border_style="bold",
+        title=f"{'legacy read/write locks' if legacy else 'snapshot reads'}",
+    )
+    for column in ("", "count", "p50 ms", "p99 ms", "max ms", "total ms"):
+        table.add_column(column, justify="right" if column else "left")
+
+    _add_timing_row(table, "read", read_timings)
+    _add_timing_row(table, "write lock wait", write_timings)
+    console.print(table)
+
+
+@click.command(
+    cls=FormattedCommand,
+    name="completers",
+    hidden=True,
+    allow_name_alias=False,
+    short_help="Completion latency per completer in this session.",
+)
+@_pass.console
+def completers(console: Console) -> None:
+    """
+    Show p50/p99 latency of the completers run by the global completer in this session.
+
+    Only runs that completed within the latency budget are sampled,
+    runs cancelled by the budget are counted under timeouts.
+    """
+    from lightlike.app.shell_complete.dynamic import PIPELINE
+
+    table = Table(
+        box=box.MARKDOWN,
+        border_style="bold",
+        title=f"budget {PIPELINE.budget * 1000:.0f} ms",
+    )
+    for column in ("", "count", "p50 ms", "p99 ms", "timeouts"):
+        table.add_column(column, justify="right" if column else "left")
+
+    for name, (count, p50, p99) in PIPELINE.percentiles().items():
+        table.add_row(
+            name, f"{count}", _ms(p50), _ms(p99), f"{PIPELINE.timeouts[name]}"
+        )
+    console.print(table)
+
+
+DATE_SAMPLES: t.Final[tuple[str, ...]] = (
+    "now",
+    "13:05",
+    "9am",
+    "9:30pm",
+    "1305",
+    "-1h",
+    "30m",
+    "7d",
+    "+2d",
+    "jan1",
+    "2024-01-15",
+    "2024-01-15 13:00",
+    "yesterday",
+    "monday",
+    "friday 3pm",
+    "2 hours ago",
+)
+
+
+@click.command(
+    cls=FormattedCommand,
+    name="dates",
+    hidden=True,
+    allow_name_alias=False,
+    short_help="Date parsing latency, fast path and cache against dateparser.",
+)
+@click.option("-n", "--iterations", type=click.INT, default=200, show_default=True)
+@_pass.console
+def dates(console: Console, iterations: int) -> None:
+    """
+    Measure parse time per input for the date options.
+
+    Compares dateparser on its own with parse_date, which tries the fast path,
+    then the cache of dateparser results. Each input is parsed `iterations` times.
+    Mismatches count the inputs where the results differ.
+    """
+    from lightlike.app import dates as _dates
+    from lightlike.app.config import AppConfig
+
+    tzinfo = AppConfig().tzinfo
+    relative_base = _dates.now(tzinfo)
+    _dates._parse_minute.cache_clear()
+
+    table = Table(box=box.MARKDOWN, border_style="bold")
+    for column in ("", "count", "p50 ms", "p99 ms", "max ms", "total ms"):
+        table.add_column(column, justify="right" if column else "left")
+
+    parsers: dict[str, t.Callable[[str], t.Any]] = {
+        "dateparser": lambda d: _dates._parse_with_dateparser(d, relative_base, tzinfo),
+        "parse_date": lambda d: _dates.parse_date(d, relative_base, tzinfo),
+    }
+    results: dict[str, dict[str, t.Any]] = {name: {} for name in parsers}
+
+    with console.status(markup.status_message("Running benchmark")):
+        for name, parse in parsers.items():
+            timings: list[int] = []
+            for _ in range(iterations):
+                for sample in DATE_SAMPLES:
+                    start: int = perf_counter_ns()
+                    results[name][sample] = parse(sample)
+                    timings.append(perf_counter_ns() - start)
+            _add_timing_row(table, name, timings)
+
+    mismatches: list[str] = [
+        sample
+        for sample in DATE_SAMPLES
+        if _dates.astimezone(results["dateparser"][sample], tzinfo)
+        != results["parse_date"][sample]
+    ]
+    console.print(table)
+    console.print(f"mismatches: {len(mismatches)} {', '.join(mismatches)}")
+
+
+SQL_SAMPLE: t.Final[str] = """\
+/* daily totals
+   by project */
+SELECT
+  project,
+  DATE(timestamp_start) AS date,
+  SUM(hours) AS hours -- paused time excluded
+FROM `project.dataset.timesheet`
+WHERE note != 'it''s a
+multiline note'
+GROUP BY 1, 2;
+"""
+
+
+@click.command(
+    cls=FormattedCommand,
+    name="lexer",
+    hidden=True,
+    allow_name_alias=False,
+    short_help="Query repl lexer latency by buffer size.",
+)
+@click.option(
+    "-l",
+    "--lines",
+    type=click.INT,
+    multiple=True,
+    default=[50, 200, 800, 3200],
+    show_default=True,
+)
+@click.option("-k", "--keystrokes", type=click.INT, default=100, show_default=True)
+@click.option("-w", "--window", type=click.INT, default=40, show_default=True)
+@click.option("-e", "--edits", type=click.INT, default=2000, show_default=True)
+@_pass.console
+def lexer(
+    console: Console,
+    lines: t.Sequence[int],
+    keystrokes: int,
+    window: int,
+    edits: int,
+) -> None:
+    """
+    Measure lexing time per keystroke while typing in the middle of a SQL buffer.
+
+    Each keystroke inserts a character at the cursor, lexes the document,
+    and fetches the `window` lines around the cursor, as rendering the prompt does.
+    Compares PygmentsLexer(sync_from_start=True) with the incremental lexer.
+
+    Then applies `edits` random inserts and deletes to a SQL buffer, and counts
+    the edits after which any line lexed by the incremental lexer differs from
+    PygmentsLexer(sync_from_start=True).
+    """
+    from prompt_toolkit.document import Document
+    from prompt_toolkit.lexers import Lexer, PygmentsLexer
+
+    from lightlike.cmd.query.lexer import BqSqlLexer, IncrementalLexer
+
+    sample_lines: list[str] = SQL_SAMPLE.splitlines()
+    table = Table(box=box.MARKDOWN, border_style="bold")
+    for column in ("", "lines", "count", "p50 ms", "p99 ms", "max ms", "total ms"):
+        table.add_column(column, justify="right" if column else "left")
+
+    with console.status(markup.status_message("Running benchmark")):
+        for size in lines:
+            buffer: list[str] = [
+                sample_lines[i % len(sample_lines)] for i in range(size)
+            ]
+            cursor_line: int = size // 2
+            lexers: dict[str, Lexer] = {
+                "sync from start": PygmentsLexer(BqSqlLexer, sync_from_start=True),
+                "incremental": IncrementalLexer(),
+            }
+
+            for name, _lexer in lexers.items():
+                text: list[str] = buffer.copy()
+                timings: list[int] = []
+                for keystroke in range(keystrokes):
+                    text[cursor_line] += "x" if keystroke % 8 else " "
+                    document = Document("\n".join(text))
+                    start: int = perf_counter_ns()
+                    get_line = _lexer.lex_document(document)
+                    for lineno in range(
+                        max(0, cursor_line - window // 2),
+                        min(size, cursor_line + window // 2),
+                    ):
+                        get_line(lineno)
+                    timings.append(perf_counter_ns() - start)
+
+                table.add_row(
+                    name,
+                    f"{size}",
+                    f"{len(timings)}",
+                    _ms(_percentile(timings, 0.5)),
+                    _ms(_percentile(timings, 0.99)),
+                    _ms(max(timings, default=0)),
+                    _ms(sum(timings)),
+                )
+
+        mismatches: int = _lexer_mismatches(edits)
+
+    console.print(table)
+    console.print(f"mismatches: {mismatches} of {edits} random edits")
+
+
+def _lexer_mismatches(edits: int, seed: int = 0) -> int:
+    from prompt_toolkit.document import Document
+    from prompt_toolkit.formatted_text import StyleAndTextTuples
+    from prompt_toolkit.lexers import PygmentsLexer
+
+    from lightlike.cmd.query.lexer import BqSqlLexer, IncrementalLexer
+
+    def fragments(line: StyleAndTextTuples) -> StyleAndTextTuples:
+        # PygmentsLexer keeps the empty fragments left by splitting tokens at newlines.
+        return [fragment for fragment in line if fragment[1]]
+
+    rng = random.Random(seed)
+    incremental = IncrementalLexer()
+    sync_from_start = PygmentsLexer(BqSqlLexer, sync_from_start=True)
+    text: str = SQL_SAMPLE * 3
+    mismatches: int = 0
+
+    for _ in range(edits):
+        pos: int = rng.randrange(len(text) + 1)
+        if rng.random() < 0.7:
+            text = text[:pos] + rng.choice("'\"\n*/-ax ()") + text[pos:]
+        else:
+            text = text[:pos] + text[pos + rng.randint(1, 8) :]
+
+        document = Document(text)
+        get_line = incremental.lex_document(document)
+        get_expected = sync_from_start.lex_document(document)
+        if any(
+            fragments(get_line(lineno)) != fragments(get_expected(lineno))
+            for lineno in range(document.line_count)
+        ):
+            mismatches += 1
+
+    return mismatches
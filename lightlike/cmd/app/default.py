@@ -7,7 +7,7 @@ import click
 from rich import print as rprint
 from rich.console import Console
 
-from lightlike.app import shell_complete
+from lightlike.app import cursor, shell_complete
 from lightlike.app._repl import exit_repl
 from lightlike.app.core import FormattedCommand
 from lightlike.cmd import _pass
@@ -53,6 +53,8 @@ def cd_(path: Path) -> None:
             os.chdir(path.resolve())
     except Exception as error:
         rprint(f"{error!r}; {path.resolve()}")
+    finally:
+        cursor.chdir()
 
 
 @click.command(
@@ -622,15 +622,13 @@ def list_(
         order=order,
     )
 
-    table: Table = render.map_sequence_to_rich_table(
-        mappings=list(map(lambda r: dict(r.items()), query_job))
+    row_count: int = render.stream_rows_to_rich_table(
+        query_job.result(page_size=render.STREAM_PAGE_SIZE)
     )
-    if not table.row_count:
+    if not row_count:
         rprint(markup.dimmed("No results"))
         raise click.exceptions.Exit()
 
-    console.print(table)
-
 
 @click.group(
     cls=AliasedGroup,
@@ -3,7 +3,7 @@ from __future__ import annotations
 import typing as t
 from contextlib import suppress
 from functools import cached_property
-from os import getenv
+from types import MappingProxyType
 
 from prompt_toolkit.completion import (
     Completer,
@@ -13,55 +13,76 @@ from prompt_toolkit.completion import (
 )
 from prompt_toolkit.document import Document
 
-from lightlike.app import _get
 from lightlike.client import get_client
+from lightlike.cmd.query.schema import SchemaCatalog
 from lightlike.cmd.query.words import KEYWORD_META, SQL_KEYWORDS
 from lightlike.internal.utils import alter_str
 
 if t.TYPE_CHECKING:
     from prompt_toolkit.completion import CompleteEvent
 
-__all__: t.Sequence[str] = ("query_repl_completer",)
+__all__: t.Sequence[str] = (
+    "LoopNestedCompleter",
+    "query_repl_completer",
+    "SQL_KEYWORD_COMPLETER",
+)
 
 
 def query_repl_completer() -> ThreadedCompleter:
     completers = [
         ResourceCompleter(),
-        LoopNestedCompleter.from_nested_dict(SQL_KEYWORDS, KEYWORD_META),
+        SQL_KEYWORD_COMPLETER,
     ]
     return ThreadedCompleter(merge_completers(completers, deduplicate=True))
 
 
-class LoopNestedCompleter(Completer):
-    original_keywords: dict[str, t.Any] = SQL_KEYWORDS
+# (children by next character, every word under this node in insertion order)
+_TrieNode: t.TypeAlias = tuple[t.Mapping[str, "_TrieNode"], tuple[str, ...]]
+
 
-    class _LastNestedWordCompleter(Completer):
+class _KeywordTrie:
+    """Immutable character trie over the uppercased keywords of one level of the grammar."""
 
-        def __init__(self, words: list[str], meta: dict[str, str] = {}) -> None:
-            self.words = words
-            self.meta = meta
+    __slots__ = ("_root",)
 
-        def get_completions(
-            self, document: Document, complete_event: "CompleteEvent"
-        ) -> t.Iterable[Completion]:
-            words = list(map(str.upper, self.words))
-            word_before_cursor = document.get_word_before_cursor(WORD=True).upper()
+    def __init__(self, words: t.Iterable[str]) -> None:
+        self._root: _TrieNode = self._compile([w.upper() for w in words], 0)
+
+    @classmethod
+    def _compile(cls, words: list[str], depth: int) -> _TrieNode:
+        branches: dict[str, list[str]] = {}
+        for word in words:
+            if len(word) > depth:
+                branches.setdefault(word[depth], []).append(word)
+        children = {
+            c: cls._compile(branch, depth + 1) for c, branch in branches.items()
+        }
+        return MappingProxyType(children), tuple(words)
+
+    def search(self, prefix: str) -> tuple[str, ...]:
+        node: _TrieNode = self._root
+        for char in prefix:
+            child: _TrieNode | None = node[0].get(char)
+            if child is None:
+                return ()
+            node = child
+        return node[1]
 
-            for word in words:
-                if word.startswith(word_before_cursor):
-                    yield Completion(
-                        text=f"{word}",
-                        start_position=-len(word_before_cursor),
-                        display_meta=f"{self.meta.get(word, '')}",
-                    )
+
+class LoopNestedCompleter(Completer):
+    original_keywords: dict[str, t.Any] = SQL_KEYWORDS
+    original_trie: t.ClassVar[_KeywordTrie] = _KeywordTrie(SQL_KEYWORDS)
 
     def __init__(
         self,
         keywords: dict[str, Completer | None],
         keyword_meta: dict[str, str] = {},
     ) -> None:
-        self.current_keywords = keywords
+        self.current_keywords: t.Mapping[str, Completer | None] = MappingProxyType(
+            keywords
+        )
         self.keyword_meta = keyword_meta
+        self.trie = _KeywordTrie(keywords)
 
     @classmethod
     def from_nested_dict(
@@ -104,51 +125,51 @@ class LoopNestedCompleter(Completer):
                 )
                 yield from completer.get_completions(new_document, complete_event)
             else:
-                yield from self._LastNestedWordCompleter(
-                    words=list(self.original_keywords.keys()), meta=self.keyword_meta
-                ).get_completions(document, complete_event)
+                yield from self._keyword_completions(self.original_trie, document)
         else:
-            yield from self._LastNestedWordCompleter(
-                words=list(self.current_keywords.keys()), meta=self.keyword_meta
-            ).get_completions(document, complete_event)
+            yield from self._keyword_completions(self.trie, document)
+
+    def _keyword_completions(
+        self, trie: _KeywordTrie, document: Document
+    ) -> t.Iterable[Completion]:
+        word_before_cursor = document.get_word_before_cursor(WORD=True).upper()
+        for word in trie.search(word_before_cursor):
+            yield Completion(
+                text=word,
+                start_position=-len(word_before_cursor),
+                display_meta=self.keyword_meta.get(word, ""),
+            )
+
+
+# Compiled once and shared by the query repl and the where clause prompt.
+SQL_KEYWORD_COMPLETER: t.Final[LoopNestedCompleter] = (
+    LoopNestedCompleter.from_nested_dict(SQL_KEYWORDS, KEYWORD_META)
+)
 
 
 class ResourceCompleter(Completer):
     def __init__(self) -> None:
         self.project: str = get_client().project
-        if getenv("LIGHTLIKE_CLI_DEV"):
-            self.schemas = ["lightlike_cli"]
-        else:
-            self.schemas = list(
-                map(_get.dataset_id, get_client().list_datasets(self.project))
-            )
+        self.catalog = SchemaCatalog(self.project)
+        self.catalog.load_in_background()
 
-    @cached_property
+    @property
     def schemas(self) -> list[str]:
-        return []
+        return list(self.catalog.datasets)
 
     @cached_property
     def typed_schemas(self) -> list[str]:
         return []
 
-    @cached_property
-    def tables(self) -> dict[str, list[str]]:
-        return {}
-
-    @cached_property
-    def routines(self) -> dict[str, list[str]]:
-        return {}
-
-    @cached_property
-    def fields(self) -> dict[str, list[str]]:
-        return {}
-
     def get_completions(
         self, document: Document, complete_event: "CompleteEvent"
     ) -> t.Iterable[Completion]:
         word_before_cursor = document.get_word_before_cursor()
         args = document.text.split(" ")
 
+        if self.catalog.expired:
+            self.catalog.load_in_background()
+
         if any(map(lambda d: d in document.text, self.typed_schemas)):
             yield from self._from_typed_schemas(document, word_before_cursor)
 
@@ -159,39 +180,27 @@ class ResourceCompleter(Completer):
         if document.char_before_cursor == ".":
             yield from self._save_and_yield_schema(args, word_before_cursor)
 
-    def _load_tables(self, schema: str) -> None:
-        _tables = get_client().list_tables(schema)
-        self.tables[schema] = list(map(_get.table_id, _tables))
-
-    def _load_fields(self, schema: str, table: str) -> None:
-        _schema = get_client().get_table(f"{self.project}.{schema}.{table}").schema
-        self.fields[table] = list(map(_get.name, _schema))
-
-    def _load_routines(self, schema: str) -> None:
-        _routines = get_client().list_routines(schema)
-        self.routines[schema] = list(map(_get.routine_id, _routines))
-
     def _from_typed_schemas(
         self, document: Document, word_before_cursor: str
     ) -> t.Iterable[Completion]:
         for schema in self.typed_schemas:
             if schema in document.text:
-                for table in self.tables[schema]:
+                for table in self.catalog.tables(schema):
                     if table.startswith(word_before_cursor):
                         yield from self._table_completion(
                             word_before_cursor, schema, table
                         )
-                    if table in self.fields:
+                    if self.catalog.columns(schema, table):
                         stripped_word_before_cur: str = alter_str(
                             word_before_cursor, strip_parenthesis=True
                         )
-                        for field in self.fields[table]:
+                        for field in self.catalog.columns(schema, table):
                             if field.startswith(stripped_word_before_cur):
                                 yield from self._field_completion(
                                     stripped_word_before_cur, schema, table, field
                                 )
 
-                for routine in self.routines[schema]:
+                for routine in self.catalog.routines(schema):
                     if routine.startswith(word_before_cursor):
                         yield from self._routine_completion(
                             word_before_cursor, schema, routine
@@ -208,26 +217,17 @@ class ResourceCompleter(Completer):
             if schema in self.schemas:
                 if schema not in self.typed_schemas:
                     self.typed_schemas.append(schema)
-                if schema not in self.tables:
-                    self._load_tables(schema)
-                if schema not in self.routines:
-                    self._load_routines(schema)
 
-                for table in self.tables[schema]:
+                for table in self.catalog.tables(schema):
                     if resource in table:
                         yield from self._table_completion(
                             word_before_cursor, schema, table
                         )
-                for routine in self.routines[schema]:
+                for routine in self.catalog.routines(schema):
                     if resource in routine:
                         yield from self._routine_completion(
                             word_before_cursor, schema, routine
                         )
-            for schema in self.typed_schemas:
-                if schema in self.tables:
-                    for table in self.tables[schema]:
-                        if table not in self.fields:
-                            self._load_fields(schema, table)
 
     def _schema_completion(
         self, word_before_cursor: str, schema: str
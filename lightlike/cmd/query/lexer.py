@@ -1,9 +1,15 @@
 import re
-from typing import Sequence
+from typing import Callable, Iterator, Sequence
 
+from prompt_toolkit.document import Document
+from prompt_toolkit.formatted_text.base import StyleAndTextTuples
+from prompt_toolkit.formatted_text.utils import split_lines
+from prompt_toolkit.lexers import Lexer
+from prompt_toolkit.styles.pygments import pygments_token_to_classname
 from pygments.lexer import RegexLexer, words
 from pygments.token import (
     Comment,
+    Error,
     Keyword,
     Name,
     Number,
@@ -11,9 +17,10 @@ from pygments.token import (
     Punctuation,
     String,
     Whitespace,
+    _TokenType,
 )
 
-__all__: Sequence[str] = ("BqSqlLexer",)
+__all__: Sequence[str] = ("BqSqlLexer", "IncrementalLexer")
 
 
 class BqSqlLexer(RegexLexer):
@@ -529,6 +536,195 @@ class BqSqlLexer(RegexLexer):
     def analyse_text(self, text: str) -> None:
         return
 
+    def get_tokens_with_state(
+        self, text: str, stack: Sequence[str] = ("root",)
+    ) -> Iterator[tuple[int, _TokenType, str, tuple[str, ...]]]:
+        """
+        Same as RegexLexer.get_tokens_unprocessed,
+        but also yields the state stack after each token.
+        Only supports the rules used by this lexer, token actions and state transitions.
+        """
+        pos: int = 0
+        tokendefs = self._tokens
+        statestack: list[str] = list(stack)
+        statetokens = tokendefs[statestack[-1]]
+        while 1:
+            for rexmatch, action, new_state in statetokens:
+                m = rexmatch(text, pos)
+                if m:
+                    pos_before: int = pos
+                    pos = m.end()
+                    if isinstance(new_state, tuple):
+                        for state in new_state:
+                            if state == "#pop":
+                                if len(statestack) > 1:
+                                    statestack.pop()
+                            elif state == "#push":
+                                statestack.append(statestack[-1])
+                            else:
+                                statestack.append(state)
+                    elif isinstance(new_state, int):
+                        # "#pop" is compiled to -1, always keep the root state.
+                        if abs(new_state) >= len(statestack):
+                            del statestack[1:]
+                        else:
+                            del statestack[new_state:]
+                    elif new_state == "#push":
+                        statestack.append(statestack[-1])
+                    statetokens = tokendefs[statestack[-1]]
+                    yield pos_before, action, m.group(), tuple(statestack)
+                    break
+            else:
+                try:
+                    if text[pos] == "\n":
+                        statestack = ["root"]
+                        statetokens = tokendefs["root"]
+                        yield pos, Whitespace, "\n", ("root",)
+                        pos += 1
+                        continue
+                    yield pos, Error, text[pos], tuple(statestack)
+                    pos += 1
+                except IndexError:
+                    break
+
     @staticmethod
     def lower() -> str:
         return "bqsqllexer"
+
+
+SPLITTABLE_TOKENS: tuple[_TokenType, ...] = (Whitespace, Comment.Multiline)
+# The string rules match across newlines. When one fails, the quote is lexed as an
+# Error, and whether it fails depends on all the text after it.
+UNTERMINATED_QUOTES: tuple[str, ...] = ("'", '"')
+
+
+class IncrementalLexer(Lexer):
+    """
+    prompt_toolkit lexer that only re-lexes the lines affected by an edit.
+
+    For every line, the lexer state at the start of the line is kept if the line
+    starts on a token boundary. These are the resync points. After an edit, lexing
+    restarts from the last resync point before the first changed line, and stops at
+    the first line after the edit whose start state matches the state cached for that
+    line before the edit. The fragments of the remaining lines are reused.
+
+    A quote without a closing quote depends on every line after it, since closing it
+    turns it into a string. Lines after one are never resync points, so any later
+    edit re-lexes from the line holding the quote.
+    """
+
+    def __init__(self, lexer: BqSqlLexer | None = None) -> None:
+        self.lexer: BqSqlLexer = lexer or BqSqlLexer(stripnl=False, ensurenl=False)
+        self._lines: list[str] = []
+        self._states: list[tuple[str, ...] | None] = []
+        self._fragments: list[StyleAndTextTuples] = []
+        self._styles: dict[_TokenType, str] = {}
+
+    def lex_document(self, document: Document) -> Callable[[int], StyleAndTextTuples]:
+        self._update(document.lines)
+        fragments = self._fragments
+
+        def get_line(lineno: int) -> StyleAndTextTuples:
+            try:
+                return fragments[lineno]
+            except IndexError:
+                return []
+
+        return get_line
+
+    def _style(self, token: _TokenType) -> str:
+        try:
+            return self._styles[token]
+        except KeyError:
+            style = self._styles[token] = "class:" + pygments_token_to_classname(token)
+            return style
+
+    def _update(self, lines: Sequence[str]) -> None:
+        old_lines: list[str] = self._lines
+        old_states: list[tuple[str, ...] | None] = self._states
+        old_fragments: list[StyleAndTextTuples] = self._fragments
+        new_lines: list[str] = list(lines)
+
+        prefix: int = 0
+        limit: int = min(len(old_lines), len(new_lines))
+        while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+            prefix += 1
+        if prefix == len(old_lines) == len(new_lines):
+            return
+
+        suffix: int = 0
+        while (
+            suffix < limit - prefix and old_lines[-1 - suffix] == new_lines[-1 - suffix]
+        ):
+            suffix += 1
+
+        # Tokens only depend on the lines after them through unterminated quotes,
+        # and the lines after one aren't resync points. So the resync points up to
+        # the first changed line are still valid.
+        start: int = min(prefix, len(old_states) - 1) if old_states else 0
+        while start > 0 and old_states[start] is None:
+            start -= 1
+        # The first line always starts in the root state.
+        start_state: tuple[str, ...] | None = old_states[start] if old_states else None
+        stack: tuple[str, ...] = start_state or ("root",)
+
+        delta: int = len(new_lines) - len(old_lines)
+        edit_end: int = len(new_lines) - suffix
+        states: list[tuple[str, ...] | None] = old_states[:start]
+        fragments: list[StyleAndTextTuples] = old_fragments[:start]
+
+        line_fragments: StyleAndTextTuples = []
+        line_state: tuple[str, ...] | None = stack
+        lineno: int = start
+        reuse_from: int | None = None
+        before: tuple[str, ...] = stack
+        unterminated: bool = False
+
+        text: str = "\n".join(new_lines[start:])
+        for _, token, value, after in self.lexer.get_tokens_with_state(text, stack):
+            style: str = self._style(token)
+            # Whitespace and comment bodies lexed as 2 tokens at a newline give the same
+            # fragments as 1 token, so a line start inside them is also a resync point.
+            splittable: bool = token in SPLITTABLE_TOKENS and after == before
+            parts: list[str] = value.split("\n")
+            if token is Error and value in UNTERMINATED_QUOTES:
+                unterminated = True
+
+            for idx, part in enumerate(parts):
+                if idx:
+                    states.append(line_state)
+                    fragments.append(line_fragments)
+                    line_fragments = []
+                    lineno += 1
+                    at_boundary: bool = splittable or (
+                        idx == len(parts) - 1 and not part
+                    )
+                    line_state = after if at_boundary and not unterminated else None
+                    old_lineno: int = lineno - delta
+                    if (
+                        at_boundary
+                        and lineno >= edit_end
+                        and 0 <= old_lineno < len(old_states)
+                        and old_states[old_lineno] == after
+                    ):
+                        reuse_from = old_lineno
+                        break
+                if part:
+                    line_fragments.append((style, part))
+
+            if reuse_from is not None:
+                break
+            before = after
+
+        if reuse_from is not None:
+            # The reused lines now follow an unterminated quote, they can't be resynced.
+            if unterminated:
+                states.extend([None] * (len(old_states) - reuse_from))
+            else:
+                states.extend(old_states[reuse_from:])
+            fragments.extend(old_fragments[reuse_from:])
+        else:
+            states.append(line_state)
+            fragments.append(line_fragments)
+
+        self._lines, self._states, self._fragments = new_lines, states, fragments
@@ -4,7 +4,6 @@ from os import getenv
 
 import click
 import rtoml
-from prompt_toolkit.lexers import PygmentsLexer
 from prompt_toolkit.shortcuts import CompleteStyle, PromptSession
 from prompt_toolkit.styles import Style
 from rich import box, get_console
@@ -17,11 +16,12 @@ from rich.table import Table
 from lightlike._console import CONSOLE_CONFIG
 from lightlike.app import cursor, render
 from lightlike.app.config import AppConfig
+from lightlike.app.refresh import RefreshScheduler
 from lightlike.client import CliQueryRoutines
 from lightlike.cmd import _pass
 from lightlike.cmd.query.completers import query_repl_completer
 from lightlike.cmd.query.key_bindings import QUERY_BINDINGS
-from lightlike.cmd.query.lexer import BqSqlLexer
+from lightlike.cmd.query.lexer import IncrementalLexer
 from lightlike.internal import appdir, constant, markup, utils
 from lightlike.internal.constant import _CONSOLE_SVG_FORMAT
 
@@ -103,7 +103,7 @@ def _build_query_session(
                 AppConfig().get("prompt", "style", default={}),
             )
         ),
-        refresh_interval=1,
+        refresh_interval=0,
         completer=completer,
         bottom_toolbar=cursor.bottom_toolbar,
         rprompt=cursor.rprompt,
@@ -113,12 +113,13 @@ def _build_query_session(
         complete_style=CompleteStyle.MULTI_COLUMN,
         history=appdir.SQL_FILE_HISTORY(),
         key_bindings=QUERY_BINDINGS,
-        lexer=PygmentsLexer(BqSqlLexer, sync_from_start=True),
+        lexer=IncrementalLexer(),
         include_default_pygments_style=False,
         reserve_space_for_menu=int(get_console().height * 0.4),
         multiline=True,
         **prompt_kwargs,
     )
+    RefreshScheduler(cursor.refresh_resolution).attach(session.app)
     return session
 
 
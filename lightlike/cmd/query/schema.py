@@ -0,0 +1,152 @@
+import json
+import threading
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from os import getenv
+from pathlib import Path
+from time import monotonic, time
+
+from lightlike.app import _get
+from lightlike.app.config import AppConfig
+from lightlike.client import get_client
+from lightlike.internal import appdir, utils
+
+if t.TYPE_CHECKING:
+    from google.cloud.bigquery import Client
+
+__all__: t.Sequence[str] = ("SchemaCatalog",)
+
+
+# Columns cover every table and view in the dataset, so a single query
+# returns everything the completer needs for a dataset.
+INFORMATION_SCHEMA_QUERY: t.Final[str] = """
+SELECT "COLUMN" AS kind, table_name AS parent, column_name AS name, ordinal_position AS position
+FROM `{project}.{dataset}.INFORMATION_SCHEMA.COLUMNS`
+UNION ALL
+SELECT "ROUTINE" AS kind, NULL AS parent, routine_name AS name, 0 AS position
+FROM `{project}.{dataset}.INFORMATION_SCHEMA.ROUTINES`
+ORDER BY kind, parent, position
+"""
+
+
+class SchemaCatalog:
+    """
+    Datasets, tables, columns and routines of a GCP project for the query repl completer.
+
+    Loaded from a local cache per GCP project, and refreshed in a background thread with
+    one INFORMATION_SCHEMA query per dataset once the cache is older than `ttl` seconds.
+    Lookups only read the last loaded snapshot, they never wait on the network.
+    """
+
+    def __init__(self, project: str, ttl: int | None = None) -> None:
+        self.project = project
+        self.ttl: int = (
+            ttl
+            if ttl is not None
+            else AppConfig().get("settings", "query", "schema-cache-ttl", default=3600)
+        )
+        self.path: Path = appdir.SCHEMA_CACHE / f"{project}.json"
+        self.updated: float = 0
+        # {dataset: {"tables": {table: [column, ...]}, "routines": [routine, ...]}}
+        self.datasets: dict[str, dict[str, t.Any]] = {}
+        self._loaded: bool = False
+        self._last_attempt: float | None = None
+        self._refreshing: threading.Lock = threading.Lock()
+
+    @property
+    def expired(self) -> bool:
+        return time() - self.updated > self.ttl
+
+    def tables(self, dataset: str) -> list[str]:
+        return list(self.datasets.get(dataset, {}).get("tables", {}))
+
+    def routines(self, dataset: str) -> list[str]:
+        return list(self.datasets.get(dataset, {}).get("routines", []))
+
+    def columns(self, dataset: str, table: str) -> list[str]:
+        return list(self.datasets.get(dataset, {}).get("tables", {}).get(table, []))
+
+    def load_in_background(self, retry_interval: float = 60) -> None:
+        if self._refreshing.locked():
+            return
+        if (
+            self._last_attempt is not None
+            and monotonic() - self._last_attempt < retry_interval
+        ):
+            return
+        self._last_attempt = monotonic()
+        threading.Thread(target=self._load_or_refresh, daemon=True).start()
+
+    def _load_or_refresh(self) -> None:
+        if not self._loaded:
+            self.load()
+            self._loaded = True
+        if self.expired:
+            self.refresh()
+
+    def load(self) -> None:
+        try:
+            if not self.path.exists():
+                return
+            cache: dict[str, t.Any] = json.loads(self.path.read_text("utf-8"))
+            self.datasets = cache["datasets"]
+            self.updated = cache["updated"]
+        except Exception as error:
+            appdir.log().error(f"Failed to load schema cache {self.path}: {error}")
+
+    def refresh(self) -> None:
+        if not self._refreshing.acquire(blocking=False):
+            return
+        try:
+            client: "Client" = get_client()
+            if getenv("LIGHTLIKE_CLI_DEV"):
+                dataset_ids = ["lightlike_cli"]
+            else:
+                dataset_ids = list(
+                    map(_get.dataset_id, client.list_datasets(self.project))
+                )
+
+            # Keep datasets visible while their schema is being queried.
+            self.datasets = {
+                dataset: self.datasets.get(dataset, {"tables": {}, "routines": []})
+                for dataset in dataset_ids
+            }
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                schemas = dict(
+                    zip(
+                        dataset_ids,
+                        executor.map(
+                            lambda d: self._query_dataset(client, d), dataset_ids
+                        ),
+                    )
+                )
+
+            self.datasets = {d: s for d, s in schemas.items() if s is not None}
+            self.updated = time()
+            self.path.parent.mkdir(exist_ok=True)
+            utils.atomic_write_text(
+                self.path,
+                json.dumps({"updated": self.updated, "datasets": self.datasets}),
+            )
+        except Exception as error:
+            appdir.log().error(f"Failed to refresh schema cache: {error}")
+        finally:
+            self._refreshing.release()
+
+    def _query_dataset(self, client: "Client", dataset: str) -> dict[str, t.Any] | None:
+        try:
+            query = INFORMATION_SCHEMA_QUERY.format(
+                project=self.project, dataset=dataset
+            )
+            tables: dict[str, list[str]] = {}
+            routines: list[str] = []
+            for row in client.query(query).result():
+                if row.kind == "COLUMN":
+                    tables.setdefault(row.parent, []).append(row.name)
+                else:
+                    routines.append(row.name)
+            return {"tables": tables, "routines": routines}
+        except Exception as error:
+            appdir.log().error(f"Failed to query schema of {dataset}: {error}")
+            return self.datasets.get(dataset)
@@ -40,7 +40,7 @@ from lightlike.internal import appdir, markup, utils
 
 if t.TYPE_CHECKING:
     from google.cloud.bigquery import QueryJob
-    from google.cloud.bigquery.table import Row
+    from google.cloud.bigquery.table import Row, RowIterator
 
     from lightlike.app.cache import TimeEntryAppData, TimeEntryIdList
     from lightlike.client import CliQueryRoutines
@@ -1503,29 +1503,36 @@ def list_(
             offset=offset,
         )
 
-    rows: list[dict[str, t.Any]] = list(map(lambda r: dict(r.items()), query_job))
+    rows: "RowIterator" = query_job.result(page_size=render.STREAM_PAGE_SIZE)
 
-    if console.width < 80:
-        console.print_json(data=rows, default=str)
-    else:
-        table: Table = render.map_sequence_to_rich_table(
-            mappings=rows,
-            exclude_fields=(
-                ["paused_hours", "note", "paused", "active"]
-                if console.width < 100
-                else None
-            ),
-        )
-        if not table.row_count:
-            rprint(markup.dimmed("No results"))
-            raise click.exceptions.Exit()
+    # Rows are printed and cached as each page arrives. The cache is only replaced
+    # once every row is written, and is left as it was if there are no results.
+    with utils.atomic_open(appdir.TIMER_LIST_CACHE) as timer_list_cache:
+        timer_list_cache.write("{")
 
-        console.print(table)
+        def cache_row(idx: int, row: dict[str, t.Any]) -> None:
+            separator: str = ", " if idx else ""
+            timer_list_cache.write(
+                f"{separator}{dumps(f'{idx}')}: {dumps(row.get('id'))}"
+            )
 
-    appdir.TIMER_LIST_CACHE.write_text(
-        dumps({idx: row.get("id") for idx, row in enumerate(rows)}),
-        encoding="utf-8",
-    )
+        if console.width < 80:
+            render.stream_rows_to_json(rows, on_row=cache_row)
+        else:
+            row_count: int = render.stream_rows_to_rich_table(
+                rows,
+                exclude_fields=(
+                    ["paused_hours", "note", "paused", "active"]
+                    if console.width < 100
+                    else None
+                ),
+                on_row=cache_row,
+            )
+            if not row_count:
+                rprint(markup.dimmed("No results"))
+                raise click.exceptions.Exit()
+
+        timer_list_cache.write("}")
 
 
 @click.group(
@@ -2,13 +2,12 @@ import logging
 import sys
 import typing as t
 from datetime import datetime
-from functools import partial
+from functools import cache
 from inspect import cleandoc
 from pathlib import Path
 
 import rtoml
 from packaging.version import Version
-from prompt_toolkit.history import FileHistory, ThreadedHistory
 from rich import get_console
 from rich import print as rprint
 from rich.console import Console
@@ -26,12 +25,18 @@ from lightlike.__about__ import (
 )
 from lightlike.internal import constant, enums, markup, utils
 
+if t.TYPE_CHECKING:
+    from prompt_toolkit.history import FileHistory, ThreadedHistory
+
 __all__: t.Sequence[str] = (
+    "ACCESS_TOKENS",
     "BQ_UPDATES",
     "CACHE_LOCK",
     "CACHE",
+    "COMMAND_MANIFEST",
     "console_log_error",
     "ENTRY_APPDATA",
+    "EXECUTABLE_INDEX",
     "log",
     "LOGS",
     "QUERIES",
@@ -39,6 +44,7 @@ __all__: t.Sequence[str] = (
     "REPL_HISTORY",
     "rmtree",
     "SCHEDULER_CONFIG",
+    "SCHEMA_CACHE",
     "SQL_FILE_HISTORY",
     "SQL_HISTORY",
     "TIMER_LIST_CACHE",
@@ -55,24 +61,41 @@ ENTRY_APPDATA: t.Final[Path] = __appdir__ / ".entry_appdata"
 ENTRY_APPDATA.touch(exist_ok=True)
 SQL_HISTORY: t.Final[Path] = __appdir__ / ".sql_history"
 SQL_HISTORY.touch(exist_ok=True)
-SQL_FILE_HISTORY: t.Final[partial[ThreadedHistory]] = partial(
-    ThreadedHistory,
-    history=FileHistory(f"{SQL_HISTORY}"),
-)
 REPL_HISTORY: t.Final[Path] = __appdir__ / ".repl_history"
 REPL_HISTORY.touch(exist_ok=True)
-REPL_FILE_HISTORY: t.Final[partial[ThreadedHistory]] = partial(
-    ThreadedHistory,
-    history=FileHistory(f"{REPL_HISTORY}"),
-)
 QUERIES: t.Final[Path] = __appdir__ / "queries"
 TIMER_LIST_CACHE: t.Final[Path] = __appdir__ / ".tl_ids_latest.json"
+EXECUTABLE_INDEX: t.Final[Path] = __appdir__ / ".executables.json"
+COMMAND_MANIFEST: t.Final[Path] = __appdir__ / ".commands.json"
+ACCESS_TOKENS: t.Final[Path] = __appdir__ / ".access_tokens.json"
+SCHEMA_CACHE: t.Final[Path] = __appdir__ / "schemas"
 LOGS: t.Final[Path] = __appdir__ / "logs"
 LOGS.mkdir(exist_ok=True)
 SCHEDULER_CONFIG: t.Final[Path] = __configdir__ / "scheduler.toml"
 BQ_UPDATES: t.Final[Path] = __config__ / ".bq_updates"
 
 
+# prompt_toolkit is only imported when a prompt needs the history,
+# one-shot commands never do.
+@cache
+def _file_history(path: Path) -> "FileHistory":
+    from prompt_toolkit.history import FileHistory
+
+    return FileHistory(f"{path}")
+
+
+def SQL_FILE_HISTORY() -> "ThreadedHistory":
+    from prompt_toolkit.history import ThreadedHistory
+
+    return ThreadedHistory(_file_history(SQL_HISTORY))
+
+
+def REPL_FILE_HISTORY() -> "ThreadedHistory":
+    from prompt_toolkit.history import ThreadedHistory
+
+    return ThreadedHistory(_file_history(REPL_HISTORY))
+
+
 _TODAY: datetime = datetime.today()
 _DAILY_LOG_DIR: Path = LOGS / _TODAY.strftime("%Y.%m.%d")
 _DAILY_LOG_DIR.mkdir(exist_ok=True)
@@ -108,6 +131,9 @@ CONFIG_UPDATE_PATHS: list[str] = [
     "bigquery",
     "client.credentials-source",
     "completers.default",
+    "completers.history.max-results",
+    "completers.latency-budget-ms",
+    "completers.path.max-entries",
     "keys.completers.commands",
     "keys.completers.exec",
     "keys.completers.history",
@@ -117,6 +143,7 @@ CONFIG_UPDATE_PATHS: list[str] = [
     "keys.system-command",
     "scheduler",
     "settings.complete-style",
+    "settings.daemon.enabled",
     "settings.dateparser.additional-date-formats",
     "settings.dateparser.prefer-dates-from",
     "settings.dateparser.prefer-day-of-month",
@@ -124,7 +151,12 @@ CONFIG_UPDATE_PATHS: list[str] = [
     "settings.dateparser.prefer-month-of-year",
     "settings.editor",
     "settings.note-history.days",
+    "settings.one-shot-release-check",
+    "settings.query.schema-cache-ttl",
     "settings.quiet-start",
+    "settings.refresh.idle-after",
+    "settings.refresh.idle-interval",
+    "settings.refresh.interval",
     "settings.reserve-space-for-menu",
     "settings.rprompt-date-format",
     "settings.timer-add-min",
@@ -132,6 +164,7 @@ CONFIG_UPDATE_PATHS: list[str] = [
     "settings.week-start",
     "user.host",
     "user.name",
+    "user.session-key-ttl",
     "user.stay-logged-in",
 ]
 CONFIG_FORCE_UPDATE_PATHS: list[str] = [
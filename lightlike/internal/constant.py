@@ -26,6 +26,7 @@ term = "{os.getenv("TERM", "unknown")}"
 name = "{getpass.getuser()}"
 host = "{socket.gethostname()}"
 stay-logged-in = false
+session-key-ttl = 0
 password = ""
 salt = []
 
@@ -33,6 +34,7 @@ salt = []
 complete-style = "COLUMN"
 editor = "{os.environ.get("EDITOR")}"
 note-required = "not-implemented"
+one-shot-release-check = false
 quiet-start = false
 reserve-space-for-menu = 12
 timer-add-min = -6
@@ -41,6 +43,9 @@ week-start = 1
 update-terminal-title = true
 rprompt-date-format = "[%H:%M:%S]"
 
+[settings.daemon]
+enabled = false
+
 [settings.dateparser]
 additional-date-formats = ["%I%p", "%I:%M%p", "%I%M%p", "%H%M", "%H%M%S", "%H:%M", "%H:%M:%S"]
 cache-size-limit = 0
@@ -57,12 +62,18 @@ strict-parsing = false
 [settings.note-history]
 days = 90
 
+[settings.refresh]
+idle-after = 300
+idle-interval = 60
+interval = 1
+
 [settings.query]
 hide-table-render = false
 mouse-support = false
 save-query-info = false
 save-svg = false
 save-txt = false
+schema-cache-ttl = 3600
 
 [bigquery]
 dataset = "{__appname_sc__}"
@@ -106,10 +117,17 @@ cursor = "fg:#f0f0ff"
 
 [completers]
 default = ["CMD"]
+latency-budget-ms = 1000
 
 [completers.exec]
 ignore-patterns = []
 
+[completers.history]
+max-results = 100
+
+[completers.path]
+max-entries = 2000
+
 [keys]
 exit = [[":", "q"], ["c-q"]]
 system-command = [[":", "s", "h"], [":", "!"]]
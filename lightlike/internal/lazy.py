@@ -0,0 +1,48 @@
+import importlib
+import sys
+import threading
+import typing as t
+from types import ModuleType
+
+__all__: t.Sequence[str] = ("lazy_import", "LazyModule")
+
+
+class LazyModule(ModuleType):
+    """
+    Placeholder for a module that is imported on first attribute access.
+
+    Once loaded, the module's namespace is copied onto the placeholder,
+    so later lookups are plain attribute reads.
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__["_lazy_lock"] = threading.Lock()
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> ModuleType:
+        with self._lazy_lock:
+            if self._lazy_module is None:
+                module: ModuleType = importlib.import_module(self.__name__)
+                self.__dict__.update(
+                    (k, v) for k, v in vars(module).items() if not k.startswith("__")
+                )
+                self.__dict__["_lazy_module"] = module
+        return t.cast(ModuleType, self._lazy_module)
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self._load(), name)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state: str = "loaded" if self._lazy_module is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Module `name`, imported the first time one of its attributes is used."""
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
@@ -0,0 +1,163 @@
+import atexit
+import sys
+import threading
+import typing as t
+from contextlib import contextmanager
+from importlib.abc import Loader, MetaPathFinder
+from time import perf_counter_ns
+
+if t.TYPE_CHECKING:
+    from importlib.machinery import ModuleSpec
+    from types import ModuleType
+
+__all__: t.Sequence[str] = (
+    "enable",
+    "enabled",
+    "FLAG",
+    "mark",
+    "phase",
+    "report",
+    "TARGET_MS",
+)
+
+
+FLAG: t.Final[str] = "--profile-startup"
+# Time to first prompt the startup sequence is expected to stay under.
+TARGET_MS: t.Final[int] = 500
+TOP_IMPORTS: t.Final[int] = 20
+
+_START: int = perf_counter_ns()
+_ENABLED: bool = False
+_REPORTED: bool = False
+_LOCK: threading.Lock = threading.Lock()
+# (name, thread, start ns, duration ns)
+_PHASES: list[tuple[str, str, int, int]] = []
+# {module: (inclusive ns, self ns, depth)}
+_IMPORTS: dict[str, tuple[int, int, int]] = {}
+_import_stack: threading.local = threading.local()
+
+
+class _TimedLoader(Loader):
+    def __init__(self, loader: Loader) -> None:
+        self.loader = loader
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self.loader, name)
+
+    def create_module(self, spec: "ModuleSpec") -> "ModuleType | None":
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: "ModuleType") -> None:
+        stack: list[int] = _import_stack.__dict__.setdefault("children", [])
+        depth: int = len(stack)
+        stack.append(0)
+        start: int = perf_counter_ns()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            elapsed: int = perf_counter_ns() - start
+            children: int = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            _IMPORTS[module.__name__] = (elapsed, elapsed - children, depth)
+
+
+class _ImportTimer(MetaPathFinder):
+    def find_spec(
+        self,
+        fullname: str,
+        path: t.Sequence[str] | None,
+        target: "ModuleType | None" = None,
+    ) -> "ModuleSpec | None":
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader)
+                return spec
+        return None
+
+
+def enabled() -> bool:
+    return _ENABLED
+
+
+def enable() -> None:
+    """Record imports and phases. The report prints at the first prompt, or at exit."""
+    global _ENABLED
+    if _ENABLED:
+        return
+    _ENABLED = True
+    sys.meta_path.insert(0, _ImportTimer())
+    atexit.register(report)
+
+
+@contextmanager
+def phase(name: str) -> t.Iterator[None]:
+    if not _ENABLED:
+        yield
+        return
+    start: int = perf_counter_ns()
+    try:
+        yield
+    finally:
+        with _LOCK:
+            _PHASES.append(
+                (
+                    name,
+                    threading.current_thread().name,
+                    start - _START,
+                    perf_counter_ns() - start,
+                )
+            )
+
+
+def mark(name: str) -> None:
+    """Record a phase that began when profiling started, e.g. module imports."""
+    if _ENABLED:
+        with _LOCK:
+            _PHASES.append(
+                (name, threading.current_thread().name, 0, perf_counter_ns() - _START)
+            )
+
+
+def report(label: str = "total") -> None:
+    global _REPORTED
+    if not _ENABLED or _REPORTED:
+        return
+    _REPORTED = True
+
+    from rich import box, get_console
+    from rich.table import Table
+
+    total_ms: float = (perf_counter_ns() - _START) / 1e6
+
+    phases = Table(box=box.SIMPLE_HEAD, title="startup phases", title_justify="left")
+    phases.add_column("phase")
+    phases.add_column("thread")
+    phases.add_column("start ms", justify="right")
+    phases.add_column("ms", justify="right")
+    with _LOCK:
+        for name, thread, start, duration in sorted(_PHASES, key=lambda p: p[2]):
+            phases.add_row(name, thread, f"{start / 1e6:.1f}", f"{duration / 1e6:.1f}")
+
+    imports = Table(
+        box=box.SIMPLE_HEAD,
+        title=f"slowest imports (of {len(_IMPORTS)})",
+        title_justify="left",
+    )
+    imports.add_column("module")
+    imports.add_column("cumulative ms", justify="right")
+    imports.add_column("self ms", justify="right")
+    slowest = sorted(_IMPORTS.items(), key=lambda i: i[1][0], reverse=True)
+    for module, (cumulative, self_, depth) in slowest[:TOP_IMPORTS]:
+        imports.add_row(
+            f"{'  ' * depth}{module}", f"{cumulative / 1e6:.1f}", f"{self_ / 1e6:.1f}"
+        )
+
+    style: str = "green" if total_ms <= TARGET_MS else "red"
+    console = get_console()
+    console.print(phases, imports)
+    console.print(f"[{style}]{label}: {total_ms:.1f} ms[/] (target {TARGET_MS} ms)")
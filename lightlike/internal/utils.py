@@ -1,8 +1,9 @@
 import logging
 import os
 import re
+import tempfile
 import typing as t
-from contextlib import ContextDecorator, suppress
+from contextlib import ContextDecorator, contextmanager, suppress
 from functools import partial, reduce, wraps
 from operator import getitem, truth
 from pathlib import Path
@@ -21,6 +22,8 @@ from rich.console import NewLine
 from lightlike.internal import markup
 
 __all__: t.Sequence[str] = (
+    "atomic_open",
+    "atomic_write_text",
     "exit_cmd_on_interrupt",
     "handle_keyboard_interrupt",
     "nl",
@@ -417,3 +420,26 @@ def print_message_and_clear_buffer(message: str) -> None:
 
 def file_empty_or_not_exists(path: Path) -> bool:
     return not path.exists() ^ (path.exists() and path.read_text().splitlines() == [""])
+
+
+@contextmanager
+def atomic_open(path: Path, encoding: str = "utf-8") -> t.Iterator[t.TextIO]:
+    # Write to a temporary file in the same directory, then rename over the target.
+    # Readers see either the previous or the new file, never a partial write.
+    # If the block raises, the target is left as it was.
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+
+
+def atomic_write_text(path: Path, text: str, encoding: str = "utf-8") -> None:
+    with atomic_open(path, encoding) as file:
+        file.write(text)
@@ -4,10 +4,12 @@ from pathlib import Path
 from types import ModuleType
 
 import rtoml
-from apscheduler.schedulers.background import BackgroundScheduler
 
 from lightlike.internal import appdir, utils
 
+if t.TYPE_CHECKING:
+    from apscheduler.schedulers.background import BackgroundScheduler
+
 # from importlib._bootstrap import _DeadlockError
 
 
@@ -30,7 +32,7 @@ def create_or_replace_default_jobs(
     elif jobs:
         job_config = jobs
 
-    scheduler: BackgroundScheduler = get_scheduler()
+    scheduler: "BackgroundScheduler" = get_scheduler()
 
     for job_object_name, import_path in job_config.items():
         try:
@@ -2,9 +2,12 @@ import logging
 import typing as t
 
 import rtoml
-from apscheduler.schedulers.background import BackgroundScheduler
 
 from lightlike.internal import appdir
+from lightlike.internal.lazy import lazy_import
+
+if t.TYPE_CHECKING:
+    from apscheduler.schedulers.background import BackgroundScheduler
 
 __all__: t.Sequence[str] = ("SCHEDULER", "get_scheduler")
 
@@ -12,26 +15,28 @@ __all__: t.Sequence[str] = ("SCHEDULER", "get_scheduler")
 logging.getLogger("apscheduler").setLevel(logging.DEBUG)
 
 
-SCHEDULER: BackgroundScheduler | None = None
+background = lazy_import("apscheduler.schedulers.background")
+
+SCHEDULER: "BackgroundScheduler | None" = None
 
 
 P = t.ParamSpec("P")
 
 
-def get_scheduler(*args: P.args, **kwargs: P.kwargs) -> BackgroundScheduler:
+def get_scheduler(*args: P.args, **kwargs: P.kwargs) -> "BackgroundScheduler":
     global SCHEDULER
     if SCHEDULER is None:
         SCHEDULER = _build_scheduler()
     return SCHEDULER
 
 
-def _build_scheduler() -> BackgroundScheduler:
+def _build_scheduler() -> "BackgroundScheduler":
     scheduler_config: dict[str, t.Any] = {}
 
     if appdir.SCHEDULER_CONFIG.exists():
         config = rtoml.load(appdir.SCHEDULER_CONFIG)
         scheduler_config = config.get("scheduler", {})
 
-    SCHEDULER = BackgroundScheduler(scheduler_config)
+    SCHEDULER = background.BackgroundScheduler(scheduler_config)
 
     return SCHEDULER